@@ -4,6 +4,7 @@ import pathlib
 import re
 import uuid
 import warnings
+import weakref
 import ipyvue
 from astropy import units as u
 from astropy.nddata import NDData, NDDataArray
@@ -41,6 +42,7 @@ from specutils.utils.wcs_utils import SpectralGWCS
 
 from jdaviz import __version__
 from jdaviz import style_registry
+from jdaviz.cli import ALL_JDAVIZ_CONFIGS
 from jdaviz.core.config import read_configuration, get_configuration
 from jdaviz.core.events import (LoadDataMessage, NewViewerMessage, AddDataMessage,
                                 SnackbarMessage, RemoveDataMessage, SubsetRenameMessage,
@@ -48,6 +50,8 @@ from jdaviz.core.events import (LoadDataMessage, NewViewerMessage, AddDataMessag
                                 ViewerAddedMessage, ViewerRemovedMessage,
                                 ViewerRenamedMessage, ChangeRefDataMessage,
                                 IconsUpdatedMessage, LayersFinalizedMessage)
+from jdaviz.core.live_results import LiveResultsScheduler
+from jdaviz.core.profiling import Profiler
 from jdaviz.core.registries import (tool_registry, tray_registry,
                                     viewer_registry, viewer_creator_registry,
                                     data_parser_registry, loader_resolver_registry)
@@ -62,7 +66,7 @@ from jdaviz.core.unit_conversion_utils import (check_if_unit_is_per_solid_angle,
                                                flux_conversion_general,
                                                spectral_axis_conversion,
                                                supported_sq_angle_units,
-                                               viewer_flux_conversion_equivalencies)
+                                               _viewer_flux_conversion_equivalencies)
 
 __all__ = ['Application', 'ALL_JDAVIZ_CONFIGS', 'UnitConverterWithSpectral']
 
@@ -79,11 +83,19 @@ CONTAINER_TYPES = dict(row='gl-row', col='gl-col', stack='gl-stack')
 EXT_TYPES = dict(flux=['flux', 'sci'],
                  uncert=['ivar', 'err', 'var', 'uncert'],
                  mask=['mask', 'dq'])
-ALL_JDAVIZ_CONFIGS = ['cubeviz', 'specviz', 'specviz2d', 'mosviz', 'imviz']
 
 
 @unit_converter('custom-jdaviz')
 class UnitConverterWithSpectral:
+    # glue creates a new converter for every conversion, so the spectral axis and
+    # pixel scale factor of each dataset (which would otherwise require translating
+    # the whole dataset to a Spectrum) and the conversion factors derived from them
+    # are cached on the class, per glue data object.
+    _flux_plans = weakref.WeakKeyDictionary()
+    # conversion factors with more elements than this (e.g. converting a full cube)
+    # are recomputed rather than cached
+    _max_cached_factor_size = 100000
+
     def equivalent_units(self, data, cid, units):
         if (data.meta.get('_importer') == 'ImageImporter' and
                 u.Unit(data.get_component(cid).units).physical_type == 'surface brightness'):
@@ -128,18 +140,61 @@ class UnitConverterWithSpectral:
             # handle surface brightness units in image-like data
             return (values * u.Unit(original_units)).to_value(target_units)
         elif cid.label in ("flux"):
-            try:
-                spec = data.get_object(cls=Spectrum)
-            except RuntimeError:
-                data = data.get_object(cls=NDDataArray)
-                spec = Spectrum(flux=data.data * u.Unit(original_units))
-            # equivalencies for flux/surface brightness conversions
-            viewer_equivs = viewer_flux_conversion_equivalencies(values, spec)
+            return self._flux_to_unit(data, values, original_units, target_units)
+        else:  # spectral axis
+            return spectral_axis_conversion(values, original_units, target_units)
+
+    def _flux_plan(self, data, original_units):
+        # the cached entry is only valid as long as the coordinates, shape and
+        # pixel scale factor of the data are unchanged
+        pix_fac = data.meta.get('_pixel_scale_factor')
+        plan = self._flux_plans.get(data)
+        if (plan is not None and plan['coords'] is data.coords
+                and plan['shape'] == data.shape and plan['pix_fac'] is pix_fac):
+            return plan
+
+        try:
+            spec = data.get_object(cls=Spectrum)
+        except RuntimeError:
+            nddata = data.get_object(cls=NDDataArray)
+            spec = Spectrum(flux=nddata.data * u.Unit(original_units))
+        plan = {'coords': data.coords, 'shape': data.shape, 'pix_fac': pix_fac,
+                'spectral_axis': spec.spectral_axis,
+                'spec_pix_fac': spec.meta.get('_pixel_scale_factor'),
+                'factors': {}}
+        self._flux_plans[data] = plan
+        return plan
+
+    def _flux_to_unit(self, data, values, original_units, target_units):
+        if not target_units or original_units == target_units:
+            # nothing to convert, see flux_conversion_general
+            return values
+
+        plan = self._flux_plan(data, original_units)
+        key = (str(original_units), str(target_units), np.shape(values))
+        factor = plan['factors'].get(key)
+        if factor is not None:
+            return values * factor
+
+        # equivalencies for flux/surface brightness conversions
+        viewer_equivs = _viewer_flux_conversion_equivalencies(values, plan['spectral_axis'],
+                                                              plan['spec_pix_fac'])
+        if any(isinstance(u.Unit(unit), u.FunctionUnitBase)
+               for unit in (original_units, target_units)):
+            # logarithmic units (e.g. magnitudes) are not a simple scaling
             return flux_conversion_general(values, original_units,
                                            target_units, viewer_equivs,
                                            with_unit=False)
-        else:  # spectral axis
-            return spectral_axis_conversion(values, original_units, target_units)
+
+        # all other supported flux and surface brightness conversions are a
+        # scaling (per spectral axis value and pixel scale factor), so the factor
+        # can be reused for any values of the same shape
+        factor = flux_conversion_general(np.ones(np.shape(values)), original_units,
+                                         target_units, viewer_equivs,
+                                         with_unit=False)
+        if np.size(factor) <= self._max_cached_factor_size:
+            plan['factors'][key] = factor
+        return values * factor
 
 
 # Set default opacity for data layers to 1 instead of 0.8 in
@@ -170,6 +225,7 @@ custom_components = {'j-tooltip': 'components/tooltip.vue',
                      'j-about-menu': 'components/about_menu.vue',
                      'j-custom-toolbar-toggle': 'components/custom_toolbar_toggle.vue',
                      'plugin-previews-temp-disabled': 'components/plugin_previews_temp_disabled.vue',  # noqa
+                     'plugin-task-progress': 'components/plugin_task_progress.vue',
                      'plugin-table': 'components/plugin_table.vue',
                      'plugin-select': 'components/plugin_select.vue',
                      'plugin-select-filter': 'components/plugin_select_filter.vue',
@@ -391,6 +447,10 @@ class Application(VuetifyTemplate, HubListener):
         # viewer.session.jdaviz_app
         self._application_handler.session.jdaviz_app = self
 
+        # Opt-in instrumentation of plugins, loaders, hub messages and viewer renders
+        self._profiler = Profiler()
+        self._profiler.instrument_hub(self.hub)
+
         # Create a dictionary for holding non-ipywidget viewer objects so we
         #  can reference their state easily since glue does not store viewers
         self._viewer_store = {}
@@ -467,6 +527,9 @@ class Application(VuetifyTemplate, HubListener):
         # Store for associations between Data entries:
         self._data_associations = self._init_data_associations()
 
+        # Re-computes auto-updating plugin results when their input data or subsets change
+        self._live_results = LiveResultsScheduler(self)
+
         # Subscribe to messages that result in changes to the layers
         self.hub.subscribe(self, AddDataMessage,
                            handler=self._on_add_data_message)
@@ -487,49 +550,18 @@ class Application(VuetifyTemplate, HubListener):
         self._plugin_tables.setdefault(key, msg.table.user_api)
 
     def _iter_live_plugin_results(self, trigger_data_lbl=None, trigger_subset=None):
-        trigger_subset_lbl = trigger_subset.label if trigger_subset is not None else None
-        for data in self.data_collection:
-            plugin_inputs = data.meta.get('_update_live_plugin_results', None)
-            if plugin_inputs is None:
-                continue
-            data_subs = plugin_inputs.get('_subscriptions', {}).get('data', [])
-            subset_subs = plugin_inputs.get('_subscriptions', {}).get('subset', [])
-            if (trigger_data_lbl is not None and
-                    not np.any([plugin_inputs.get(attr) == trigger_data_lbl
-                                for attr in data_subs])):
-                # trigger data does not match subscribed data entries
-                continue
-            if trigger_subset_lbl is not None:
-                if not np.any([plugin_inputs.get(attr) == trigger_subset_lbl
-                               for attr in subset_subs]):
-                    # trigger subset does not match subscribed subsets
-                    continue
-                if not np.any([plugin_inputs.get(attr) == trigger_subset.data.label
-                               for attr in data_subs]):
-                    # trigger parent data of subset does not match subscribed data entries
-                    continue
-            yield (data, plugin_inputs)
-
-    def _update_live_plugin_results(self, trigger_data_lbl=None, trigger_subset=None):
-        for data, plugin_inputs in self._iter_live_plugin_results(trigger_data_lbl, trigger_subset):
-            # update and overwrite data
-            # make a new instance of the plugin to avoid changing any UI settings
-            plg = self._jdaviz_helper.plugins.get(data.meta.get('plugin'))._obj.new()
-            if not plg.supports_auto_update:
-                raise NotImplementedError(f"{data.meta.get('plugin')} does not support live-updates")  # noqa
-            plg.user_api.from_dict(plugin_inputs)
-            # keep auto-updating, even if the option is hidden from the user API
-            # (can remove this line if auto_update is exposed to the user API in the future)
-            plg.add_results.auto_update_result = True
-            try:
-                plg()
-            except Exception as e:
-                self.hub.broadcast(SnackbarMessage(
-                    f"Auto-update for {plugin_inputs['add_results']['label']} failed: {e}",
-                    sender=self, color="error"))
+        return self._live_results.dependents(trigger_data_lbl, trigger_subset)
+
+    def _update_live_plugin_results(self, trigger_data_lbl=None, trigger_subset=None,
+                                    delay=0):
+        # re-compute immediately by default, the message handlers below pass delay=None
+        # to debounce with the scheduler's delay and re-compute in the background
+        self._live_results.schedule(trigger_data_lbl, trigger_subset, delay=delay)
 
     def _remove_live_plugin_results(self, trigger_data_lbl=None, trigger_subset=None):
-        for data, plugin_inputs in self._iter_live_plugin_results(trigger_data_lbl, trigger_subset):
+        results = list(self._iter_live_plugin_results(trigger_data_lbl, trigger_subset))
+        for data, plugin_inputs in results:
+            self._live_results.cancel([data.label])
             self.hub.broadcast(SnackbarMessage(
                 f"Removing {data.label} due to deletion of {trigger_subset.label if trigger_subset is not None else trigger_data_lbl}",  # noqa
                 sender=self, color="warning"))
@@ -537,13 +569,13 @@ class Application(VuetifyTemplate, HubListener):
 
     def _on_add_data_message(self, msg):
         self._on_layers_changed(msg)
-        self._update_live_plugin_results(trigger_data_lbl=msg.data.label)
+        self._update_live_plugin_results(trigger_data_lbl=msg.data.label, delay=None)
 
     def _on_subset_update_message(self, msg):
         # NOTE: print statements in here will require the viewer output_widget
         self._clear_object_cache(msg.subset.label)
         if msg.attribute == 'subset_state':
-            self._update_live_plugin_results(trigger_subset=msg.subset)
+            self._update_live_plugin_results(trigger_subset=msg.subset, delay=None)
 
     def _on_subset_delete_message(self, msg):
         self._remove_live_plugin_results(trigger_subset=msg.subset)
@@ -571,6 +603,14 @@ class Application(VuetifyTemplate, HubListener):
         """
         return self._application_handler.data_collection.hub
 
+    @property
+    def profiler(self):
+        """
+        The `~jdaviz.core.profiling.Profiler` recording the time spent in plugins, loaders,
+        hub messages and viewer renders (once enabled).
+        """
+        return self._profiler
+
     @property
     def session(self):
         """
@@ -3041,6 +3081,7 @@ class Application(VuetifyTemplate, HubListener):
         #  data methods in the future
         vid = new_viewer_item['id']
         self._viewer_store[vid] = viewer
+        self._profiler.instrument_viewer(viewer, vid)
 
         # Add viewer locally
         if (self.config in CONFIGS_WITH_LOADERS
@@ -3081,6 +3122,10 @@ class Application(VuetifyTemplate, HubListener):
             A dictionary of configuration settings to be loaded.  The dictionary
             contents should be the same as a YAML config file specification.
         """
+        # Plugins, viewers, tools, and loaders register themselves when their
+        # modules are imported, which ``import jdaviz`` no longer does eagerly.
+        from jdaviz import configs  # noqa: F401
+
         # reset the application state
         self._reset_state()
 
@@ -3128,6 +3173,7 @@ class Application(VuetifyTemplate, HubListener):
                         reference=view.get('reference'))
 
                     self._viewer_store[viewer_item['id']] = viewer
+                    self._profiler.instrument_viewer(viewer, viewer_item['id'])
 
                     stack_item.get('viewers').append(viewer_item)
 
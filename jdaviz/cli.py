@@ -1,20 +1,20 @@
 # Command-line interface for jdaviz
 
-import inspect
 import os
 import pathlib
 
 from jdaviz import __version__
-from jdaviz.app import ALL_JDAVIZ_CONFIGS
-from jdaviz.configs.default.plugins.logger import _verbosity_levels
-from jdaviz import configs
 
 __all__ = ['main']
 
-CONFIGS_DIR = str(pathlib.Path(inspect.getfile(configs)).parent)
 JDAVIZ_DIR = pathlib.Path(__file__).parent.resolve()
+CONFIGS_DIR = str(JDAVIZ_DIR / 'configs')
 DEFAULT_VERBOSITY = 'warning'
 DEFAULT_HISTORY_VERBOSITY = 'info'
+# The parser only needs these names, so they are defined here instead of in the
+# app and logger to keep ``jdaviz --help`` from importing glue and the plugins.
+ALL_JDAVIZ_CONFIGS = ['cubeviz', 'specviz', 'specviz2d', 'mosviz', 'imviz']
+_verbosity_levels = ('debug', 'info', 'warning', 'error')
 
 
 def main(filepaths=None, layout='default', instrument=None, browser='default',
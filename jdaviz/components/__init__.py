@@ -0,0 +1,3 @@
+# Importing jdaviz.core imports the configs, which import these components, so make sure that
+# happens first when a component is the first module imported from jdaviz.
+import jdaviz.core  # noqa
@@ -0,0 +1,180 @@
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from jdaviz.configs.default.plugins.export.frames import (HeadlessFrameRenderer,
+                                                          composite_settings_key)
+
+__all__ = ['SliceFrameCache', 'SlicePrefetcher']
+
+
+class SliceFrameCache:
+    """
+    Bounded cache of the rendered (sliced, stretched and colormapped) image of a cube
+    viewer, keyed by slice, view bounds and layer display settings.
+
+    While installed, the viewer's image is drawn from the cache when the frame of the
+    current slice was rendered ahead of time, and rendered as usual otherwise.
+
+    Parameters
+    ----------
+    viewer : `~jdaviz.configs.cubeviz.plugins.viewers.CubevizImageView`
+        Viewer whose frames are cached.
+    max_frames : int
+        Maximum number of frames to keep.
+    """
+    def __init__(self, viewer, max_frames=16):
+        self.viewer = viewer
+        self.max_frames = max_frames
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+        self._renderer = None
+        self._array_maker = None
+
+    @property
+    def _frb(self):
+        return self.viewer._composite_image
+
+    def bounds(self):
+        """
+        Bounds of the image currently shown in the viewer, as requested by the image mark,
+        or `None` if the viewer is not displayed.
+        """
+        # NOTE: this follows glue_jupyter's FRBImage.update
+        frb = self._frb
+        shape = frb.shape
+        if shape is None or np.allclose(shape, 0):
+            return None
+        x_scale, y_scale = frb.viewer.figure.axes[0].scale, frb.viewer.figure.axes[1].scale
+        xmin, xmax, ymin, ymax = x_scale.min, x_scale.max, y_scale.min, y_scale.max
+        if None in (xmin, xmax, ymin, ymax):
+            return None
+        ny, nx = shape
+        padding = frb.external_padding
+        if padding != 0:
+            dx, dy = xmax - xmin, ymax - ymin
+            xmin, xmax = xmin - dx * padding, xmax + dx * padding
+            ymin, ymax = ymin - dy * padding, ymax + dy * padding
+            nx *= math.ceil(1 + 2 * padding)
+            ny *= math.ceil(1 + 2 * padding)
+        return [(ymin, ymax, ny), (xmin, xmax, nx)]
+
+    def _key(self, index, bounds, settings_key):
+        return int(index), tuple(tuple(b) for b in bounds), settings_key
+
+    def __len__(self):
+        return len(self._frames)
+
+    def prefetch(self, indices, bounds=None):
+        """
+        Render the frames of the slices at ``indices`` that are not cached yet.
+        """
+        bounds = self.bounds() if bounds is None else bounds
+        if bounds is None:
+            return
+        settings_key = composite_settings_key(self.viewer._composite)
+        if self._renderer is None or self._renderer.settings_key != settings_key:
+            # display settings changed, frames rendered with the old ones will not be used
+            self._renderer = HeadlessFrameRenderer(self.viewer)
+        for index in indices:
+            key = self._key(index, bounds, settings_key)
+            if key in self._frames:
+                continue
+            frame = self._renderer.composite(index, bounds)
+            if frame is None:
+                return
+            with self._lock:
+                self._frames[key] = frame.astype(np.float32)
+                while len(self._frames) > self.max_frames:
+                    self._frames.popitem(last=False)
+
+    def array_maker(self, bounds=None):
+        """Drop-in for the viewer's composite array, serving frames from the cache."""
+        key = self._key(self.viewer.slice, bounds, composite_settings_key(self.viewer._composite))
+        with self._lock:
+            frame = self._frames.get(key)
+        if frame is None:
+            self.misses += 1
+            return self.viewer._composite(bounds=bounds)
+        self.hits += 1
+        return frame
+
+    def install(self):
+        self._array_maker = self._frb.array_maker
+        self._frb.array_maker = self.array_maker
+
+    def uninstall(self):
+        if self._array_maker is not None:
+            self._frb.array_maker = self._array_maker
+            self._array_maker = None
+        with self._lock:
+            self._frames.clear()
+
+
+class SlicePrefetcher:
+    """
+    Render the upcoming frames of cube viewers in a background thread during playback.
+
+    Parameters
+    ----------
+    viewers : list
+        Cube viewers to prefetch frames for.
+    depth : int
+        Number of upcoming slices to render ahead of the current one.
+    """
+    def __init__(self, viewers, depth=8):
+        self.depth = depth
+        self.caches = [SliceFrameCache(viewer, max_frames=2 * depth) for viewer in viewers
+                       if hasattr(viewer, '_composite_image')]
+        self._upcoming = []
+        self._event = threading.Event()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        for cache in self.caches:
+            cache.install()
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for cache in self.caches:
+            cache.uninstall()
+
+    def request(self, values):
+        """Render the frames of the slices with the given (upcoming) slice values."""
+        self._upcoming = list(values)[:self.depth]
+        self._event.set()
+
+    def _worker(self):
+        while self._running:
+            self._event.wait()
+            self._event.clear()
+            values = self._upcoming
+            indices = {}
+            for cache in self.caches:
+                slice_values = cache.viewer.slice_values
+                if len(slice_values):
+                    indices[cache] = [int(np.argmin(abs(slice_values - value)))
+                                      for value in values]
+            # render the nearest frames of all viewers first
+            for i in range(len(values)):
+                if not self._running or self._event.is_set():
+                    # stopped, or the next request already came in
+                    break
+                for cache, cache_indices in indices.items():
+                    try:
+                        cache.prefetch(cache_indices[i:i + 1])
+                    except Exception:  # nosec
+                        # frames that fail to render are rendered by the viewer instead
+                        continue
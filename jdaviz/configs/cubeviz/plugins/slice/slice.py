@@ -6,13 +6,14 @@ from functools import cached_property
 import numpy as np
 from astropy import units as u
 from astropy.units import UnitsWarning
-from traitlets import Bool, Int, Unicode, observe
+from traitlets import Bool, Float, Int, Unicode, observe
 
 from jdaviz.configs.cubeviz.plugins.viewers import (
     WithSliceIndicator, WithSliceSelection,
     CubevizImageView, CubevizProfileView
 )
 from jdaviz.configs.cubeviz.helper import _spectral_axis_names
+from jdaviz.configs.cubeviz.plugins.slice.prefetch import SlicePrefetcher
 from jdaviz.configs.rampviz.helper import _temporal_axis_names
 from jdaviz.configs.rampviz.plugins.viewers import RampvizImageView, RampvizProfileView
 from jdaviz.core.custom_traitlets import FloatHandleEmpty
@@ -66,6 +67,9 @@ class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
 
     is_playing = Bool(False).tag(sync=True)
     play_interval = Int(200).tag(sync=True)  # milliseconds
+    play_prefetch = Int(8).tag(sync=True)  # number of upcoming slices rendered ahead
+    play_fps = Float(0).tag(sync=True)  # achieved frame rate while playing
+    play_dropped = Int(0).tag(sync=True)  # frames skipped since playback started
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -381,20 +385,58 @@ class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
     def _player_worker(self):
         ts = float(self.play_interval) * 1e-3  # ms to s
         valid_values = self.valid_values_sorted
-        if not len(valid_values):
+        n_values = len(valid_values)
+        if not n_values:
             self.is_playing = False
             return
-        while self.is_playing:
-            # recompute current_ind in case user has moved slider
-            # could optimize this by only recomputing after a select slice message
-            # (will only make a difference if argmin becomes approaches play_interval)
-            current_ind = np.argmin(abs(valid_values - self.value))
-            if len(valid_values) <= current_ind + 1:
-                # wrap
-                self.value = float(valid_values[0])
-            else:
-                self.value = float(valid_values[current_ind + 1])
-            time.sleep(ts)
+
+        # render the upcoming slices of the cube viewers ahead of time, so that advancing
+        # only has to send the pre-rendered frame to the viewer
+        prefetcher = None
+        if self.play_prefetch > 0:
+            prefetcher = SlicePrefetcher(self.slice_selection_viewers, depth=self.play_prefetch)
+            prefetcher.start()
+
+        self.play_fps = 0
+        self.play_dropped = 0
+        current_ind, current_value = None, None
+        n_frames, fps_start = 0, time.monotonic()
+        next_time = time.monotonic()
+        try:
+            while self.is_playing:
+                if self.value != current_value:
+                    # first frame, or the user moved the slider
+                    current_ind = int(np.argmin(abs(valid_values - self.value)))
+
+                # when rendering fell behind, skip the frames that are already late
+                # instead of slowing down playback
+                step = 1
+                late = time.monotonic() - next_time
+                if late > ts:
+                    dropped = int(late // ts)
+                    step += dropped
+                    self.play_dropped += dropped
+                    next_time += dropped * ts
+
+                # wraps around to the beginning
+                current_ind = (current_ind + step) % n_values
+                current_value = float(valid_values[current_ind])
+                if prefetcher is not None:
+                    prefetcher.request(valid_values[(current_ind + 1 + np.arange(
+                        self.play_prefetch)) % n_values])
+                self.value = current_value
+                n_frames += 1
+
+                now = time.monotonic()
+                if now - fps_start >= 1:
+                    self.play_fps = n_frames / (now - fps_start)
+                    n_frames, fps_start = 0, now
+
+                next_time += ts
+                time.sleep(max(0, next_time - time.monotonic()))
+        finally:
+            if prefetcher is not None:
+                prefetcher.stop()
 
     def vue_play_start_stop(self, *args):
         if self.is_playing:  # Stop
@@ -1,7 +1,10 @@
+import time
 import warnings
 
+import numpy as np
 import pytest
 
+from jdaviz.configs.cubeviz.plugins.slice.prefetch import SliceFrameCache
 from jdaviz.configs.cubeviz.plugins.slice.slice import SpectralSlice
 
 
@@ -93,6 +96,52 @@ def test_slice(cubeviz_helper, spectrum1d_cube):
     # NOTE: Hard to check sl.slice here because it is non-deterministic.
 
 
+def test_playback_frame_rate(cubeviz_helper, spectrum1d_cube):
+    cubeviz_helper.load_data(spectrum1d_cube, data_label='test')
+    sl = cubeviz_helper.plugins['Spectral Slice']._obj
+    sl.play_interval = 10
+
+    sl.vue_play_start_stop()
+    time.sleep(1.5)
+    player = sl._player
+    sl.vue_play_start_stop()
+    player.join()
+
+    # playback never runs faster than play_interval (up to the timing of the measurement)
+    assert 0 < sl.play_fps < 110
+    assert sl.play_dropped >= 0
+
+
+def test_slice_frame_cache(cubeviz_helper, spectrum1d_cube):
+    cubeviz_helper.load_data(spectrum1d_cube, data_label='test')
+    viewer = cubeviz_helper.app.get_viewer('flux-viewer')
+    sl = cubeviz_helper.plugins['Spectral Slice']._obj
+    bounds = [(-0.5, 1.5, 6), (-0.5, 3.5, 12)]
+
+    cache = SliceFrameCache(viewer, max_frames=2)
+    cache.install()
+    try:
+        cache.prefetch([0, 1, 0], bounds=bounds)
+        assert len(cache) == 2
+        for value in sl.valid_values_sorted:
+            sl.value = value
+            frame = viewer._composite_image.array_maker(bounds=bounds)
+            np.testing.assert_allclose(frame, viewer._composite(bounds=bounds), atol=1e-6)
+        assert (cache.hits, cache.misses) == (2, 0)
+
+        # frames rendered with other display settings are not used
+        viewer.layers[0].state.v_max *= 2
+        viewer._composite_image.array_maker(bounds=bounds)
+        assert (cache.hits, cache.misses) == (2, 1)
+        cache.prefetch([viewer.slice], bounds=bounds)
+        np.testing.assert_allclose(viewer._composite_image.array_maker(bounds=bounds),
+                                   viewer._composite(bounds=bounds), atol=1e-6)
+        assert (cache.hits, cache.misses) == (3, 1)
+    finally:
+        cache.uninstall()
+    assert viewer._composite_image.array_maker == viewer._composite
+
+
 def test_indicator_settings(cubeviz_helper, spectrum1d_cube):
     cubeviz_helper.load_data(spectrum1d_cube, data_label='test')
     app = cubeviz_helper.app
@@ -1,8 +1,12 @@
 import os
+import time
 
+import numpy as np
 import pytest
+from regions import PixCoord, RectanglePixelRegion
 
 from jdaviz.configs.default.plugins.export.export import HAS_OPENCV
+from jdaviz.configs.default.plugins.export.frames import HeadlessFrameRenderer
 
 
 # TODO: Remove skip when https://github.com/bqplot/bqplot/pull/1397/files#r726500097 is resolved.
@@ -24,6 +28,60 @@ def test_export_movie(cubeviz_helper, spectrum1d_cube, tmp_path):
         os.chdir(orig_path)
 
 
+@pytest.mark.skipif(not HAS_OPENCV, reason="opencv-python is not installed")
+def test_export_movie_headless(cubeviz_helper, spectrum1d_cube, tmp_path):
+    import cv2
+
+    cubeviz_helper.load_data(spectrum1d_cube, data_label="test")
+    plugin = cubeviz_helper.plugins["Export"]._obj
+    viewer = cubeviz_helper.app.get_viewer('flux-viewer')
+    filename = str(tmp_path / "mymovie.mp4")
+
+    # no frontend is needed, so the viewer has no display shape
+    assert viewer.shape is None
+    plugin.save_movie(viewer, filename, 'mp4', i_start=0, i_end=1, headless=True)
+    # recording happens in a thread, which opens the file once recording started
+    for _ in range(200):
+        if os.path.isfile(filename) and not plugin.movie_recording:
+            break
+        time.sleep(0.05)
+
+    video = cv2.VideoCapture(filename)
+    assert video.get(cv2.CAP_PROP_FRAME_COUNT) == 2
+    video.release()
+
+
+def test_headless_frame_renderer(cubeviz_helper, spectrum1d_cube):
+    cubeviz_helper.load_data(spectrum1d_cube, data_label="test")
+    viewer = cubeviz_helper.app.get_viewer('flux-viewer')
+    layer = viewer.layers[0]
+    layer.state.cmap = layer.state.cmap.from_list('test', ['black', 'white'])
+    layer.state.v_min, layer.state.v_max = 0, 15
+
+    renderer = HeadlessFrameRenderer(viewer, width=8)
+    assert (renderer.width, renderer.height) == (8, 4)
+
+    frames = list(renderer.iter_frames([0, 1, 0], max_workers=2))
+    assert [frame.shape for frame in frames] == [(4, 8, 3)] * 3
+    assert all(frame.dtype == np.uint8 for frame in frames)
+    np.testing.assert_array_equal(frames[0], frames[2])
+
+    # each 2x2 block of the frame is a pixel of the (grayscale) slice,
+    # with the top row of the frame at the top of the image
+    for index, frame in enumerate(frames[:2]):
+        image = layer.state.layer['flux'][index][::-1]
+        expected = np.round(255 * image / 15).astype(np.uint8)
+        np.testing.assert_array_equal(frame[::2, ::2, 0], expected)
+        np.testing.assert_array_equal(frame[..., 0], frame[..., 2])
+
+    # visible subsets are drawn on top of the image
+    cubeviz_helper.plugins['Subset Tools'].import_region(
+        RectanglePixelRegion(PixCoord(0, 0), 1, 1))
+    subset_frame = HeadlessFrameRenderer(viewer, width=8).render(0)
+    changed = np.any(subset_frame != frames[0], axis=-1)
+    assert changed[2:, :2].all() and changed.sum() == 4
+
+
 @pytest.mark.skipif(HAS_OPENCV, reason="opencv-python is installed")
 def test_no_opencv(cubeviz_helper, spectrum1d_cube):
     cubeviz_helper.load_data(spectrum1d_cube, data_label="test")
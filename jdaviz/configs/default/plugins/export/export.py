@@ -3,6 +3,7 @@ import time
 from pathlib import Path
 import threading
 
+import numpy as np
 from astropy import units as u
 from astropy.nddata import CCDData
 from glue.core.message import SubsetCreateMessage, SubsetDeleteMessage, SubsetUpdateMessage
@@ -11,6 +12,7 @@ from regions import CircleSkyRegion, EllipseSkyRegion
 from specutils import Spectrum
 from traitlets import Bool, List, Unicode, observe
 
+from jdaviz.configs.default.plugins.export.frames import HeadlessFrameRenderer
 from jdaviz.core.custom_traitlets import FloatHandleEmpty, IntHandleEmpty
 from jdaviz.core.marks import ShadowMixin
 from jdaviz.core.registries import tray_registry
@@ -110,6 +112,7 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
     i_start = IntHandleEmpty(0).tag(sync=True)
     i_end = IntHandleEmpty(0).tag(sync=True)
     movie_fps = FloatHandleEmpty(5.0).tag(sync=True)
+    movie_headless = Bool(False).tag(sync=True)
     movie_recording = Bool(False).tag(sync=True)
     movie_interrupt = Bool(False).tag(sync=True)
 
@@ -772,15 +775,57 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
                 os.remove(filename)
             self.movie_interrupt = False
 
+    @with_spinner('movie_recording')
+    def _save_movie_headless(self, viewer, i_start, i_end, fps, filename, width, height):
+        if not self.movie_enabled:
+            if not HAS_OPENCV:
+                raise ImportError("Please install opencv-python")
+            raise ValueError("movie support disabled")
+
+        # frames follow the (sorted) values of the slice plugin, as when playing the cube
+        slice_values = viewer.slice_values
+        valid_values = self.app._jdaviz_helper.plugins["Spectral Slice"]._obj.valid_values_sorted
+        indices = [int(np.argmin(abs(slice_values - value)))
+                   for value in valid_values[i_start:i_end + 1]]
+
+        video = None
+        try:
+            renderer = HeadlessFrameRenderer(viewer, width=width, height=height)
+            video = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), fps,
+                                    (renderer.width, renderer.height), True)
+            for frame in renderer.iter_frames(indices):
+                if self.movie_interrupt:
+                    break
+                # opencv expects BGR frames
+                video.write(np.ascontiguousarray(frame[..., ::-1]))
+        except Exception as e:
+            self.hub.broadcast(SnackbarMessage(
+                f"Error saving {filename}: {e!r}", sender=self, color="error", traceback=e))
+        finally:
+            if video:
+                video.release()
+
+        if self.movie_interrupt:
+            if os.path.exists(filename):
+                os.remove(filename)
+            self.movie_interrupt = False
+
     def save_movie(self, viewer, filename, filetype, i_start=None, i_end=None, fps=None,
-                   rm_temp_files=True, width=None, height=None):
+                   rm_temp_files=True, width=None, height=None, headless=None):
         """Save selected slices as a movie.
 
-        This method creates a PNG file per frame (``._cubeviz_movie_frame_<n>.png``)
-        in the working directory before stitching all the frames into a movie.
-        Please make sure you have sufficient memory for this operation.
-        PNG files are deleted after the movie is created unless otherwise specified.
-        If another PNG file with the same name already exists, it will be silently replaced.
+        By default, this method creates a PNG file per frame
+        (``._cubeviz_movie_frame_<n>.png``) in the working directory before stitching all
+        the frames into a movie. Please make sure you have sufficient memory for this
+        operation. PNG files are deleted after the movie is created unless otherwise
+        specified. If another PNG file with the same name already exists, it will be
+        silently replaced.
+
+        With ``headless=True``, the frames are instead rendered in Python from the image
+        layers of the viewer (with their current limits, stretch and colormap, and the
+        visible subsets, but without axes or other marks) and streamed to the movie file
+        without temporary files. This does not need the viewer to be displayed in a
+        browser and is much faster for long movies.
 
         Parameters
         ----------
@@ -812,6 +857,10 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
         height : str, optional
             Height of the exported image. Required if width is provided.
 
+        headless : bool or `None`
+            Whether to render the frames without the browser frontend.
+            If not given, it is obtained from plugin inputs.
+
         Returns
         -------
         out_filename : str
@@ -827,7 +876,10 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
         if filetype != "mp4":
             raise NotImplementedError(f"filetype={filetype} not supported")
 
-        if viewer.shape is None:
+        if headless is None:
+            headless = self.movie_headless
+
+        if viewer.shape is None and not headless:
             raise ValueError("Selected viewer has no display shape.")
 
         if fps is None:
@@ -851,10 +903,19 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
         if i_end <= i_start:
             raise ValueError(f"No frames to write: i_start={i_start}, i_end={i_end}")
 
-        threading.Thread(
-            target=lambda: self._save_movie(viewer, i_start, i_end, fps, filename, rm_temp_files,
-                                            width, height)
-        ).start()
+        if headless:
+            def pixels(size):
+                return None if size is None else int(str(size).removesuffix('px'))
+
+            threading.Thread(
+                target=lambda: self._save_movie_headless(viewer, i_start, i_end, fps, filename,
+                                                         pixels(width), pixels(height))
+            ).start()
+        else:
+            threading.Thread(
+                target=lambda: self._save_movie(viewer, i_start, i_end, fps, filename,
+                                                rm_temp_files, width, height)
+            ).start()
 
         return filename
 
@@ -0,0 +1,171 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import numpy as np
+from glue.core import BaseData
+from glue.viewers.image.composite_array import CompositeArray
+from matplotlib.colors import to_rgb
+
+__all__ = ['HeadlessFrameRenderer', 'composite_settings_key']
+
+# opacity of subset masks drawn over the image, as in glue's image viewer
+_SUBSET_ALPHA = 0.5
+
+
+def composite_settings_key(composite):
+    """
+    Hashable summary of the display settings of the layers of a glue
+    `~glue.viewers.image.composite_array.CompositeArray`, which changes whenever
+    the rendered image would change for the same data and slice.
+    """
+    def stretch_key(stretch):
+        if isinstance(stretch, str):
+            return stretch
+        return type(stretch).__name__, repr(sorted(vars(stretch).items()))
+
+    return (composite.mode,) + tuple(
+        (uuid, layer['visible'], layer['zorder'], tuple(layer['clim']), layer['contrast'],
+         layer['bias'], layer['alpha'], str(layer['color']), id(layer['cmap']),
+         stretch_key(layer['stretch']))
+        for uuid, layer in sorted(composite.layers.items()))
+
+
+class HeadlessFrameRenderer:
+    """
+    Render the slices of a cube viewer to RGB frames without a browser frontend.
+
+    Each visible image layer is sliced, stretched, colormapped and composited with NumPy
+    (through glue's `~glue.viewers.image.composite_array.CompositeArray`) using the
+    limits, stretch, colormap and opacity currently set in the viewer, and visible
+    spatial subsets are drawn on top. Only the image is rendered, without axes or
+    other marks. The viewer settings are captured when the renderer is created, so
+    frames can be rendered in worker threads while the app keeps running.
+
+    Parameters
+    ----------
+    viewer : `~jdaviz.configs.cubeviz.plugins.viewers.CubevizImageView`
+        Viewer to render, with the current zoom and layer settings.
+    width, height : int or `None`
+        Size of the frames, in pixels. If only one is given, the other is set to keep
+        the aspect ratio of the visible region. By default, the visible region is
+        rendered at its native resolution, scaled up to at least ``min_size`` pixels.
+    min_size : int
+        Minimum size of the longer side of the frames when the size is not given.
+    """
+    def __init__(self, viewer, width=None, height=None, min_size=480):
+        state = viewer.state
+        if state.reference_data is None:
+            raise ValueError("viewer has no data to render")
+        self._reference_data = state.reference_data
+        self._x_axis = state.x_att.axis
+        self._y_axis = state.y_att.axis
+        self._slice_axis = viewer.slice_index
+        self._transpose = self._y_axis > self._x_axis
+        self._mode = viewer._composite.mode
+        self.settings_key = composite_settings_key(viewer._composite)
+
+        # copy the settings of the visible layers, these do not change while rendering
+        self._layers = {}
+        self._subsets = []
+        for layer in viewer.layers:
+            if not (layer.enabled and layer.state.visible):
+                continue
+            if isinstance(layer.layer, BaseData):
+                if layer.uuid in viewer._composite.layers:
+                    self._layers[layer.uuid] = (layer.state.layer, layer.state.attribute,
+                                                dict(viewer._composite.layers[layer.uuid]))
+            elif layer.layer.data.ndim == self._reference_data.ndim:
+                self._subsets.append((layer.layer, to_rgb(layer.state.color)))
+
+        x_min, x_max = state.x_min, state.x_max
+        y_min, y_max = state.y_min, state.y_max
+        if width is None and height is None:
+            scale = max(1, int(np.ceil(min_size / max(x_max - x_min, y_max - y_min))))
+            width = int(round(x_max - x_min)) * scale
+            height = int(round(y_max - y_min)) * scale
+        elif width is None:
+            width = int(round(height * (x_max - x_min) / (y_max - y_min)))
+        elif height is None:
+            height = int(round(width * (y_max - y_min) / (x_max - x_min)))
+        self.width, self.height = int(width), int(height)
+
+        # bounds of the visible region at the centers of the output pixels
+        dx, dy = (x_max - x_min) / self.width, (y_max - y_min) / self.height
+        self._x_bounds = (x_min + dx / 2, x_max - dx / 2, self.width)
+        self._y_bounds = (y_min + dy / 2, y_max - dy / 2, self.height)
+
+    def _bounds(self, index, bounds=None):
+        y_bounds, x_bounds = (self._y_bounds, self._x_bounds) if bounds is None else bounds
+        full_bounds = [index] * self._reference_data.ndim
+        full_bounds[self._x_axis] = x_bounds
+        full_bounds[self._y_axis] = y_bounds
+        return full_bounds
+
+    def _sliced(self, image):
+        return image.T if self._transpose else image
+
+    def _layer_data(self, data, attribute, index, bounds=None):
+        # NOTE: no cache_id so that frames do not evict the viewer's own cached buffers
+        image = data.compute_fixed_resolution_buffer(self._bounds(index, bounds),
+                                                     target_data=self._reference_data,
+                                                     target_cid=attribute, broadcast=False)
+        return self._sliced(image)
+
+    def composite(self, index, bounds=None):
+        """
+        Composite RGBA image of the image layers at slice ``index``, as the viewer's own
+        `~glue.viewers.image.composite_array.CompositeArray` would return it for the
+        same ``bounds`` (``[(y_min, y_max, ny), (x_min, x_max, nx)]``, defaults to the
+        frame bounds), or `None` if no image layer is visible.
+        """
+        composite = CompositeArray()
+        composite.mode = self._mode
+        for uuid, (data, attribute, settings) in self._layers.items():
+            composite.allocate(uuid)
+            composite.set(uuid, **{**settings,
+                                   'array': partial(self._layer_data, data, attribute, index),
+                                   'shape': None})
+        return composite(bounds=bounds)
+
+    def render(self, index):
+        """
+        Render the slice at ``index`` (along the slice axis of the cube).
+
+        Returns
+        -------
+        frame : `~numpy.ndarray`
+            RGB frame with shape ``(height, width, 3)`` and data type ``uint8``, with
+            the first row at the top of the image.
+        """
+        image = self.composite(index)
+        if image is None:
+            image = np.zeros((self.height, self.width, 4))
+        rgb = image[..., :3]
+
+        for subset, color in self._subsets:
+            mask = self._sliced(subset.data.compute_fixed_resolution_buffer(
+                self._bounds(index), target_data=self._reference_data,
+                subset_state=subset.subset_state, broadcast=False))
+            alpha = _SUBSET_ALPHA * mask[..., np.newaxis]
+            rgb = rgb * (1 - alpha) + np.asarray(color) * alpha
+
+        # images have the origin at the bottom-left, frames at the top-left
+        return (255 * rgb[::-1]).round().astype(np.uint8)
+
+    def iter_frames(self, indices, max_workers=None):
+        """
+        Render the slices at ``indices`` in a pool of worker threads, yielding the frames
+        in order. Only a few frames ahead of the one being consumed are kept in memory.
+        """
+        indices = list(indices)
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        window = 2 * max_workers
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.render, index) for index in indices[:window]]
+            for i in range(len(indices)):
+                if i + window < len(indices):
+                    futures.append(executor.submit(self.render, indices[i + window]))
+                yield futures[i].result()
+                futures[i] = None
@@ -1,5 +1,7 @@
-from traitlets import List, Unicode
+from traitlets import Bool, Int, List, Unicode, observe
 
+from jdaviz.cli import _verbosity_levels
+from jdaviz.core.events import SnackbarMessage
 from jdaviz.core.registries import tray_registry
 from jdaviz.core.template_mixin import PluginTemplateMixin, SelectPluginComponent
 from jdaviz.core.user_api import PluginUserApi
@@ -11,13 +13,28 @@ except ImportError:  # pragma: no cover
 
 __all__ = ['Logger', '_verbosity_levels']
 
-_verbosity_levels = ('debug', 'info', 'warning', 'error')
-
 
 @tray_registry('logger', label="Logger",
                category='core', sidebar='info', subtab=2)
 class Logger(PluginTemplateMixin):
-    """Show snackbar messages in a logger UI."""
+    """
+    Show snackbar messages in a logger UI, and the calls recorded by the profiler of the app.
+
+    Only the following attributes and methods are available through the
+    :ref:`public plugin API <plugin-apis>`:
+
+    * ``popup_verbosity`` (:class:`~jdaviz.core.template_mixin.SelectPluginComponent`)
+    * ``history_verbosity`` (:class:`~jdaviz.core.template_mixin.SelectPluginComponent`)
+    * ``history``
+    * :meth:`clear_history`
+    * ``profiling_enabled`` (bool)
+      Whether the profiler records calls, see :attr:`jdaviz.app.Application.profiler`.
+    * ``profiling_track_memory`` (bool)
+      Whether the profiler also records the peak memory allocation of each call.
+    * :meth:`profiling_summary`
+    * :meth:`clear_profiling`
+    * :meth:`export_profiling_trace`
+    """
     template_file = __file__, "logger.vue"
 
     popup_verbosity_items = List().tag(sync=True)
@@ -27,6 +44,12 @@ class Logger(PluginTemplateMixin):
 
     history = List().tag(sync=True)
 
+    profiling_enabled = Bool(False).tag(sync=True)
+    profiling_track_memory = Bool(False).tag(sync=True)
+    profiling_n_records = Int(0).tag(sync=True)
+    profiling_rows = List().tag(sync=True)
+    profiling_filename = Unicode("jdaviz_trace.json").tag(sync=True)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -45,7 +68,9 @@ class Logger(PluginTemplateMixin):
 
     @property
     def user_api(self):
-        expose = ['popup_verbosity', 'history_verbosity', 'history', 'clear_history']
+        expose = ['popup_verbosity', 'history_verbosity', 'history', 'clear_history',
+                  'profiling_enabled', 'profiling_track_memory', 'profiling_summary',
+                  'clear_profiling', 'export_profiling_trace']
         return PluginUserApi(self, expose=expose)
 
     def clear_history(self):
@@ -54,6 +79,79 @@ class Logger(PluginTemplateMixin):
     def vue_clear_history(self, *args):
         return self.clear_history()
 
+    @observe('profiling_enabled', 'profiling_track_memory')
+    def _profiling_enabled_changed(self, *args):
+        if self.profiling_enabled:
+            self.app.profiler.enable(track_memory=self.profiling_track_memory)
+        else:
+            self.app.profiler.disable()
+
+    def profiling_summary(self, category=None):
+        """
+        Statistics of the calls recorded by the profiler, see
+        :meth:`jdaviz.core.profiling.Profiler.summary`.
+
+        Parameters
+        ----------
+        category : str or `None`
+            Only include calls of this category (``'plugin'``, ``'loader'``, ``'hub'``
+            or ``'viewer'``).
+
+        Returns
+        -------
+        table : `~astropy.table.Table`
+        """
+        return self.app.profiler.summary(category=category)
+
+    def _update_profiling_rows(self, max_rows=50):
+        summary = self.profiling_summary()
+        self.profiling_n_records = len(self.app.profiler)
+        self.profiling_rows = [{'category': row['category'],
+                                'name': row['name'],
+                                'count': int(row['count']),
+                                'total': f"{row['total_time'] * 1e3:.1f}",
+                                'mean': f"{row['mean_time'] * 1e3:.1f}",
+                                'peak': (f"{row['peak_memory'] / 1024**2:.1f}"
+                                         if row['peak_memory'] >= 0 else '')}
+                               for row in summary[:max_rows]]
+
+    def vue_refresh_profiling(self, *args):
+        self._update_profiling_rows()
+
+    def clear_profiling(self):
+        """
+        Remove all the calls recorded by the profiler.
+        """
+        self.app.profiler.clear()
+        self._update_profiling_rows()
+
+    def vue_clear_profiling(self, *args):
+        self.clear_profiling()
+
+    def export_profiling_trace(self, filename=None):
+        """
+        Write the calls recorded by the profiler to a Chrome trace JSON file, which can be
+        opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+
+        Parameters
+        ----------
+        filename : str or `None`
+            Defaults to ``profiling_filename``.
+
+        Returns
+        -------
+        filename : str
+        """
+        if filename is None:
+            filename = self.profiling_filename
+        self.app.profiler.to_chrome_trace(filename)
+        return filename
+
+    def vue_export_profiling_trace(self, *args):
+        filename = self.export_profiling_trace()
+        self.hub.broadcast(SnackbarMessage(f"Exported profiling trace to {filename}",
+                                           sender=self, color='success'))
+
     def queue_message(self, msg, msg_level=None):
         if msg_level not in _verbosity_levels:
             msg_level = 'info'
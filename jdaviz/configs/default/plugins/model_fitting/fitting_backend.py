@@ -1,14 +1,21 @@
 from asteval import Interpreter
+from collections import OrderedDict
+from collections.abc import MutableMapping
+import hashlib
 import multiprocessing as mp
+import re
 import numpy as np
 
+import astropy.units as u
+from astropy.io import fits
 from astropy.modeling import fitting
 from specutils import Spectrum
 from specutils.fitting import fit_lines
 
-from jdaviz.utils import parallelize_calculation
+from jdaviz.utils import create_data_hash, parallelize_calculation
 
-__all__ = ['fit_model_to_spectrum', 'generate_spaxel_list']
+__all__ = ['fit_model_to_spectrum', 'generate_spaxel_list', 'CubeFitResults', 'FittedModels',
+           'fit_fingerprint', 'FitResultCache', 'parameter_components']
 
 
 def fit_model_to_spectrum(spectrum, component_list, expression,
@@ -54,12 +61,12 @@ def fit_model_to_spectrum(spectrum, component_list, expression,
 
     Returns
     -------
-    output_model : `~astropy.modeling.CompoundModel` or list
+    output_model : `~astropy.modeling.CompoundModel` or `CubeFitResults`
         The model resulting from the fit. In the case of a 1D input
         spectrum, a single model instance is returned. In case of a
-        3D spectral cube input, instead o model instances for every
-        spaxel, a list with 2D arrays, each one storing fitted parameter
-        values for all spaxels, is returned.
+        3D spectral cube input, instead of model instances for every
+        spaxel, a `CubeFitResults` storing the fitted parameter values
+        of all spaxels in arrays is returned.
 
     output_spectrum : `~specutils.Spectrum`
         The realization of the fitted model as a spectrum. The spectrum
@@ -145,8 +152,8 @@ def _fit_3D(initial_model, spectrum, fitter, window=None, n_cpu=None, **kwargs):
 
     Returns
     -------
-    output_model : :list: a list that stores 2D arrays. Each array contains one
-        parameter from `astropy.modeling.CompoundModel` instances
+    output_model : `CubeFitResults`
+        The parameters of the `astropy.modeling.CompoundModel` instances
         fitted to every spaxel in the input cube.
     output_spectrum : :class:`specutils.Spectrum`
         The spectrum that stores the fitted model values in its 'flux'
@@ -155,73 +162,148 @@ def _fit_3D(initial_model, spectrum, fitter, window=None, n_cpu=None, **kwargs):
     if n_cpu is None:
         n_cpu = mp.cpu_count() - 1
 
-    # Generate list of all spaxels to be fitted
-    spaxels = generate_spaxel_list(spectrum)
+    job = CubeFitJob(initial_model, spectrum, fitter, window=window, **kwargs)
 
-    fitted_models = []
+    if n_cpu > 1:
+        # Build workers (one per chunk) same as the Pool chunking
+        parallelize_calculation(job.workers(n_cpu), job.collect, n_cpu=n_cpu)
+
+    # This route is only for dev debugging because it is very slow
+    # but exceptions will not get swallowed up by joblib.
+    else:  # pragma: no cover
+        for worker in job.workers(1):
+            job.collect(worker())
+
+    return job.result()
 
-    # Build cube with empty arrays, one per input spaxel. These
-    # will store the flux values corresponding to the fitted
-    # model realization over each spaxel.
-    output_flux_cube = np.zeros(shape=spectrum.flux.shape)
 
-    # Callback to collect results from workers into the cubes
-    def collect_result(results):
+class CubeFitJob:
+    """
+    Fit of an astropy CompoundModel to every spaxel of a cube, split into
+    chunks of spaxels that can be fitted independently (in parallel, or as
+    a `~jdaviz.core.tasks.PluginTask`).
+
+    Parameters
+    ----------
+    initial_model : :class: `astropy.modeling.CompoundModel`
+        Initial guess for the model to be fitted.
+    spectrum : :class:`specutils.Spectrum`
+        The spectrum that stores the cube in its 'flux' attribute.
+    fitter : :class: `astropy.modeling.fitting` Object
+        Custom fitter for model.
+    window : `None` or :class:`specutils.spectra.SpectralRegion`
+        See :func:`specutils.fitting.fitmodels.fit_lines`.
+    """
+    def __init__(self, initial_model, spectrum, fitter, window=None, **kwargs):
+        self.initial_model = initial_model
+        self.spectrum = spectrum
+        self.fitter = fitter
+        self.window = window
+        self.kw = kwargs
+
+        # Generate list of all spaxels to be fitted
+        self.spaxels = generate_spaxel_list(spectrum)
+
+        # Fitted parameters are stored in arrays over the spatial grid, the
+        # fitted models are only rebuilt from them when asked for.
+        if spectrum.spectral_axis_index in [2, -1]:
+            grid_shape = spectrum.flux.shape[:2]
+        else:
+            grid_shape = spectrum.flux.shape[1:][::-1]
+        self.fitted_models = CubeFitResults(initial_model, grid_shape)
+
+        self.initial_parameters = None
+        self.warm_start = None
+
+        # Build cube with empty arrays, one per input spaxel. These
+        # will store the flux values corresponding to the fitted
+        # model realization over each spaxel.
+        self.output_flux_cube = np.zeros(shape=spectrum.flux.shape)
+
+    def set_initial_parameters(self, parameters, warm_start):
+        """
+        Start the fit of each spaxel from previously fitted parameters instead of
+        from the initial model.
+
+        Parameters
+        ----------
+        parameters : array
+            Parameters to start from, shaped as `CubeFitResults.parameters`, NaN for
+            spaxels that should start from the initial model.
+        warm_start : array of bool
+            Which parameters (in the order of ``param_names``) start from ``parameters``,
+            the others start from the value in the initial model.
+        """
+        if parameters.shape != self.fitted_models.parameters.shape:
+            raise ValueError(f"initial parameters have shape {parameters.shape}, "
+                             f"expected {self.fitted_models.parameters.shape}")
+        self.initial_parameters = parameters
+        self.warm_start = np.asarray(warm_start, dtype=bool)
+
+    def n_chunks(self, n_chunks):
+        # chunks hold at least one spaxel
+        return max(1, min(n_chunks, len(self.spaxels)))
+
+    def workers(self, n_chunks):
+        """
+        Callables fitting the spaxels of each of ``n_chunks`` chunks (or fewer,
+        if there are fewer spaxels), see `SpaxelWorker`.
+        """
+        spectrum = self.spectrum
+        workers = []
+        for spx in np.array_split(self.spaxels, self.n_chunks(n_chunks)):
+            initial_parameters = None
+            if self.initial_parameters is not None:
+                spx = np.asarray(spx, dtype=int).reshape(-1, 2)
+                initial_parameters = self.initial_parameters[:, spx[:, 0], spx[:, 1]].T
+            workers.append(SpaxelWorker(spectrum.flux,
+                                        spectrum.spectral_axis,
+                                        self.initial_model,
+                                        fitter=self.fitter,
+                                        param_set=spx,
+                                        window=self.window,
+                                        mask=spectrum.mask,
+                                        spectral_axis_index=spectrum.spectral_axis_index,
+                                        initial_parameters=initial_parameters,
+                                        warm_start=self.warm_start,
+                                        **self.kw))
+        return workers
+
+    def collect(self, results):
+        """
+        Collect the results of a `SpaxelWorker` into the fitted parameters and cube.
+        """
+        spectral_axis_index = self.spectrum.spectral_axis_index
+        if results['template'] is not None:
+            # fitted models carry the units of the spectrum, which the
+            # models rebuilt from the stored parameters should have too
+            self.fitted_models.template = results['template']
         for i in range(len(results['x'])):
             x = results['x'][i]
             y = results['y'][i]
-            model = results['fitted_model'][i]
             fitted_values = results['fitted_values'][i]
 
             # Store fitted model parameters
-            fitted_models.append({"x": x, "y": y, "model": model})
+            self.fitted_models.set_spaxel(x, y, results['parameters'][i], results['stds'][i])
 
             # Store fitted values
-            if spectrum.spectral_axis_index in [2, -1]:
-                output_flux_cube[x, y, :] = fitted_values
-            elif spectrum.spectral_axis_index == 0:
-                output_flux_cube[:, y, x] = fitted_values
-
-    # Allow selecting a futures-based streaming backend via
-    # the `use_futures` kwarg. This preserves callback-like
-    # behavior by processing results as each worker finishes.
-    if n_cpu > 1:
-        # Build workers (one per chunk) same as the Pool chunking
-        workers = (
-            SpaxelWorker(spectrum.flux,
-                         spectrum.spectral_axis,
-                         initial_model,
-                         fitter=fitter,
-                         param_set=spx,
-                         window=window,
-                         mask=spectrum.mask,
-                         spectral_axis_index=spectrum.spectral_axis_index,
-                         **kwargs)
-            for spx in np.array_split(spaxels, n_cpu))
-
-        parallelize_calculation(workers, collect_result, n_cpu=n_cpu)
+            if spectral_axis_index in [2, -1]:
+                self.output_flux_cube[x, y, :] = fitted_values
+            elif spectral_axis_index == 0:
+                self.output_flux_cube[:, y, x] = fitted_values
 
-    # This route is only for dev debugging because it is very slow
-    # but exceptions will not get swallowed up by joblib.
-    else:  # pragma: no cover
-        worker = SpaxelWorker(spectrum.flux,
-                              spectrum.spectral_axis,
-                              initial_model,
-                              fitter=fitter,
-                              param_set=spaxels,
-                              window=window,
-                              mask=spectrum.mask,
-                              spectral_axis_index=spectrum.spectral_axis_index,
-                              **kwargs)
-        collect_result(worker())
-
-    # Build output 3D spectrum. Don't need spectral_axis_index because we use the WCS
-    funit = spectrum.flux.unit
-    output_spectrum = Spectrum(wcs=spectrum.wcs,
-                               flux=output_flux_cube * funit,
-                               mask=spectrum.mask)
+    def result(self):
+        """
+        Fitted models and the spectrum of their realization, as returned by `_fit_3D`,
+        from the results collected so far.
+        """
+        # Build output 3D spectrum. Don't need spectral_axis_index because we use the WCS
+        funit = self.spectrum.flux.unit
+        output_spectrum = Spectrum(wcs=self.spectrum.wcs,
+                                   flux=self.output_flux_cube * funit,
+                                   mask=self.spectrum.mask)
 
-    return fitted_models, output_spectrum
+        return self.fitted_models, output_spectrum
 
 
 class SpaxelWorker:
@@ -237,9 +319,14 @@ class SpaxelWorker:
     modify parameter values in an already built CompoundModel
     instance. We need to use the current model instance while
     it still exists.
+
+    If ``initial_parameters`` are given (one row per spaxel in ``param_set``), the
+    parameters selected by ``warm_start`` start from these values instead of from
+    ``initial_model``, for the spaxels where they are finite.
     """
     def __init__(self, flux_cube, wave_array, initial_model, fitter, param_set, window=None,
-                 mask=None, spectral_axis_index=2, **kwargs):
+                 mask=None, spectral_axis_index=2, initial_parameters=None, warm_start=None,
+                 **kwargs):
         self.cube = flux_cube
         self.wave = wave_array
         self.model = initial_model
@@ -248,12 +335,30 @@ class SpaxelWorker:
         self.window = window
         self.mask = mask
         self.spectral_axis_index = spectral_axis_index
+        self.initial_parameters = initial_parameters
+        self.warm_start = warm_start
         self.kw = kwargs
 
+    def _initial_model(self, index):
+        if self.initial_parameters is None or self.warm_start is None:
+            return self.model
+        initial = self.initial_parameters[index][self.warm_start]
+        if not np.all(np.isfinite(initial)):
+            return self.model
+        model = self.model.copy()
+        parameters = np.array(model.parameters, dtype=float)
+        parameters[self.warm_start] = initial
+        model.parameters = parameters
+        return model
+
     def __call__(self):
-        results = {'x': [], 'y': [], 'fitted_model': [], 'fitted_values': []}
+        # Only the parameter values of the fitted models are returned (along with one
+        # of the models as template), which is much lighter to send back from the
+        # worker processes and to keep around than a model instance per spaxel.
+        results = {'x': [], 'y': [], 'parameters': [], 'stds': [], 'fitted_values': [],
+                   'template': None}
 
-        for parameters in self.param_set:
+        for index, parameters in enumerate(self.param_set):
             x = parameters[0]
             y = parameters[1]
 
@@ -284,19 +389,371 @@ class SpaxelWorker:
                 weights = 'unc'
             else:
                 weights = None
-            fitted_model = fit_lines(sp, self.model, fitter=self.fitter, window=self.window,
-                                     weights=weights, **self.kw)
+            fitted_model = fit_lines(sp, self._initial_model(index), fitter=self.fitter,
+                                     window=self.window, weights=weights, **self.kw)
 
             fitted_values = fitted_model(self.wave)
 
+            stds = np.full(len(fitted_model.param_names), np.nan)
+            if getattr(fitted_model, 'stds', None) is not None:
+                for i, name in enumerate(fitted_model.param_names):
+                    if name in fitted_model.stds.param_names:
+                        stds[i] = fitted_model.stds[name]
+
+            if results['template'] is None:
+                results['template'] = fitted_model
             results['x'].append(x)
             results['y'].append(y)
-            results['fitted_model'].append(fitted_model)
+            results['parameters'].append(np.array(fitted_model.parameters, dtype=float))
+            results['stds'].append(stds)
             results['fitted_values'].append(fitted_values)
 
         return results
 
 
+class CubeFitResults:
+    """
+    Parameters of a model fitted to every spaxel of a cube, stored as arrays
+    over the spatial grid of the cube along with a single template model.
+
+    Model instances are only rebuilt from the template when asked for a given
+    spaxel (see `model`), and the parameters can be retrieved as maps over the
+    whole grid (see `parameter_maps`).  Arrays are indexed by the ``(x, y)``
+    coordinates of the spaxels, as in the labels of `FittedModels`.
+
+    Iterating yields a ``{"x": x, "y": y, "model": model}`` dictionary for
+    each fitted spaxel, and the length is the number of fitted spaxels.
+
+    Parameters
+    ----------
+    template : :class: `astropy.modeling.Model`
+        Model with the parameters (and their units) of the fitted models.
+    shape : tuple
+        Shape of the spatial grid, as ``(n_x, n_y)``.
+    """
+    NOT_FITTED = 0
+    FITTED = 1
+
+    def __init__(self, template, shape):
+        self.template = template
+        self.shape = tuple(shape)
+        n_params = len(template.param_names)
+        self.parameters = np.full((n_params,) + self.shape, np.nan)
+        self.stds = np.full((n_params,) + self.shape, np.nan)
+        self.status = np.full(self.shape, self.NOT_FITTED, dtype=np.uint8)
+
+    @property
+    def param_names(self):
+        return self.template.param_names
+
+    @property
+    def units(self):
+        """Units of the parameters (`None` for parameters without units)."""
+        return [getattr(self.template, name).unit for name in self.param_names]
+
+    def set_spaxel(self, x, y, parameters, stds=None):
+        self.parameters[:, x, y] = parameters
+        if stds is not None:
+            self.stds[:, x, y] = stds
+        self.status[x, y] = self.FITTED
+
+    def is_fitted(self, x, y):
+        return (0 <= x < self.shape[0] and 0 <= y < self.shape[1]
+                and self.status[x, y] == self.FITTED)
+
+    def fitted_spaxels(self):
+        """
+        ``(x, y)`` coordinates of the fitted spaxels.
+        """
+        return [(int(x), int(y)) for x, y in np.argwhere(self.status == self.FITTED)]
+
+    def model(self, x, y):
+        """
+        The model fitted to the spaxel at ``(x, y)``, rebuilt from the stored parameters.
+        """
+        if not self.is_fitted(x, y):
+            raise KeyError(f"no model was fitted at ({x}, {y})")
+        model = self.template.copy()
+        model.parameters = self.parameters[:, x, y]
+        return model
+
+    def parameter_maps(self, stds=False):
+        """
+        Maps of the fitted parameters over the spatial grid (NaN where no
+        model was fitted).
+
+        Parameters
+        ----------
+        stds : bool
+            Return the maps of the standard deviations of the parameters instead.
+
+        Returns
+        -------
+        maps : dict
+            Dictionary of `~astropy.units.Quantity` arrays, keyed by parameter name.
+        """
+        values = self.stds if stds else self.parameters
+        return {name: u.Quantity(values[i], unit)
+                for i, (name, unit) in enumerate(zip(self.param_names, self.units))}
+
+    def to_hdulist(self):
+        """
+        Parameter maps as images, with one extension per parameter (and one
+        for its standard deviation), and one for the fit status of each spaxel.
+
+        Returns
+        -------
+        hdulist : `~astropy.io.fits.HDUList`
+        """
+        hdulist = fits.HDUList([fits.PrimaryHDU()])
+        for i, (name, unit) in enumerate(zip(self.param_names, self.units)):
+            for values, extname in ((self.parameters, name), (self.stds, f"{name}_std")):
+                hdu = fits.ImageHDU(values[i], name=extname.upper())
+                if unit is not None:
+                    hdu.header['BUNIT'] = unit.to_string()
+                hdulist.append(hdu)
+        hdulist.append(fits.ImageHDU(self.status, name='STATUS'))
+        return hdulist
+
+    def __iter__(self):
+        for x, y in self.fitted_spaxels():
+            yield {"x": x, "y": y, "model": self.model(x, y)}
+
+    def __len__(self):
+        return int(np.count_nonzero(self.status == self.FITTED))
+
+
+class FittedModels(MutableMapping):
+    """
+    Dictionary of fitted models keyed by label.
+
+    Models fitted to every spaxel of a cube are stored as a `CubeFitResults`,
+    but are exposed as one ``"label (x, y)"`` entry per fitted spaxel, whose
+    model is only rebuilt when accessed.
+    """
+    _spaxel_label = re.compile(r"^(.*) \((\d+), (\d+)\)$")
+
+    def __init__(self):
+        self._models = {}
+        self._cube_results = {}
+
+    @property
+    def cube_results(self):
+        """Dictionary of the `CubeFitResults` of cube fits, keyed by label."""
+        return self._cube_results
+
+    @property
+    def models(self):
+        """Dictionary of the models fitted to 1D spectra, keyed by label."""
+        return self._models
+
+    def _parse(self, key):
+        match = self._spaxel_label.match(key) if isinstance(key, str) else None
+        if match is None or match.group(1) not in self._cube_results:
+            return None
+        return match.group(1), int(match.group(2)), int(match.group(3))
+
+    def __getitem__(self, key):
+        if key in self._models:
+            return self._models[key]
+        spaxel = self._parse(key)
+        if spaxel is not None:
+            label, x, y = spaxel
+            if self._cube_results[label].is_fitted(x, y):
+                return self._cube_results[label].model(x, y)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if isinstance(value, CubeFitResults):
+            self._models.pop(key, None)
+            self._cube_results[key] = value
+        else:
+            self._cube_results.pop(key, None)
+            self._models[key] = value
+
+    def __delitem__(self, key):
+        if key in self._models:
+            del self._models[key]
+        elif key in self._cube_results:
+            del self._cube_results[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in self._models:
+            return True
+        spaxel = self._parse(key)
+        return spaxel is not None and self._cube_results[spaxel[0]].is_fitted(*spaxel[1:])
+
+    def __iter__(self):
+        yield from self._models
+        for label, results in self._cube_results.items():
+            for x, y in results.fitted_spaxels():
+                yield f"{label} ({x}, {y})"
+
+    def __len__(self):
+        return len(self._models) + sum(len(results) for results in self._cube_results.values())
+
+    def select(self, model_label=None, x=None, y=None):
+        """
+        Models with label ``model_label`` (all if `None`), restricted to the spaxels
+        of cube fits at the given ``x`` and/or ``y`` coordinates if any.
+
+        Returns
+        -------
+        selected_models : dict
+            Dictionary of the selected models.
+        """
+        selected_models = {}
+        if x is None and y is None:
+            for label, model in self._models.items():
+                if model_label is None or label.split(" (")[0] == model_label:
+                    selected_models[label] = model
+
+        for label, results in self._cube_results.items():
+            if model_label is not None and label != model_label:
+                continue
+            for sx, sy in results.fitted_spaxels():
+                if (x is None or sx == x) and (y is None or sy == y):
+                    selected_models[f"{label} ({sx}, {sy})"] = results.model(sx, sy)
+
+        return selected_models
+
+
+def fit_fingerprint(spectrum, component_list, expression, fitter_name,
+                    fitter_init_kwargs=None, fitter_call_kwargs=None):
+    """
+    Fingerprint of the inputs of a fit, which identifies fits that would give the
+    same result.
+
+    Parameters
+    ----------
+    spectrum : `~specutils.Spectrum`
+        The spectrum to be fitted (including its mask).
+    component_list : list
+        Model subcomponents, whose class, name, initial parameter values and units,
+        and fixed, bounds and tied constraints are part of the fingerprint.
+    expression : str
+        The arithmetic expression that combines together the model subcomponents.
+    fitter_name : str
+        Name of the fitter class.
+    fitter_init_kwargs, fitter_call_kwargs : dict or `None`
+        Arguments the fitter is instantiated and called with.
+
+    Returns
+    -------
+    fingerprint : str or `None`
+        Hexadecimal digest, or `None` if the data cannot be hashed (in which case
+        the fit should not be cached).
+    """
+    data_hashes = [create_data_hash(spectrum), create_data_hash(spectrum.spectral_axis)]
+    if None in data_hashes:
+        return None
+    uncertainty = getattr(spectrum, 'uncertainty', None)
+    if uncertainty is not None:
+        data_hashes.append(create_data_hash(uncertainty.array))
+
+    hasher = hashlib.blake2b(digest_size=16)
+    for data_hash in data_hashes:
+        hasher.update(f'{data_hash};'.encode())
+    hasher.update(f'expression:{expression};fitter:{fitter_name};'.encode())
+    for kwargs in (fitter_init_kwargs, fitter_call_kwargs):
+        hasher.update(f'{sorted((kwargs or {}).items())!r};'.encode())
+    for component in component_list:
+        units = [str(getattr(component, name).unit) for name in component.param_names]
+        hasher.update(f'{component.__class__.__name__}:{component.name}:'
+                      f'{component.param_names!r}:{np.asarray(component.parameters).tolist()!r}:'
+                      f'{units!r}:{sorted(component.fixed.items())!r}:'
+                      f'{sorted(component.bounds.items())!r}:'
+                      f'{sorted(component.tied.items())!r};'.encode())
+    return hasher.hexdigest()
+
+
+class FitResultCache:
+    """
+    Least-recently-used cache of fit results, keyed by `fit_fingerprint`, bounded
+    both in number of entries and in memory.
+
+    Parameters
+    ----------
+    max_entries : int
+        Maximum number of results to keep.
+    max_bytes : int
+        Maximum (approximate) memory used by the results kept.
+    """
+    def __init__(self, max_entries=32, max_bytes=256 * 1024**2):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._nbytes = 0
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """
+        Cached result for ``key`` (marked as most recently used), or `None`.
+        """
+        if key is None or key not in self._entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def put(self, key, result, nbytes=0):
+        """
+        Cache ``result`` (using about ``nbytes`` of memory) for ``key``, evicting the
+        least recently used results as needed.  Results larger than ``max_bytes`` are
+        not cached.
+        """
+        if key is None or nbytes > self.max_bytes:
+            return
+        if key in self._entries:
+            self._nbytes -= self._entries.pop(key)[1]
+        self._entries[key] = (result, nbytes)
+        self._nbytes += nbytes
+        while len(self._entries) > self.max_entries or self._nbytes > self.max_bytes:
+            self._nbytes -= self._entries.popitem(last=False)[1][1]
+
+    def clear(self):
+        self._entries.clear()
+        self._nbytes = 0
+
+
+def parameter_components(model):
+    """
+    Component and parameter names of each parameter of a (compound) model.
+
+    Parameters
+    ----------
+    model : :class:`astropy.modeling.Model`
+        A model built with `_build_model` (or fitted from one).
+
+    Returns
+    -------
+    names : list
+        ``(component name, parameter name)`` tuples, in the order of ``model.param_names``.
+    """
+    if not hasattr(model, "submodel_names"):
+        return [(model.name, name) for name in model.param_names]
+    names = []
+    for param_name in model.param_names:
+        # parameters of compound models are suffixed with the index of their submodel
+        name, index = param_name.rsplit("_", 1)
+        names.append((model.submodel_names[int(index)], name))
+    return names
+
+
 def _build_model(component_list, expression):
     """
     Builds an astropy CompoundModel from a list of components
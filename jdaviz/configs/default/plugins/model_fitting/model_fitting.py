@@ -1,4 +1,5 @@
 import re
+import multiprocessing as mp
 import numpy as np
 from copy import deepcopy
 
@@ -9,7 +10,13 @@ from specutils.fitting import fit_lines
 from specutils.utils import QuantityModel
 from traitlets import Bool, List, Dict, Any, Unicode, observe
 
-from jdaviz.configs.default.plugins.model_fitting.fitting_backend import fit_model_to_spectrum
+from jdaviz.configs.default.plugins.model_fitting.fitting_backend import (fit_model_to_spectrum,
+                                                                          _build_model,
+                                                                          CubeFitJob,
+                                                                          FittedModels,
+                                                                          FitResultCache,
+                                                                          fit_fingerprint,
+                                                                          parameter_components)
 from jdaviz.configs.default.plugins.model_fitting.initializers import (MODELS,
                                                                        initialize,
                                                                        get_model_parameters)
@@ -33,6 +40,12 @@ from jdaviz.core.custom_units_and_equivs import PIX2
 
 __all__ = ['ModelFitting']
 
+# chunks of spaxels per CPU that cube fits are split into
+CUBE_FIT_CHUNKS_PER_CPU = 4
+# maximum iterations of the global fit that follows the refit of the edited parameters
+# in incremental fits
+INCREMENTAL_POLISH_MAXITER = 20
+
 
 class _EmptyParam:
     def __init__(self, value, unit=None):
@@ -75,12 +88,16 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
     * ``equation`` (:class:`~jdaviz.core.template_mixin.AutoTextField`)
     * :meth:`equation_components`
     * ``add_results`` (:class:`~jdaviz.core.template_mixin.AddResults`)
+    * ``incremental_fit`` (bool)
+      Whether to refit from the results of the previous fit, see :meth:`calculate_fit`.
     * ``residuals_calculate`` (bool)
       Whether to calculate and expose the residuals (model minus data).
     * ``residuals`` (:class:`~jdaviz.core.template_mixin.AutoTextField`)
       Label of the residuals to apply when calling :meth:`calculate_fit` if ``residuals_calculate``
       is ``True``.
     * :meth:`calculate_fit`
+    * :meth:`~jdaviz.core.template_mixin.PluginTemplateMixin.cancel_task`
+      Cancel a cube fit running in the background.
     * :meth:`fitted_models`
     * :meth:`get_models`
     * :meth:`get_model_parameters`
@@ -110,6 +127,7 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
     display_order = Bool(False).tag(sync=True)
 
     cube_fit = Bool(False).tag(sync=True)
+    incremental_fit = Bool(False).tag(sync=True)
 
     # residuals (non-cube fit only)
     residuals_calculate = Bool(False).tag(sync=True)
@@ -131,7 +149,11 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
         self._units = {}  # string representation of display units
         self._fitted_model = None
         self._fitted_spectrum = None
-        self._fitted_models = {}
+        self._fitted_models = FittedModels()
+        # results of 1D fits, so that repeating a fit does not run the fitter again
+        self._fit_cache = FitResultCache()
+        # inputs (and for cubes, results) of the last fits, to refit incrementally
+        self._last_fit_state = {}
         self.component_models = []
         self._initialized_models = {}
         self._display_order = False
@@ -240,6 +262,7 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
         expose = ['dataset']
         if self.config == "cubeviz":
             expose += ['cube_fit']
+        expose += ['incremental_fit']
         expose += ['spectral_subset', 'model_component',
                    'poly_order', 'model_component_label', 'model_components',
                    'valid_model_components', 'create_model_component',
@@ -248,7 +271,7 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
                    'equation', 'equation_components',
                    'add_results', 'residuals_calculate',
                    'residuals']
-        expose += ['calculate_fit', 'clear_table', 'export_table',
+        expose += ['calculate_fit', 'cancel_task', 'clear_table', 'export_table',
                    'fitted_models', 'get_models', 'get_model_parameters', 'fitter_component']
         return PluginUserApi(self, expose=expose)
 
@@ -1008,6 +1031,12 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
     def fitted_models(self):
         """
         Dictionary of all previously fitted models.
+
+        Models fitted to every spaxel of a cube are listed as ``"label (x, y)"``
+        entries but are stored as arrays of parameters, and only rebuilt when
+        accessed.  The arrays themselves are available, by label, in
+        ``fitted_models.cube_results`` (see
+        `~jdaviz.configs.default.plugins.model_fitting.fitting_backend.CubeFitResults`).
         """
         return self._fitted_models
 
@@ -1041,6 +1070,10 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
         if not models:
             models = self.fitted_models
 
+        if isinstance(models, FittedModels):
+            # only rebuild the models of the selected spaxels of cube fits
+            return models.select(model_label=model_label, x=x, y=y)
+
         # Loop through all keys in the dict models
         for label in models:
             # Prevent "Model 2" from being returned when model_label is "Model"
@@ -1101,7 +1134,16 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
             Quantity object represents the parameter value and unit of one of
             spaxel models or the 1d models, respectively.
         """
-        if models and model_label:
+        parameter_maps = {}
+        if models is None and x is None and y is None:
+            # parameter maps of cube fits are read directly from the stored arrays,
+            # without rebuilding the models of every spaxel
+            for label, results in self.fitted_models.cube_results.items():
+                if model_label is None or label == model_label:
+                    parameter_maps[label] = results.parameter_maps()
+            models = {label: model for label, model in self.fitted_models.models.items()
+                      if model_label is None or label.split(" (")[0] == model_label}
+        elif models and model_label:
             models = self.get_models(models=models, model_label=model_label, x=x, y=y)
         elif models is None and model_label:
             models = self.get_models(model_label=model_label, x=x, y=y)
@@ -1205,6 +1247,7 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
                     parameters_cube[key][param_name],
                     param_units[key].get(param_name, None))
 
+        parameters_cube.update(parameter_maps)
         return parameters_cube
 
     def _safe_parameter_names(self, model_cls, model_kwargs):
@@ -1369,7 +1412,7 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
         self.residuals_label_default = self.results_label+" residuals"
 
     @with_spinner()
-    def calculate_fit(self, add_data=True):
+    def calculate_fit(self, add_data=True, background=False):
         """
         Calculate the fit.
 
@@ -1378,6 +1421,20 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
         add_data : bool
             Whether to add the resulting spectrum/cube to the app as a data entry according to
             ``add_results``.
+        background : bool
+            Only used for cube fits.  Whether to fit the cube in the background, in which case
+            the running `~jdaviz.core.tasks.PluginTask` is returned (its ``result()`` waits
+            for the fit), progress is shown in the plugin, the fit can be cancelled with
+            ``cancel_task``, and the results are added to the app once the fit is done.
+
+        Notes
+        -----
+        If ``incremental_fit`` is enabled and the data, subset, equation and fitter are the
+        same as for the previous fit, only the model components edited since then are
+        refitted from scratch.  For a spectrum, the edited free parameters are first fitted
+        with the others held at their previously fitted values, followed by a short
+        global fit of all the free parameters.  For a cube, the fit of each spaxel starts
+        from the parameters previously fitted to that spaxel (except for the edited ones).
 
         Returns
         -------
@@ -1393,7 +1450,7 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
             raise ValueError(f"model equation is invalid: {self.model_equation_invalid_msg}")
 
         if self.cube_fit:
-            ret = self._fit_model_to_cube(add_data=add_data)
+            ret = self._fit_model_to_cube(add_data=add_data, background=background)
         else:
             ret = self._fit_model_to_spectrum(add_data=add_data)
 
@@ -1425,7 +1482,71 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
         return ret
 
     def vue_apply(self, event):
-        self.calculate_fit()
+        # cube fits can take minutes, run them in the background so they can be cancelled
+        self.calculate_fit(background=self.cube_fit)
+
+    def _fit_state_key(self):
+        return (self.dataset_selected, self.spectral_subset_selected, self.model_equation,
+                self.fitter_component.selected, repr(self.fitter_parameters))
+
+    def _component_state(self):
+        return {m["id"]: (m["model_type"],
+                          {p["name"]: (p["value"], p["unit"], p["fixed"])
+                           for p in m["parameters"]})
+                for m in self.component_models}
+
+    def _edited_parameters(self, kind, state_key):
+        """
+        ``(component, parameter)`` names of the parameters edited since the last fit of
+        ``kind`` ('spectrum' or 'cube'), or `None` if the next fit cannot be incremental.
+        """
+        last = self._last_fit_state.get(kind)
+        if not self.incremental_fit or last is None or last['key'] != state_key:
+            return None
+        state = self._component_state()
+        if ({comp: model_type for comp, (model_type, _) in state.items()}
+                != {comp: model_type for comp, (model_type, _) in last['components'].items()}):
+            return None
+        return {(comp, name)
+                for comp, (_, params) in state.items()
+                for name, param in params.items()
+                if param != last['components'][comp][1].get(name)}
+
+    def _fit_incremental(self, spectrum, models_to_fit, edited, init_kw, kw):
+        """
+        Fit the edited free parameters with the others fixed to their current (previously
+        fitted) values, then all the free parameters with few iterations.
+        """
+        def fit(models, **call_kw):
+            return fit_model_to_spectrum(
+                spectrum, models, self.model_equation,
+                fitter=getattr(fitting, self.fitter_component.selected)(**init_kw),
+                run_fitter=True, window=None, n_cpu=self.parallel_n_cpu, **call_kw)
+
+        free = {(m.name, name) for m in models_to_fit
+                for name in m.param_names if not getattr(m, name).fixed}
+        edited = edited & free
+        if edited == free:
+            # all free parameters were edited, there is nothing to start from
+            return fit(models_to_fit, **kw)
+
+        if edited:
+            edited_models = deepcopy(models_to_fit)
+            for m in edited_models:
+                for name in m.param_names:
+                    if (m.name, name) not in edited:
+                        getattr(m, name).fixed = True
+            edited_fit, _ = fit(edited_models, **kw)
+            fitted_values = dict(zip(parameter_components(edited_fit), edited_fit.parameters))
+            for m in models_to_fit:
+                for name in m.param_names:
+                    if (m.name, name) in edited:
+                        getattr(m, name).value = fitted_values[(m.name, name)]
+
+        polish_kw = dict(kw)
+        polish_kw['maxiter'] = min(kw.get('maxiter', INCREMENTAL_POLISH_MAXITER),
+                                   INCREMENTAL_POLISH_MAXITER)
+        return fit(models_to_fit, **polish_kw)
 
     def _fit_model_to_spectrum(self, add_data):
         """
@@ -1529,22 +1650,44 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
                 return fitted_model, fitted_spectrum, mspec - fitted_spectrum
             return fitted_model, fitted_spectrum
         # all other models (besides Spline1D)
-        try:
-            fitted_model, fitted_spectrum = fit_model_to_spectrum(
-                masked_spectrum,
-                models_to_fit,
-                self.model_equation,
-                fitter=getattr(fitting, self.fitter_component.selected)(**init_kw),
-                run_fitter=True,
-                window=None,
-                n_cpu=self.parallel_n_cpu,
-                **kw
-            )
-        except AttributeError as e:
-            msg = SnackbarMessage("Unable to fit: model equation may be invalid",
-                                  color="error", sender=self, traceback=e)
-            self.hub.broadcast(msg)
-            return
+        state_key = self._fit_state_key()
+        edited = self._edited_parameters('spectrum', state_key)
+        if edited is None:
+            fit_key = fit_fingerprint(masked_spectrum, models_to_fit, self.model_equation,
+                                      self.fitter_component.selected, init_kw, kw)
+            cached = self._fit_cache.get(fit_key)
+        else:
+            # incremental fits depend on the previous fit, so are not cached
+            fit_key = cached = None
+
+        if cached is not None:
+            # same data, model and fitter as a previous fit, which gives the same result
+            fitted_model, fitted_spectrum = deepcopy(cached)
+        else:
+            try:
+                if edited is not None:
+                    fitted_model, fitted_spectrum = self._fit_incremental(
+                        masked_spectrum, models_to_fit, edited, init_kw, kw)
+                else:
+                    fitted_model, fitted_spectrum = fit_model_to_spectrum(
+                        masked_spectrum,
+                        models_to_fit,
+                        self.model_equation,
+                        fitter=getattr(fitting, self.fitter_component.selected)(**init_kw),
+                        run_fitter=True,
+                        window=None,
+                        n_cpu=self.parallel_n_cpu,
+                        **kw
+                    )
+            except AttributeError as e:
+                msg = SnackbarMessage("Unable to fit: model equation may be invalid",
+                                      color="error", sender=self, traceback=e)
+                self.hub.broadcast(msg)
+                return
+            if fit_key is not None:
+                self._fit_cache.put(fit_key, deepcopy((fitted_model, fitted_spectrum)),
+                                    nbytes=fitted_spectrum.flux.nbytes
+                                    + fitted_spectrum.spectral_axis.nbytes)
 
         selected_spec = self.dataset.selected_obj
         if '_pixel_scale_factor' in selected_spec.meta:
@@ -1578,11 +1721,15 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
         # as the starting point for cube fitting
         self._update_initialized_parameters()
 
+        # components now hold the fitted values, which the next incremental fit starts from
+        self._last_fit_state['spectrum'] = {'key': state_key,
+                                            'components': self._component_state()}
+
         if self.residuals_calculate:
             return fitted_model, fitted_spectrum, masked_spectrum-fitted_spectrum
         return fitted_model, fitted_spectrum
 
-    def _fit_model_to_cube(self, add_data):
+    def _fit_model_to_cube(self, add_data, background=False):
 
         if self._warn_if_no_equation():
             return
@@ -1655,17 +1802,71 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
               if param['type'] == 'call'}
         init_kw = {param['name']: param['value'] for param in self.fitter_parameters['parameters']
                    if param['type'] == 'init'}
+        initial_model = _build_model(models_to_fit, self.model_equation)
+        job = CubeFitJob(initial_model,
+                         spec,
+                         fitter=getattr(fitting, self.fitter_component.selected)(**init_kw),
+                         window=None,
+                         **kw)
+        results_label = self.results_label
+
+        state_key = self._fit_state_key()
+        components = self._component_state()
+        edited = self._edited_parameters('cube', state_key)
+        if edited is not None:
+            previous = self._last_fit_state['cube']['results']
+            if (previous.parameters.shape == job.fitted_models.parameters.shape
+                    and previous.units == job.fitted_models.units):
+                # start each spaxel from its previous solution, except for the parameters
+                # that were edited (or are fixed to their current value)
+                warm_start = [not getattr(initial_model, name).fixed and comp not in edited
+                              for name, comp in zip(initial_model.param_names,
+                                                    parameter_components(initial_model))]
+                initial_parameters = np.where(previous.status == previous.FITTED,
+                                              previous.parameters, np.nan)
+                job.set_initial_parameters(initial_parameters, warm_start)
+
+        def finalize():
+            fitted_model, fitted_spectrum = job.result()
+
+            self._last_fit_state['cube'] = {'key': state_key, 'components': components,
+                                            'results': fitted_model}
+
+            # Save fitted 3D model parameters in a way that the cubeviz
+            # helper can access them (as "label (x, y)" models).
+            if add_data:
+                self._fitted_models[results_label] = fitted_model
+
+            output_cube = Spectrum(flux=fitted_spectrum.flux, wcs=fitted_spectrum.wcs)
+
+            selected_spec = self.dataset.selected_obj
+            if '_pixel_scale_factor' in selected_spec.meta:
+                output_cube.meta['_pixel_scale_factor'] = selected_spec.meta['_pixel_scale_factor']  # noqa
+
+            # Create new data entry for glue
+            if add_data:
+                self.add_results.add_results_from_plugin(output_cube, label=results_label)
+                self._set_default_results_label()
+
+            snackbar_message = SnackbarMessage(
+                "Finished cube fitting",
+                color='success', loading=False, sender=self)
+            self.hub.broadcast(snackbar_message)
+
+            return fitted_model, output_cube
+
+        n_cpu = self.parallel_n_cpu
+        if n_cpu is None:
+            n_cpu = mp.cpu_count() - 1
+        n_cpu = max(1, n_cpu)
+        # more chunks than workers, so that progress is reported and the fit can be
+        # cancelled while the workers are busy
+        n_chunks = job.n_chunks(n_cpu * CUBE_FIT_CHUNKS_PER_CPU)
         try:
-            fitted_model, fitted_spectrum = fit_model_to_spectrum(
-                spec,
-                models_to_fit,
-                self.model_equation,
-                fitter=getattr(fitting, self.fitter_component.selected)(**init_kw),
-                run_fitter=True,
-                window=None,
-                n_cpu=self.parallel_n_cpu,
-                **kw
-            )
+            return self._run_task(job.workers(n_chunks), collect=job.collect, finalize=finalize,
+                                  n_chunks=n_chunks, n_workers=n_cpu,
+                                  backend='processes' if n_cpu > 1 else 'threads',
+                                  message='Fitting model to cube', background=background)
         except ValueError as e:
             snackbar_message = SnackbarMessage(
                 "Cube fitting failed",
@@ -1673,31 +1874,6 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
             self.hub.broadcast(snackbar_message)
             raise
 
-        # Save fitted 3D model in a way that the cubeviz
-        # helper can access it.
-        if add_data:
-            for m in fitted_model:
-                temp_label = "{} ({}, {})".format(self.results_label, m["x"], m["y"])
-                self._fitted_models[temp_label] = m["model"]
-
-        output_cube = Spectrum(flux=fitted_spectrum.flux, wcs=fitted_spectrum.wcs)
-
-        selected_spec = self.dataset.selected_obj
-        if '_pixel_scale_factor' in selected_spec.meta:
-            output_cube.meta['_pixel_scale_factor'] = selected_spec.meta['_pixel_scale_factor']
-
-        # Create new data entry for glue
-        if add_data:
-            self.add_results.add_results_from_plugin(output_cube)
-            self._set_default_results_label()
-
-        snackbar_message = SnackbarMessage(
-            "Finished cube fitting",
-            color='success', loading=False, sender=self)
-        self.hub.broadcast(snackbar_message)
-
-        return fitted_model, output_cube
-
     def _apply_subset_masks(self, spectrum, subset_component, spatial_axes=None):
         """
         For a spectrum/spectral cube ``spectrum``, add a mask attribute
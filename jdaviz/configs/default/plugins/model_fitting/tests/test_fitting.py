@@ -1,3 +1,4 @@
+import threading
 import warnings
 import os
 # Ensure worker processes inherit the warning filter; set before other imports.
@@ -19,6 +20,7 @@ from traitlets import TraitError
 from jdaviz.configs.default.plugins.model_fitting import fitting_backend as fb
 from jdaviz.configs.default.plugins.model_fitting import initializers
 from jdaviz.core.custom_units_and_equivs import PIX2
+from jdaviz.core.tasks import TaskCancelledError
 from jdaviz.conftest import _create_spectrum1d_cube_with_fluxunit
 
 SPECTRUM_SIZE = 200  # length of spectrum
@@ -209,6 +211,17 @@ def test_parameter_retrieval(cubeviz_helper, spectral_cube_wcs):
         plugin.calculate_fit()
 
     params = cubeviz_helper.plugins['Model Fitting'].get_model_parameters()
+
+    # models are only stored as parameter arrays, and rebuilt when requested
+    fitted_models = plugin.fitted_models
+    assert list(fitted_models.cube_results) == ['model']
+    assert len(fitted_models) == 3 * 4
+    assert 'model (2, 2)' in fitted_models
+    assert 'model (3, 2)' not in fitted_models
+    assert_allclose(fitted_models['model (2, 2)'].slope.value, 1)
+    selected = plugin.get_models(model_label='model', x=2)
+    assert sorted(selected) == ['model (2, 0)', 'model (2, 1)', 'model (2, 2)', 'model (2, 3)']
+
     slope_res = np.zeros((3, 4))
     slope_res[2, 2] = 1.0
 
@@ -266,6 +279,46 @@ def test_fitting_backend(n_cpu, unc):
     assert_allclose(fm.parameters, parameters_expected, atol=1e-5)
 
 
+def test_fit_result_cache():
+    x, y = build_spectrum()
+    spectrum = Spectrum(flux=y*u.Jy, spectral_axis=x*u.um)
+    g = models.Gaussian1D(2.0*u.Jy, 5.55*u.um, 0.3*u.um, name='g')
+
+    key = fb.fit_fingerprint(spectrum, [g], 'g', 'TRFLSQFitter', {}, {'maxiter': 100})
+    assert key == fb.fit_fingerprint(spectrum, [g.copy()], 'g', 'TRFLSQFitter',
+                                     {}, {'maxiter': 100})
+    g_fixed = models.Gaussian1D(2.0*u.Jy, 5.55*u.um, 0.3*u.um, name='g', fixed={'mean': True})
+    masked = Spectrum(flux=y*u.Jy, spectral_axis=x*u.um, mask=x > 9)
+    for other in (fb.fit_fingerprint(spectrum, [g_fixed], 'g', 'TRFLSQFitter',
+                                     {}, {'maxiter': 100}),
+                  fb.fit_fingerprint(masked, [g], 'g', 'TRFLSQFitter', {}, {'maxiter': 100}),
+                  fb.fit_fingerprint(spectrum, [g], 'g', 'LevMarLSQFitter',
+                                     {}, {'maxiter': 100}),
+                  fb.fit_fingerprint(spectrum, [g], 'g', 'TRFLSQFitter', {}, {'maxiter': 50})):
+        assert other != key
+
+    # data that cannot be hashed is not cached
+    zeros = Spectrum(flux=np.zeros_like(y)*u.Jy, spectral_axis=x*u.um)
+    assert fb.fit_fingerprint(zeros, [g], 'g', 'TRFLSQFitter') is None
+
+    cache = fb.FitResultCache(max_entries=2, max_bytes=100)
+    cache.put('a', 1, nbytes=10)
+    cache.put('b', 2, nbytes=10)
+    assert cache.get('a') == 1
+    cache.put('c', 3, nbytes=10)
+    # least recently used entry is evicted
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.put('d', 4, nbytes=85)
+    assert list(cache._entries) == ['c', 'd']
+    assert cache.nbytes == 95
+    cache.put('e', 5, nbytes=101)
+    assert 'e' not in cache
+    cache.put(None, 6)
+    assert len(cache) == 1
+
+
 # For coverage of serial vs multiprocessing and unc
 @pytest.mark.parametrize(
     ('n_cpu', 'unc'), [
@@ -335,8 +388,18 @@ def test_cube_fitting_backend(cubeviz_helper, unc, n_cpu, tmp_path):
             spectrum, model_list, expression, n_cpu=n_cpu)
 
     # Check that parameter results are formatted as expected.
-    assert isinstance(fitted_parameters, list)
+    assert isinstance(fitted_parameters, fb.CubeFitResults)
     assert len(fitted_parameters) == IMAGE_SIZE_X * IMAGE_SIZE_Y
+    assert fitted_parameters.parameters.shape == (10, IMAGE_SIZE_X, IMAGE_SIZE_Y)
+    assert np.all(fitted_parameters.status == fb.CubeFitResults.FITTED)
+    assert_allclose(fitted_parameters.model(3, 2).parameters,
+                    fitted_parameters.parameters[:, 3, 2])
+    maps = fitted_parameters.parameter_maps()
+    assert maps['mean_0'].unit == u.um
+    assert maps['mean_0'].shape == (IMAGE_SIZE_X, IMAGE_SIZE_Y)
+    hdulist = fitted_parameters.to_hdulist()
+    assert len(hdulist) == 1 + 2 * 10 + 1
+    assert hdulist['AMPLITUDE_0'].header['BUNIT'] == 'Jy'
 
     for m in fitted_parameters:
         if m['x'] == 3 and m['y'] == 2:
@@ -557,6 +620,81 @@ def test_cube_fit_with_nans(cubeviz_helper):
     assert mf._obj.component_models[0]['compat_display_units'] is False
 
 
+def test_cube_fit_background(cubeviz_helper):
+    flux = np.ones((7, 8, 9)) * u.nJy
+    cubeviz_helper.load_data(Spectrum(flux=flux, spectral_axis_index=2), data_label="test")
+
+    mf = cubeviz_helper.plugins["Model Fitting"]
+    mf.cube_fit = True
+    mf.create_model_component("Const1D")
+    mf._obj.parallel_n_cpu = 1
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='Model is linear in parameters*')
+        task = mf.calculate_fit(background=True)
+        fitted_models, output_cube = task.result(timeout=60)
+
+    # spaxels are fitted in more chunks than workers, to report progress
+    assert task.n_chunks == 4
+    assert mf._obj.task_progress == 100
+    assert mf._obj.task_running is False
+    assert len(fitted_models) == 7 * 8
+    assert 'model' in cubeviz_helper.app.data_collection
+    assert np.all(cubeviz_helper.app.data_collection['model'].get_component("flux").data == 1)
+
+    # cancelling stops the task before finalizing (which would add the results)
+    release = threading.Event()
+    finalized = []
+    task = mf._obj._run_task([lambda: release.wait(10)] * 3,
+                             finalize=lambda: finalized.append(1), background=True)
+    assert mf._obj.task_running
+    with pytest.raises(ValueError, match='already running a task'):
+        mf.calculate_fit(background=True)
+    mf.cancel_task()
+    release.set()
+    with pytest.raises(TaskCancelledError):
+        task.result(timeout=10)
+    assert finalized == []
+    assert mf._obj.task_running is False
+
+
+def test_cube_fit_incremental(cubeviz_helper, monkeypatch):
+    flux = np.ones((7, 8, 9)) * u.nJy
+    flux[2, 3] = 2 * u.nJy
+    cubeviz_helper.load_data(Spectrum(flux=flux, spectral_axis_index=2), data_label="test")
+
+    mf = cubeviz_helper.plugins["Model Fitting"]
+    mf.cube_fit = True
+    mf.create_model_component("Linear1D", "L")
+    mf._obj.parallel_n_cpu = 1
+    mf.incremental_fit = True
+
+    warm_starts = []
+    set_initial_parameters = fb.CubeFitJob.set_initial_parameters
+
+    def spy(job, parameters, warm_start):
+        warm_starts.append(list(warm_start))
+        assert_allclose(parameters[1, 2, 3], 2)
+        set_initial_parameters(job, parameters, warm_start)
+
+    monkeypatch.setattr(fb.CubeFitJob, 'set_initial_parameters', spy)
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='Model is linear in parameters*')
+        mf.calculate_fit()
+        # nothing to start from on the first fit
+        assert warm_starts == []
+
+        # each spaxel starts from its previous solution, except for the edited parameter
+        mf.set_model_component("L", "slope", value=0.5)
+        mf.add_results.label = 'refit'
+        fitted_models, _ = mf.calculate_fit()
+
+    assert warm_starts == [[False, True]]
+    assert_allclose(fitted_models.parameters[1], np.where(flux[..., 0].value == 2, 2, 1))
+    assert_allclose(fitted_models.parameters[0], 0, atol=1e-10)
+
+
 def test_cube_fit_with_subset_and_nans(cubeviz_helper):
     # Also test with existing mask
     flux = np.ones((7, 8, 9)) * u.nJy
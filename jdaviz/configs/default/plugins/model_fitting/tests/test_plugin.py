@@ -299,6 +299,82 @@ def test_fit_gaussian_with_fixed_mean(specviz_helper, spectrum1d):
     assert not np.allclose((result.amplitude.value, result.stddev.value), (old_amp, old_std))
 
 
+def test_fit_result_cache(specviz_helper, spectrum1d):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        specviz_helper.load_data(spectrum1d)
+    mf = specviz_helper.plugins['Model Fitting']
+
+    mf.create_model_component('Gaussian1D', 'G')
+    initial = {name: param['value']
+               for name, param in mf.get_model_component('G')['parameters'].items()}
+
+    result, _ = mf.calculate_fit()
+    cache = mf._obj._fit_cache
+    assert len(cache) == 1
+    assert cache.hits == 0
+
+    # same initial values (the fit updated them), data and fitter: the fit is not run again
+    for name, value in initial.items():
+        mf.set_model_component('G', name, value=value)
+    mf.add_results.label = 'cached fit'
+    cached_result, cached_spectrum = mf.calculate_fit()
+    assert cache.hits == 1
+    assert len(cache) == 1
+    assert cached_result is not result
+    assert_allclose(cached_result.parameters, result.parameters)
+    assert 'cached fit' in specviz_helper.app.data_collection
+    assert 'cached fit' in mf.fitted_models
+
+    # a different fitter configuration is fitted and cached separately
+    for name, value in initial.items():
+        mf.set_model_component('G', name, value=value)
+    mf.set_model_component('G', 'stddev', fixed=True)
+    mf.calculate_fit(add_data=False)
+    assert cache.hits == 1
+    assert len(cache) == 2
+
+
+def test_incremental_fit(specviz_helper, spectrum1d, monkeypatch):
+    from jdaviz.configs.default.plugins.model_fitting import model_fitting
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        specviz_helper.load_data(spectrum1d)
+    mf = specviz_helper.plugins['Model Fitting']
+
+    mf.create_model_component('Gaussian1D', 'G')
+    full_result, _ = mf.calculate_fit()
+
+    fits = []
+    fit_model_to_spectrum = model_fitting.fit_model_to_spectrum
+
+    def spy(spectrum, component_list, expression, **kwargs):
+        fits.append(({name: getattr(component_list[0], name).fixed
+                      for name in component_list[0].param_names}, kwargs.get('maxiter')))
+        return fit_model_to_spectrum(spectrum, component_list, expression, **kwargs)
+
+    monkeypatch.setattr(model_fitting, 'fit_model_to_spectrum', spy)
+
+    mf.incremental_fit = True
+    stddev = mf.get_model_component('G', 'stddev')['value']
+    mf.set_model_component('G', 'stddev', value=stddev * 1.5)
+    result, _ = mf.calculate_fit()
+
+    # the edited parameter is fitted first, then all of them with few iterations
+    assert fits == [({'amplitude': True, 'mean': True, 'stddev': False}, 100),
+                    ({'amplitude': False, 'mean': False, 'stddev': False},
+                     model_fitting.INCREMENTAL_POLISH_MAXITER)]
+    assert_allclose(result.parameters, full_result.parameters, rtol=1e-3)
+
+    # not incremental: full fit from the initial values
+    fits.clear()
+    mf.incremental_fit = False
+    mf.set_model_component('G', 'stddev', value=stddev * 2)
+    mf.calculate_fit()
+    assert fits == [({'amplitude': False, 'mean': False, 'stddev': False}, 100)]
+
+
 def test_reestimate_parameters(specviz_helper, spectrum1d):
     with warnings.catch_warnings():
         warnings.simplefilter('ignore')
@@ -1,12 +1,14 @@
 import math
 import os
 import warnings
+import weakref
 
 import matplotlib
 import numpy as np
 from functools import cached_property
 from echo import delay_callback
 from astropy.visualization import ManualInterval, ContrastBiasStretch
+from glue.core.component import CoordinateComponent, DerivedComponent
 from glue.core.subset_group import GroupedSubset
 from glue.config import stretches as glue_stretches
 from glue.viewers.histogram.state import HistogramViewerState
@@ -36,6 +38,11 @@ from jdaviz.utils import is_not_wcs_only, cmap_samples, glue_colormaps
 __all__ = ['PlotOptions']
 
 RANDOM_SUBSET_SIZE = 10_000
+# images (and zoom windows) with more pixels than this use a HistogramSketch for the
+# stretch histogram instead of copying the pixels in the window
+HISTOGRAM_SKETCH_MIN_PIXELS = 1_000_000
+# maximum number of sketch samples passed to the stretch histogram
+HISTOGRAM_SKETCH_MAX_SAMPLES = 10 * RANDOM_SUBSET_SIZE
 
 
 class SplineStretch:
@@ -108,6 +115,70 @@ def _round_step(step):
     return float(np.round(step, decimals)), decimals
 
 
+class HistogramSketch:
+    """
+    Uniform random sample of the pixels of a 2D array, indexed by tiles, from
+    which a random sample of the pixels within any rectangular window can be
+    retrieved without copying (or reading) the pixels in the window.
+
+    The samples are sorted by tile (row-major), so the samples of each row of
+    tiles overlapping a window are contiguous and only those are filtered by
+    their exact pixel position.
+
+    Parameters
+    ----------
+    array : array-like
+        2D array to sample.
+    density : int
+        Average number of pixels per sample.  With the default of 64, any window
+        of at least ``HISTOGRAM_SKETCH_MIN_PIXELS`` pixels has on average more than
+        ``RANDOM_SUBSET_SIZE`` samples.
+    tile_size : int
+        Size (in pixels) of the square tiles used to index the samples.
+    seed : int
+        Seed for the random number generator, so the sketch is reproducible.
+    """
+    def __init__(self, array, density=64, tile_size=256, seed=0):
+        ny, nx = array.shape
+        n_samples = max(int(ny * nx / density), 1)
+        rng = np.random.default_rng(seed)
+        y = rng.integers(0, ny, n_samples)
+        x = rng.integers(0, nx, n_samples)
+
+        self.shape = (ny, nx)
+        self.tile_size = tile_size
+        self._n_tiles_x = math.ceil(nx / tile_size)
+        n_tiles = math.ceil(ny / tile_size) * self._n_tiles_x
+        tile = (y // tile_size) * self._n_tiles_x + x // tile_size
+        order = np.argsort(tile, kind='stable')
+        self._y = y[order].astype(np.int32)
+        self._x = x[order].astype(np.int32)
+        self._values = np.asarray(array[self._y, self._x])
+        # samples of tile i are self._values[self._offsets[i]:self._offsets[i+1]]
+        self._offsets = np.searchsorted(tile[order], np.arange(n_tiles + 1))
+
+    def sample(self, y_min, y_max, x_min, x_max):
+        """
+        Return the sampled values within ``[y_min:y_max, x_min:x_max]``.
+        """
+        ny, nx = self.shape
+        y_min, y_max = max(int(y_min), 0), min(int(y_max), ny)
+        x_min, x_max = max(int(x_min), 0), min(int(x_max), nx)
+        if y_min >= y_max or x_min >= x_max:
+            return self._values[:0]
+
+        ts = self.tile_size
+        tx_min, tx_max = x_min // ts, (x_max - 1) // ts
+        chunks = []
+        for ty in range(y_min // ts, (y_max - 1) // ts + 1):
+            start = self._offsets[ty * self._n_tiles_x + tx_min]
+            stop = self._offsets[ty * self._n_tiles_x + tx_max + 1]
+            y, x = self._y[start:stop], self._x[start:stop]
+            in_window = (y >= y_min) & (y < y_max) & (x >= x_min) & (x < x_max)
+            chunks.append(self._values[start:stop][in_window])
+        return np.concatenate(chunks)
+
+
 @tray_registry('g-plot-options', label="Plot Options",
                category='core', sidebar='settings', subtab=0)
 class PlotOptions(PluginTemplateMixin, ViewerSelectMixin):
@@ -488,6 +559,10 @@ class PlotOptions(PluginTemplateMixin, ViewerSelectMixin):
 
         self.layer.filters += [is_not_wcs_only, 'has_wcs_if_image_viewer_pixel_linked']
 
+        # HistogramSketch (and a weak reference to the array it was built from) per
+        # glue component, for the stretch histogram of large images
+        self._stretch_hist_sketches = weakref.WeakKeyDictionary()
+
         self.swatches_palette = [
             ['#FF0000', '#AA0000', '#550000'],
             ['#FFD300', '#AAAA00', '#555500'],
@@ -1137,7 +1212,9 @@ class PlotOptions(PluginTemplateMixin, ViewerSelectMixin):
 
         comp = data.get_component(layer.state.attribute)
 
-        # TODO: further optimization could be done by caching sub_data
+        # for large images, sample the pixels in the window from a HistogramSketch
+        # instead of copying them (sketch_window is y_min, y_max, x_min, x_max)
+        sketch_window = None
         if self.stretch_hist_zoom_limits and (not self.layer_multiselect or len(self.layer_selected) == 1):  # noqa
             if hasattr(viewer, '_get_zoom_limits'):
                 # Viewer limits. This takes account of Imviz linking.
@@ -1149,7 +1226,10 @@ class PlotOptions(PluginTemplateMixin, ViewerSelectMixin):
                 y_min = max(y_limits.min(), 0)
                 y_max = y_limits.max()
 
-                sub_data = comp.data[y_min:y_max, x_min:x_max]
+                if self._use_stretch_hist_sketch(comp, (y_max - y_min) * (x_max - x_min)):
+                    sketch_window = (y_min, y_max, x_min, x_max)
+                else:
+                    sub_data = comp.data[y_min:y_max, x_min:x_max]
 
             else:
                 # spectrum-2d-viewer, for example.  We'll assume the viewer
@@ -1168,10 +1248,25 @@ class PlotOptions(PluginTemplateMixin, ViewerSelectMixin):
 
                 sub_data = comp.data[inds]
 
+        elif self._use_stretch_hist_sketch(comp, np.prod(comp.shape)):
+            sketch_window = (0, comp.shape[0], 0, comp.shape[1])
+
         else:
             # include all data, regardless of zoom limits
             sub_data = comp.data
 
+        if sketch_window is not None:
+            y_min, y_max, x_min, x_max = sketch_window
+            sub_data = self._get_stretch_hist_sketch(comp).sample(*sketch_window)
+            # the samples are in random order within each row of tiles, so taking
+            # every n-th sample keeps a spatially uniform subset
+            step = math.ceil(len(sub_data) / HISTOGRAM_SKETCH_MAX_SAMPLES)
+            sub_data = sub_data[::step]
+            n_pixels = ((min(y_max, comp.shape[0]) - max(y_min, 0))
+                        * (min(x_max, comp.shape[1]) - max(x_min, 0)))
+        else:
+            n_pixels = len(sub_data)
+
         self.stretch_histogram.viewer.state.random_subset = RANDOM_SUBSET_SIZE
         self.stretch_histogram._update_data('histogram', x=sub_data)
 
@@ -1200,13 +1295,30 @@ class PlotOptions(PluginTemplateMixin, ViewerSelectMixin):
                 self.stretch_histogram.viewer.state.hist_x_min = hist_lims[0]
                 self.stretch_histogram.viewer.state.hist_x_max = hist_lims[1]
 
-        self.stretch_histogram.figure.title = f"{len(sub_data)} pixels"
+        self.stretch_histogram.figure.title = f"{n_pixels} pixels"
 
         # update the n_bins since this may be a new layer
         self._histogram_nbins_changed()
         # update the curve/colorbar
         self._update_stretch_curve(msg)
 
+    @staticmethod
+    def _use_stretch_hist_sketch(comp, n_pixels):
+        # derived and coordinate components compute their data on access, so
+        # there is no array to keep a sketch of
+        return (n_pixels > HISTOGRAM_SKETCH_MIN_PIXELS and len(comp.shape) == 2
+                and not isinstance(comp, (DerivedComponent, CoordinateComponent)))
+
+    def _get_stretch_hist_sketch(self, comp):
+        # the sketch is rebuilt if the data of the component was replaced
+        array = comp.data
+        cached = self._stretch_hist_sketches.get(comp)
+        if cached is not None and cached[0]() is array:
+            return cached[1]
+        sketch = HistogramSketch(array)
+        self._stretch_hist_sketches[comp] = (weakref.ref(array), sketch)
+        return sketch
+
     @observe('image_color_mode_value', 'image_color_value', 'image_colormap_value',
              'image_contrast_value', 'image_bias_value',
              'stretch_hist_nbins',
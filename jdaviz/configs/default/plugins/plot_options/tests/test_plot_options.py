@@ -6,7 +6,8 @@ import matplotlib
 from numpy.testing import assert_allclose
 from photutils.datasets import make_4gaussians_image
 
-from jdaviz.configs.default.plugins.plot_options.plot_options import SplineStretch
+from jdaviz.configs.default.plugins.plot_options.plot_options import (
+    HistogramSketch, SplineStretch)
 
 
 @pytest.mark.filterwarnings('ignore')
@@ -147,6 +148,45 @@ def test_stretch_histogram(cubeviz_helper, spectrum1d_cube_with_uncerts):
     po_prevzoom.activate()
 
 
+def test_histogram_sketch():
+    arr = np.arange(600 * 500, dtype=float).reshape(600, 500)
+    sketch = HistogramSketch(arr, density=4, tile_size=64)
+
+    # samples are only drawn from within the window and are roughly uniform
+    for window in [(0, 600, 0, 500), (10, 200, 300, 500), (130, 131, 0, 500), (-5, 70, 490, 600)]:
+        samples = sketch.sample(*window)
+        y, x = np.divmod(samples, 500)
+        y_min, y_max, x_min, x_max = window
+        assert np.all((y >= max(y_min, 0)) & (y < y_max) & (x >= max(x_min, 0)) & (x < x_max))
+        n_pixels = (min(y_max, 600) - max(y_min, 0)) * (min(x_max, 500) - max(x_min, 0))
+        assert abs(len(samples) - n_pixels / 4) < 5 * np.sqrt(n_pixels / 4)
+
+    assert len(sketch.sample(50, 50, 0, 500)) == 0
+
+
+@pytest.mark.filterwarnings('ignore')
+def test_stretch_histogram_sketch(imviz_helper):
+    arr = np.random.default_rng(0).normal(size=(1200, 1000))
+    imviz_helper.load_data(arr, data_label='large')
+    po = imviz_helper.plugins['Plot Options']._obj
+    po.plugin_opened = True
+
+    hist_x = po.stretch_histogram.layers['histogram'].layer.data['x']
+    # the histogram is built from the sketch rather than from all the pixels
+    assert hist_x.size < arr.size / 10
+    assert po.stretch_histogram.figure.title == f"{arr.size} pixels"
+    assert_allclose([po.stretch_histogram.viewer.state.hist_x_min,
+                     po.stretch_histogram.viewer.state.hist_x_max],
+                    np.percentile(arr, [2.5, 97.5]), atol=0.1)
+
+    sketch = list(po._stretch_hist_sketches.values())[0][1]
+    po.stretch_hist_zoom_limits = True
+    po.viewer.selected_obj.state.x_max = 500
+    # zoom windows below the threshold are sliced directly
+    assert po.stretch_histogram.layers['histogram'].layer.data['x'].size > 0
+    assert list(po._stretch_hist_sketches.values())[0][1] is sketch
+
+
 @pytest.mark.filterwarnings('ignore')
 def test_user_api(cubeviz_helper, spectrum1d_cube):
     cubeviz_helper.load_data(spectrum1d_cube)
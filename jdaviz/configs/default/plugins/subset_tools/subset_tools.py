@@ -3,6 +3,7 @@ import warnings
 
 import numpy as np
 
+from astropy.coordinates import concatenate
 from astropy.time import Time
 import astropy.units as u
 from glue.core.message import EditSubsetMessage, SubsetUpdateMessage
@@ -65,6 +66,101 @@ SUBSET_MODES_PRETTY = {
 SUBSET_TO_PRETTY = {v: k for k, v in SUBSET_MODES_PRETTY.items()}
 COMBO_OPTIONS = list(SUBSET_MODES_PRETTY.keys())
 
+_BULK_SKY_REGIONS = (CircleSkyRegion, EllipseSkyRegion, RectangleSkyRegion,
+                     CircleAnnulusSkyRegion)
+_BULK_PIXEL_REGIONS = (CirclePixelRegion, EllipsePixelRegion, RectanglePixelRegion,
+                       CircleAnnulusPixelRegion)
+_APERTURES = (CircularAperture, SkyCircularAperture,
+              EllipticalAperture, SkyEllipticalAperture,
+              RectangularAperture, SkyRectangularAperture,
+              CircularAnnulus, SkyCircularAnnulus)
+
+
+def _local_sky_jacobians(wcs, coords):
+    """
+    Locate sky positions on the pixel grid and linearize the WCS around them,
+    using one vectorized round-trip through the WCS for all positions.
+
+    Returns pixel positions ``x``, ``y`` and an array of shape ``(n, 2, 2)``
+    mapping pixel offsets onto tangent-plane offsets (East, North) in arcsec.
+    """
+    x, y = wcs.world_to_pixel(coords)
+    x = np.atleast_1d(np.asarray(x, dtype=float))
+    y = np.atleast_1d(np.asarray(y, dtype=float))
+    sky0 = wcs.pixel_to_world(x, y)
+    jacobians = np.empty((x.size, 2, 2))
+    for col, (dx, dy) in enumerate(((1, 0), (0, 1))):
+        sky1 = wcs.pixel_to_world(x + dx, y + dy)
+        sep = sky0.separation(sky1).to_value(u.arcsec)
+        pa = sky0.position_angle(sky1).to_value(u.rad)
+        jacobians[:, 0, col] = sep * np.sin(pa)
+        jacobians[:, 1, col] = sep * np.cos(pa)
+    return x, y, jacobians
+
+
+def _bulk_region_shape(region, sky):
+    """
+    Return ``(inner, outer, half_axes, axes)`` describing ``region`` in its
+    native frame (arcsec on the sky or pixels), or `None` if unsupported.
+    """
+    if sky:
+        angle = getattr(region, 'angle', 0 * u.deg).to_value(u.rad)
+        # regions measures sky angles from the longitude axis, which increases
+        # towards the East, i.e., opposite to the conventional image x-axis.
+        axes = np.array([[-np.cos(angle), np.sin(angle)],
+                         [np.sin(angle), np.cos(angle)]])
+
+        def size(q):
+            return q.to_value(u.arcsec)
+    else:
+        angle = getattr(region, 'angle', 0 * u.deg).to_value(u.rad)
+        axes = np.array([[np.cos(angle), np.sin(angle)],
+                         [-np.sin(angle), np.cos(angle)]])
+
+        def size(q):
+            return float(getattr(q, 'value', q))
+
+    if isinstance(region, (CircleSkyRegion, CirclePixelRegion)):
+        return 0., size(region.radius), None, axes
+    elif isinstance(region, (CircleAnnulusSkyRegion, CircleAnnulusPixelRegion)):
+        return size(region.inner_radius), size(region.outer_radius), None, axes
+    elif isinstance(region, (EllipseSkyRegion, EllipsePixelRegion,
+                             RectangleSkyRegion, RectanglePixelRegion)):
+        half_axes = (0.5 * size(region.width), 0.5 * size(region.height))
+        return None, np.hypot(*half_axes), half_axes, axes
+    return None
+
+
+def _rasterize_region(label_image, value, region, x0, y0, jacobian, sky):
+    """
+    Write ``value`` into the pixels of ``label_image`` whose centers fall inside
+    ``region``, linearizing the WCS around the region center via ``jacobian``.
+    Returns the number of pixels written.
+    """
+    inner, outer, half_axes, axes = _bulk_region_shape(region, sky)
+    ny, nx = label_image.shape
+    # Largest pixel extent of the region, from the smallest singular value.
+    half = outer / np.linalg.svd(jacobian, compute_uv=False)[-1]
+    xmin, xmax = max(int(np.ceil(x0 - half)), 0), min(int(np.floor(x0 + half)), nx - 1)
+    ymin, ymax = max(int(np.ceil(y0 - half)), 0), min(int(np.floor(y0 + half)), ny - 1)
+    if xmin > xmax or ymin > ymax:
+        return 0
+
+    yy, xx = np.mgrid[ymin:ymax + 1, xmin:xmax + 1]
+    offsets = np.tensordot(jacobian, np.stack([xx - x0, yy - y0]), axes=1)
+    # Coordinates along the width and height axes of the region.
+    u_off, v_off = np.tensordot(axes, offsets, axes=1)
+    if half_axes is None:
+        r2 = u_off ** 2 + v_off ** 2
+        inside = (r2 <= outer ** 2) & (r2 >= inner ** 2)
+    elif isinstance(region, (EllipseSkyRegion, EllipsePixelRegion)):
+        inside = (u_off / half_axes[0]) ** 2 + (v_off / half_axes[1]) ** 2 <= 1
+    else:
+        inside = (np.abs(u_off) <= half_axes[0]) & (np.abs(v_off) <= half_axes[1])
+
+    label_image[ymin:ymax + 1, xmin:xmax + 1][inside] = value
+    return int(np.count_nonzero(inside))
+
 
 @tray_registry('g-subset-tools', label="Subset Tools",
                category='core', sidebar='subsets')
@@ -90,6 +186,7 @@ class SubsetTools(PluginTemplateMixin, LoadersMixin):
     * :meth:`get_center`
     * :meth:`set_center`
     * :meth:`import_region`
+    * :meth:`import_regions_as_mask`
     * :meth:`get_regions`
     * :meth:`rename_selected`
     * :meth:`rename_subset`
@@ -191,7 +288,7 @@ class SubsetTools(PluginTemplateMixin, LoadersMixin):
         expose = ['subset', 'combination_mode',
                   'recenter_dataset', 'recenter',
                   'get_center', 'set_center',
-                  'import_region', 'get_regions',
+                  'import_region', 'import_regions_as_mask', 'get_regions',
                   'rename_selected', 'rename_subset',
                   'update_subset', 'simplify_subset',
                   'delete_subset']
@@ -1148,6 +1245,153 @@ class SubsetTools(PluginTemplateMixin, LoadersMixin):
             return self._load_regions(region, edit_subset, combination_mode, max_num_regions,
                                       refdata_label, return_bad_regions, subset_label=subset_label)
 
+    def import_regions_as_mask(self, regions, refdata_label=None, subset_label=None,
+                               return_bad_regions=False, region_format=None):
+        """
+        Rasterize many spatial regions at once into a single static masked subset.
+
+        Unlike :meth:`import_region`, which creates one interactive subset per region,
+        all sky regions are located on the pixel grid with a single vectorized WCS
+        call and drawn into one label image, so catalogs of thousands of apertures
+        load in seconds.  Circle, ellipse, rectangle, and circle annulus shapes (and
+        their ``photutils`` aperture equivalents) are rasterized directly, using the
+        local linear approximation of the WCS at each region center; any other shape
+        falls back to ``regions`` mask creation.  A pixel is included if its center
+        falls inside the region.
+
+        Parameters
+        ----------
+        regions : list of region objects, `~regions.Regions`, or str
+            Spatial ``regions`` shapes or ``photutils`` apertures, or a path to a
+            file that `~regions.Regions` can read.
+
+        refdata_label : str or `None`
+            Label of the 2D data defining the pixel grid of the mask and, for sky
+            regions, the WCS.  If `None`, defaults to the reference data in the
+            default viewer.
+
+        subset_label : str or `None`
+            Label of the resulting subset, replacing the default "MaskedSubset [N]"
+            naming scheme.
+
+        return_bad_regions : bool
+            If `True`, also return the regions that failed to load.
+
+        region_format : str or `None`
+            Passed to ``Regions.read(format=region_format)`` if ``regions`` is a path.
+
+        Returns
+        -------
+        label_image : `~numpy.ndarray`
+            Integer image with the same shape as the reference data, where pixels
+            covered by ``regions[i]`` have the value ``i + 1`` and uncovered pixels
+            are 0.  Pixels shared by overlapping regions are assigned to only one of them.
+
+        bad_regions : list of (obj, str)
+            Only if ``return_bad_regions`` is `True`; ``(region, reason)`` tuples for
+            regions that failed to load.
+        """
+        if isinstance(regions, str):
+            regions = Regions.read(regions, format=region_format)
+        elif not isinstance(regions, (list, tuple, Regions)):
+            regions = [regions]
+        regions = list(regions)
+
+        if subset_label is not None:
+            self.app._check_valid_subset_label(subset_label)
+        else:
+            msg_count = _next_subset_num('MaskedSubset', self.app.data_collection.subset_groups)
+            subset_label = f'MaskedSubset {msg_count}'
+
+        if refdata_label is not None:
+            data = self.app.data_collection[refdata_label]
+        else:
+            viewer = self.app.get_viewer(list(self.app._jdaviz_helper.viewers.keys())[0])
+            if getattr(viewer.state, 'reference_data', None) is not None:
+                data = viewer.state.reference_data
+            elif len(viewer.layers):
+                data = viewer.layers[0].layer
+            else:
+                raise ValueError('No reference data found in viewer.')
+        if data.ndim != 2:
+            raise ValueError(f'{data.label} is not 2D; bulk region import requires image data')
+
+        has_wcs = data_has_valid_wcs(data, ndim=2)
+        wcs_linked = getattr(self.app, '_link_type', None) == 'wcs'
+        label_image = np.zeros(data.shape, dtype=np.int32)
+        bad_regions = []
+
+        # Sort regions into the directly rasterized sky and pixel shapes, and the rest.
+        sky_indices, pixel_indices, other_indices = [], [], []
+        for index, region in enumerate(regions):
+            if isinstance(region, _APERTURES):
+                region = regions[index] = aperture2regions(region)
+            if hasattr(region, 'to_pixel'):  # Sky region
+                if not has_wcs:
+                    bad_regions.append((region, 'Sky region provided but data has no valid WCS'))
+                    continue
+            elif wcs_linked:
+                bad_regions.append((region, 'Pixel region provided but data is aligned by WCS'))
+                continue
+            if isinstance(region, _BULK_SKY_REGIONS):
+                sky_indices.append(index)
+            elif isinstance(region, _BULK_PIXEL_REGIONS):
+                pixel_indices.append(index)
+            else:
+                other_indices.append(index)
+
+        if len(sky_indices):
+            centers = concatenate([regions[index].center for index in sky_indices])
+            xs, ys, jacobians = _local_sky_jacobians(data.coords, centers)
+        else:
+            xs = ys = jacobians = []
+        identity = np.eye(2)
+        todo = ([(index, x, y, jac, True)
+                 for index, x, y, jac in zip(sky_indices, xs, ys, jacobians)]
+                + [(index, regions[index].center.x, regions[index].center.y, identity, False)
+                   for index in pixel_indices])
+        for index, x, y, jacobian, sky in todo:
+            if not (np.isfinite(x) and np.isfinite(y) and np.all(np.isfinite(jacobian))):
+                bad_regions.append((regions[index], 'Failed to convert to pixel coordinates'))
+            elif _rasterize_region(label_image, index + 1, regions[index],
+                                   x, y, jacobian, sky) == 0:
+                bad_regions.append((regions[index], 'Region does not cover any pixel'))
+
+        for index in other_indices:
+            region = regions[index]
+            try:
+                if hasattr(region, 'to_pixel'):
+                    region = region.to_pixel(data.coords)
+                im = region.to_mask(mode='center').to_image(data.shape)
+            except Exception as e:  # nosec
+                bad_regions.append((region, f'Failed to load: {repr(e)}'))
+                continue
+            if im is None or not np.any(im):
+                bad_regions.append((region, 'Region does not cover any pixel'))
+                continue
+            label_image[im > 0] = index + 1
+
+        n_loaded = len(regions) - len(bad_regions)
+        if n_loaded > 0:
+            state = MaskSubsetState(label_image > 0, data.pixel_component_ids)
+            self.app.data_collection.new_subset_group(subset_label, state)
+
+        if n_loaded == 0:
+            snack_color = "error"
+        elif len(bad_regions) > 0:
+            snack_color = "warning"
+        else:
+            snack_color = "success"
+        self.app.hub.broadcast(SnackbarMessage(
+            f"Loaded {n_loaded}/{len(regions)} regions into {subset_label}, "
+            f"bad={len(bad_regions)}", color=snack_color,
+            traceback=[(str(bad_region[0]), bad_region[1]) for bad_region in bad_regions],
+            timeout=8000, sender=self.app))
+
+        if return_bad_regions:
+            return label_image, bad_regions
+        return label_image
+
     def _load_regions(self, regions, edit_subset=None, combination_mode=None, max_num_regions=None,
                       refdata_label=None, return_bad_regions=False, subset_label=None, **kwargs):
         """Load given region(s) into the viewer.
@@ -10,8 +10,9 @@ from astropy.tests.helper import assert_quantity_allclose
 from glue.core.edit_subset_mode import ReplaceMode, NewMode
 from glue.core.roi import EllipticalROI, CircularROI, CircularAnnulusROI, RectangularROI
 from numpy.testing import assert_allclose
-from regions import (CircleAnnulusPixelRegion, CirclePixelRegion,
+from regions import (CircleAnnulusPixelRegion, CircleAnnulusSkyRegion, CirclePixelRegion,
                      CircleSkyRegion, CompoundPixelRegion, CompoundSkyRegion,
+                     EllipseSkyRegion, PolygonPixelRegion, RectangleSkyRegion,
                      PixCoord)
 from specutils import SpectralRegion
 
@@ -657,3 +658,49 @@ def test_data_menu_subset_delete(cubeviz_helper, spectrum1d_cube):
     assert (len(cubeviz_helper.viewers['spectrum-viewer'].data_menu.layer.choices) ==
             expected_dm_layer_len)
     assert dm.layer not in cubeviz_helper.viewers['spectrum-viewer'].data_menu.data_labels_loaded
+
+
+def test_import_regions_as_mask(imviz_helper, image_2d_wcs):
+    data = NDData(np.ones((128, 160)) * u.nJy, wcs=image_2d_wcs)
+    imviz_helper.load_data(data, data_label='image')
+    st = imviz_helper.plugins['Subset Tools']
+
+    rng = np.random.default_rng(42)
+    centers = image_2d_wcs.pixel_to_world(rng.uniform(0, 160, 400), rng.uniform(0, 128, 400))
+    sizes = rng.uniform(2, 20, 400) * u.arcsec
+    angles = rng.uniform(0, 180, 400) * u.deg
+    regs = []
+    for i, (center, size, angle) in enumerate(zip(centers, sizes, angles)):
+        if i % 4 == 0:
+            regs.append(CircleSkyRegion(center, size))
+        elif i % 4 == 1:
+            regs.append(EllipseSkyRegion(center, 2 * size, size, angle))
+        elif i % 4 == 2:
+            regs.append(RectangleSkyRegion(center, 2 * size, size, angle))
+        else:
+            regs.append(CircleAnnulusSkyRegion(center, size, 2 * size))
+    regs += [CirclePixelRegion(PixCoord(10.3, 20.7), 4.2),
+             PolygonPixelRegion(PixCoord([1, 20, 5], [1, 3, 30])),
+             CirclePixelRegion(PixCoord(-50, -50), 2)]
+
+    label_image, bad_regions = st.import_regions_as_mask(regs, subset_label='sources',
+                                                         return_bad_regions=True)
+    assert len(bad_regions) == 1
+    assert bad_regions[0][0] is regs[-1]
+
+    expected = np.zeros(data.data.shape, dtype=bool)
+    for reg in regs:
+        pix_reg = reg.to_pixel(image_2d_wcs) if hasattr(reg, 'to_pixel') else reg
+        im = pix_reg.to_mask(mode='center').to_image(data.data.shape)
+        if im is not None:
+            expected |= im > 0
+    np.testing.assert_array_equal(label_image > 0, expected)
+
+    # Per-region identity is kept in the label image.
+    polygon = regs[-2].to_mask(mode='center').to_image(data.data.shape) > 0
+    assert np.all(label_image[polygon] == len(regs) - 1)
+
+    sg = imviz_helper.app.data_collection.subset_groups[0]
+    assert sg.label == 'sources'
+    np.testing.assert_array_equal(sg.subset_state.to_mask(imviz_helper.app.data_collection[0]),
+                                  expected)
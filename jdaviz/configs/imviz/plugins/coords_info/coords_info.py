@@ -1,4 +1,7 @@
 import math
+import threading
+import time
+
 import numpy as np
 from traitlets import Bool, Unicode, observe
 
@@ -9,6 +12,7 @@ from glue_jupyter.bqplot.image.layer_artist import BqplotImageSubsetLayerArtist
 
 from jdaviz.configs.cubeviz.plugins.viewers import CubevizImageView
 from jdaviz.configs.imviz.plugins.viewers import ImvizImageView
+from jdaviz.configs.imviz.wcs_utils import cursor_wcs_approximation
 from jdaviz.configs.mosviz.plugins.viewers import (MosvizImageView,
                                                    MosvizProfile2DView)
 from jdaviz.configs.rampviz.plugins.viewers import RampvizImageView, RampvizProfileView
@@ -62,6 +66,12 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
     row3_text = Unicode("").tag(sync=True)
     row3_unreliable = Bool(False).tag(sync=True)
 
+    # Mouse moves from the frontend are throttled to about the display frame rate. While the
+    # cursor is moving, Imviz uses cached local WCS approximations and the exact values are
+    # shown once the cursor has been still for ``_readout_settle_time`` seconds.
+    _readout_frame_interval = 1 / 60
+    _readout_settle_time = 0.15
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._marks = {}
@@ -69,6 +79,10 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
         self._spectral_axis_index = 2  # Needed for cube data
         self._x, self._y = None, None  # latest known cursor positions
         self.image_unit = None
+        self._readout_lock = threading.Lock()
+        self._readout_event_num = 0  # incremented for each live mouse event
+        self._last_live_update = 0
+        self._settle_timer = None
 
         # subscribe/unsubscribe to mouse events across all existing viewers
         for viewer in self.app._viewer_store.values():
@@ -116,7 +130,7 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
         if isinstance(viewer, self._supported_viewer_classes):
             if isinstance(viewer, self._viewer_classes_with_marker):
                 self._create_marks_for_viewer(viewer)
-            callback = self._viewer_callback(viewer, self._viewer_mouse_event)
+            callback = self._viewer_callback(viewer, self._viewer_mouse_event_live)
             viewer.add_event_callback(callback, events=['mousemove', 'mouseleave', 'mouseenter'])
 
             viewer.state.add_callback('layers', lambda msg: self._layers_changed(viewer))
@@ -209,7 +223,36 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
                 marks.visible = False
         self.app.state.show_toolbar_buttons = True
 
-    def _viewer_mouse_event(self, viewer, data):
+    def _viewer_mouse_event_live(self, viewer, data):
+        # Entry point for mouse events from the frontend, see _readout_frame_interval.
+        with self._readout_lock:
+            self._readout_event_num += 1
+            if self._settle_timer is not None:
+                self._settle_timer.cancel()
+                self._settle_timer = None
+            if data['event'] != 'mousemove':
+                self._viewer_mouse_event(viewer, data)
+                return
+
+            now = time.monotonic()
+            if now - self._last_live_update >= self._readout_frame_interval:
+                self._last_live_update = now
+                self._viewer_mouse_event(viewer, data, approximate=True)
+
+            self._settle_timer = threading.Timer(self._readout_settle_time,
+                                                 self._viewer_mouse_settled,
+                                                 args=(viewer, data, self._readout_event_num))
+            self._settle_timer.daemon = True
+            self._settle_timer.start()
+
+    def _viewer_mouse_settled(self, viewer, data, event_num):
+        with self._readout_lock:
+            # the cursor may have moved again while this was waiting on the lock
+            if event_num == self._readout_event_num:
+                self._settle_timer = None
+                self._viewer_mouse_event(viewer, data)
+
+    def _viewer_mouse_event(self, viewer, data, approximate=False):
         if data['event'] in ('mouseleave', 'mouseenter'):
             self._viewer_mouse_clear_event(viewer, data)
             return
@@ -233,7 +276,7 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
         # update last known cursor position (so another event like a change in layers can update
         # the coordinates with the last known position)
         self._x, self._y = x, y
-        self.update_display(viewer, x=x, y=y)
+        self.update_display(viewer, x=x, y=y, approximate=approximate)
 
     def _layers_changed(self, viewer):
         if self._x is None or self._y is None:
@@ -255,7 +298,7 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
     def vue_next_layer(self, *args, **kwargs):
         self.dataset.select_next()
 
-    def update_display(self, viewer, x, y, mouseevent=True):
+    def update_display(self, viewer, x, y, mouseevent=True, approximate=False):
         self._dict = {}
         if isinstance(viewer, (Spectrum1DViewer, RampvizProfileView)):
             self._spectrum_viewer_update(viewer, x, y, mouseevent=mouseevent)
@@ -265,7 +308,8 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
                          MosvizImageView, MosvizProfile2DView,
                          RampvizImageView)
                         ):
-            self._image_viewer_update(viewer, x, y, mouseevent=mouseevent)
+            self._image_viewer_update(viewer, x, y, mouseevent=mouseevent,
+                                      approximate=approximate)
 
     def _image_shape_inds(self, image):
         # return the indices in image.shape for the x and y dimension, respectively
@@ -294,7 +338,7 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
         else:  # pragma: no cover
             raise ValueError(f'does not support ndim={image.ndim}')
 
-    def _image_viewer_update(self, viewer, x, y, mouseevent=True):
+    def _image_viewer_update(self, viewer, x, y, mouseevent=True, approximate=False):
         # Display the current cursor coordinates (both pixel and world) as
         # well as data values. For now we use the first dataset in the
         # viewer for the data values.
@@ -391,7 +435,7 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
             sky = viewer.state.reference_data.coords.pixel_to_world(cur_x, cur_y).icrs
 
         elif isinstance(viewer, ImvizImageView):
-            x, y, coords_status, (unreliable_world, unreliable_pixel) = viewer._get_real_xy(image, x, y)  # noqa
+            x, y, coords_status, (unreliable_world, unreliable_pixel) = viewer._get_real_xy(image, x, y, approximate=approximate)  # noqa
 
             if unreliable_world or unreliable_pixel:
                 # if the mouseover coords are outside the bounding box of `image`,
@@ -400,7 +444,10 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
 
             if coords_status:
                 try:
-                    sky = image.coords.pixel_to_world(x, y).icrs
+                    if approximate:
+                        sky = cursor_wcs_approximation.pixel_to_world(image.coords, x, y)
+                    else:
+                        sky = image.coords.pixel_to_world(x, y).icrs
                 except Exception:  # WCS might not be celestial
                     coords_status = False
 
@@ -1,3 +1,8 @@
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 from astropy import units as u
 from astropy.wcs.wcsapi import BaseHighLevelWCS
 from glue.core.link_helpers import LinkSame
@@ -7,7 +12,8 @@ from glue.core.message import (
 from glue.core.subset import Subset
 from glue.core.subset_group import GroupedSubset
 from glue.core.component_link import ComponentLink
-from glue.plugins.wcs_autolinking.wcs_autolinking import WCSLink, NoAffineApproximation
+from glue.plugins.wcs_autolinking.wcs_autolinking import (WCSLink, OffsetLink, AffineLink,
+                                                          NoAffineApproximation)
 from glue.viewers.image.state import ImageSubsetLayerState
 from traitlets import List, Unicode, Bool, Dict, observe
 
@@ -29,7 +35,7 @@ from jdaviz.core.user_api import PluginUserApi
 from jdaviz.utils import (get_wcs_only_layer_labels, get_reference_image_data,
                           layer_is_2d, _wcs_only_label)
 
-__all__ = ['Orientation']
+__all__ = ['Orientation', 'WCSLinkCache', 'wcs_link_cache']
 
 orientation_plugin_label = "Orientation"
 base_wcs_layer_label = 'Default orientation'
@@ -620,6 +626,149 @@ def add_wcs_data_to_app(app, data, data_label=None):
                                      sender=app))
 
 
+class WCSLinkCache:
+    """
+    Cache of the affine approximations of WCS links between pairs of images.
+
+    Fitting the affine approximation of a WCS link (see ``wcs_fast_approximation`` in
+    :func:`link_image_data`) means evaluating both WCS at many positions, which adds
+    up when relinking many images after data is added or the orientation changes.
+    The fitted offsets or matrices are kept here, keyed by fingerprints of the WCS and
+    shape of the two images, so that they are reused across relinks (and, with
+    :meth:`save` and :meth:`load`, across sessions).
+
+    The module-level instance ``wcs_link_cache`` is used by :func:`link_image_data`.
+    """
+    # Pixel positions, as fractions of the image shape, at which the WCS is sampled
+    # for its fingerprint.
+    _fingerprint_grid = np.linspace(0, 1, 5)
+
+    def __init__(self):
+        self._transforms = {}
+        self._prefitted = set()  # keys fit by fit_missing but not requested yet
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def fingerprint(cls, data):
+        """
+        Return a string that identifies the WCS and shape of ``data``, computed from
+        the world coordinates at a grid of pixel positions spanning the image.
+        """
+        ny, nx = data.shape[:2]
+        x, y = np.meshgrid(cls._fingerprint_grid * (nx - 1), cls._fingerprint_grid * (ny - 1))
+        world = data.coords.pixel_to_world_values(x.ravel(), y.ravel())
+        sha = hashlib.sha1(np.asarray(data.shape).tobytes())
+        for values in world:
+            sha.update(np.ascontiguousarray(values, dtype=float).tobytes())
+        return sha.hexdigest()
+
+    @property
+    def stats(self):
+        """Dictionary with the number of hits, misses, hit rate, and cached transforms."""
+        n_lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / n_lookups if n_lookups else 0.,
+                'size': len(self._transforms)}
+
+    def clear(self):
+        """Remove all cached transforms and reset the statistics."""
+        self._transforms = {}
+        self._prefitted = set()
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, filename):
+        """Write the cached transforms to a JSON file."""
+        with open(filename, 'w') as f:
+            json.dump({'::'.join(key): [kind, None if params is None else params.tolist()]
+                       for key, (kind, params) in self._transforms.items()}, f)
+
+    def load(self, filename):
+        """Add the transforms from a JSON file written by :meth:`save` to the cache."""
+        with open(filename) as f:
+            transforms = json.load(f)
+        for key, (kind, params) in transforms.items():
+            self._transforms[tuple(key.split('::'))] = (
+                kind, None if params is None else np.asarray(params))
+
+    @staticmethod
+    def _fit(refdata, data):
+        """Fit the affine approximation of the WCS link from ``refdata`` to ``data``."""
+        wcslink = WCSLink(data1=refdata, data2=data,
+                          cids1=refdata.pixel_component_ids, cids2=data.pixel_component_ids)
+        try:
+            link = wcslink.as_affine_link()
+        except NoAffineApproximation:  # pragma: no cover
+            return ('wcs', None), wcslink
+        if isinstance(link, OffsetLink):
+            return ('offset', np.asarray(link.offsets)), link
+        return ('affine', np.asarray(link.matrix)), link
+
+    def _lookup(self, refdata, data):
+        key = (self.fingerprint(refdata), self.fingerprint(data))
+        return key, self._transforms.get(key)
+
+    def fit_missing(self, refdata, datasets, n_cpu=None):
+        """
+        Fit, concurrently in a pool of threads, the links from ``refdata`` to each of
+        ``datasets`` that are not cached yet.  Fits that fail are skipped, so that the
+        error is raised when the link is requested with :meth:`get_link`.
+        """
+        keys = {}
+        for data in datasets:
+            try:
+                key, transform = self._lookup(refdata, data)
+            except Exception:  # nosec
+                continue
+            if transform is None:
+                keys.setdefault(key, data)
+        if len(keys) < 2:
+            # not worth a pool, and get_link will fit a single link anyway
+            return
+
+        def fit(data):
+            try:
+                return self._fit(refdata, data)[0]
+            except Exception:  # nosec
+                return None
+
+        with ThreadPoolExecutor(max_workers=n_cpu) as executor:
+            for key, transform in zip(keys, executor.map(fit, keys.values())):
+                if transform is not None:
+                    self._transforms[key] = transform
+                    self._prefitted.add(key)
+
+    def get_link(self, refdata, data, cids1, cids2):
+        """
+        Return the (approximate, if possible) WCS link from ``refdata`` to ``data``,
+        fitting and caching the affine approximation if it is not cached yet.
+        """
+        key, transform = self._lookup(refdata, data)
+        if transform is None:
+            self.misses += 1
+            transform, link = self._fit(refdata, data)
+            self._transforms[key] = transform
+            return link
+        if key in self._prefitted:
+            # fit just now by fit_missing, so this is not a reuse
+            self._prefitted.discard(key)
+            self.misses += 1
+        else:
+            self.hits += 1
+        kind, params = transform
+        if kind == 'offset':
+            return OffsetLink(data1=refdata, data2=data, cids1=cids1, cids2=cids2,
+                              offsets=params)
+        elif kind == 'affine':
+            return AffineLink(data1=refdata, data2=data, cids1=cids1, cids2=cids2,
+                              matrix=params)
+        return WCSLink(data1=refdata, data2=data, cids1=cids1, cids2=cids2)
+
+
+wcs_link_cache = WCSLinkCache()
+
+
 def link_image_data(app, align_by='pixels', wcs_fallback_scheme=None, wcs_fast_approximation=True,
                     error_on_fail=False):
     """(Re)link loaded data in Imviz with the desired link type.
@@ -773,6 +922,14 @@ def link_image_data(app, align_by='pixels', wcs_fallback_scheme=None, wcs_fast_a
     ids0 = refdata.pixel_component_ids
     ndim_range = range(2)  # We only support 2D
 
+    if align_by == 'wcs' and wcs_fast_approximation:
+        # Fit the links that are not cached yet concurrently, before linking in order below.
+        wcs_link_cache.fit_missing(refdata, [
+            data for i, data in enumerate(app.data_collection)
+            if (i != iref and data not in data_already_linked
+                and data.meta.get('_importer') != 'CatalogImporter'
+                and layer_is_2d(data) and hasattr(data.coords, 'pixel_to_world'))])
+
     for i, data in enumerate(app.data_collection):
 
         # Do not link with self or existing links.
@@ -834,15 +991,10 @@ def link_image_data(app, align_by='pixels', wcs_fallback_scheme=None, wcs_fast_a
             try:
                 if align_by == 'pixels':
                     new_links = [LinkSame(ids0[i], ids1[i]) for i in ndim_range]
-                else:  # wcs
-                    wcslink = WCSLink(data1=refdata, data2=data, cids1=ids0, cids2=ids1)
-                    if wcs_fast_approximation:
-                        try:
-                            new_links = [wcslink.as_affine_link()]
-                        except NoAffineApproximation:  # pragma: no cover
-                            new_links = [wcslink]
-                    else:
-                        new_links = [wcslink]
+                elif wcs_fast_approximation:
+                    new_links = [wcs_link_cache.get_link(refdata, data, ids0, ids1)]
+                else:
+                    new_links = [WCSLink(data1=refdata, data2=data, cids1=ids0, cids2=ids1)]
             except Exception as e:  # pragma: no cover
                 if align_by == 'wcs' and wcs_fallback_scheme == 'pixels':
                     try:
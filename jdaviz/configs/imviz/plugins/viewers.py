@@ -189,7 +189,7 @@ class ImvizImageView(JdavizViewerMixin, BqplotImageView, AstrowidgetsImageViewer
             if layer_is_image_data(data):
                 return data
 
-    def _get_real_xy(self, image, x, y, reverse=False):
+    def _get_real_xy(self, image, x, y, reverse=False, approximate=False):
         """Return real (X, Y) position and status in case of dithering as well as whether the
         results were within the bounding box of the reference data or required possibly inaccurate
         extrapolation.
@@ -200,7 +200,19 @@ class ImvizImageView(JdavizViewerMixin, BqplotImageView, AstrowidgetsImageViewer
         ``reverse=True`` is only for internal roundtripping (e.g., centroiding
         in Subset Tools plugin). Never use this for coordinates display panel.
 
+        ``approximate=True`` uses cached local approximations of the WCS transformation
+        (see `~jdaviz.configs.imviz.wcs_utils.LocalWCSApproximation`) and is only meant
+        for the coordinates display while the cursor is moving.
+
         """
+        if approximate:
+            to_image_pixel = wcs_utils.cursor_wcs_approximation.pixel_to_pixel
+            outside_bounding_box = wcs_utils.cursor_wcs_approximation.outside_bounding_box
+        else:
+            def to_image_pixel(ref_coords, image_coords, x, y):
+                return list(map(float, pixel_to_pixel(ref_coords, image_coords, x, y)))
+            outside_bounding_box = wcs_utils.data_outside_gwcs_bounding_box
+
         # By default we'll assume the coordinates are valid and within any applicable bounding box.
         unreliable_world = False
         unreliable_pixel = False
@@ -217,9 +229,9 @@ class ImvizImageView(JdavizViewerMixin, BqplotImageView, AstrowidgetsImageViewer
                     if not reverse:
                         # Convert X,Y from reference data to the one we are actually seeing.
 
-                        x_image_coords, y_image_coords = list(map(float, pixel_to_pixel(
-                            self.state.reference_data.coords, image.coords, x, y)))
-                        outside_image_bounding_box = wcs_utils.data_outside_gwcs_bounding_box(
+                        x_image_coords, y_image_coords = to_image_pixel(
+                            self.state.reference_data.coords, image.coords, x, y)
+                        outside_image_bounding_box = outside_bounding_box(
                             image, x_image_coords, y_image_coords)
 
                         if outside_image_bounding_box:
@@ -239,7 +251,7 @@ class ImvizImageView(JdavizViewerMixin, BqplotImageView, AstrowidgetsImageViewer
                         x, y = list(map(float, pixel_to_pixel(
                             image.coords, self.state.reference_data.coords, x, y)))
                 else:  # pixels or self
-                    unreliable_world = wcs_utils.data_outside_gwcs_bounding_box(image, x, y)
+                    unreliable_world = outside_bounding_box(image, x, y)
 
                 coords_status = True
             except Exception:
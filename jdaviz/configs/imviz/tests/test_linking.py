@@ -1,4 +1,6 @@
 import warnings
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 from astropy.table import Table
@@ -9,6 +11,7 @@ from numpy.testing import assert_allclose
 from regions import PixCoord, CirclePixelRegion, PolygonPixelRegion
 
 from jdaviz.configs.imviz.helper import get_reference_image_data
+from jdaviz.configs.imviz.plugins.orientation import WCSLinkCache
 from jdaviz.configs.imviz.tests.utils import (
     BaseImviz_WCS_NoWCS, BaseImviz_WCS_WCS, BaseImviz_WCS_GWCS, BaseImviz_GWCS_GWCS)
 
@@ -192,6 +195,38 @@ class TestLink_WCS_WCS(BaseImviz_WCS_WCS, BaseLinkHandler):
         assert self.viewer.get_alignment_method('has_wcs_1[SCI,1]') == 'wcs'
         assert self.viewer.get_alignment_method('has_wcs_2[SCI,1]') == 'wcs'
 
+    def test_wcslink_cache(self, tmp_path):
+        cache = WCSLinkCache()
+        with patch('jdaviz.configs.imviz.plugins.orientation.orientation.wcs_link_cache', cache):
+            self.imviz.link_data(align_by='wcs')
+            stats = cache.stats
+            assert stats['misses'] > 0
+            links = self.imviz.app.data_collection.external_links
+            offsets = [link.offsets for link in links if isinstance(link, OffsetLink)]
+
+            # Relinking reuses the fitted transforms.
+            self.imviz.link_data(align_by='pixels')
+            self.imviz.link_data(align_by='wcs')
+            assert cache.stats['misses'] == stats['misses']
+            assert cache.stats['hits'] == stats['hits'] + 2
+            assert cache.stats['size'] == stats['size']
+            links = self.imviz.app.data_collection.external_links
+            assert all([isinstance(link, OffsetLink) for link in links])
+            assert_allclose([link.offsets for link in links if isinstance(link, OffsetLink)],
+                            offsets)
+
+        # The cache can be stored between sessions.
+        cache.save(tmp_path / 'links.json')
+        new_cache = WCSLinkCache()
+        new_cache.load(tmp_path / 'links.json')
+        assert new_cache._transforms.keys() == cache._transforms.keys()
+        refdata = self.imviz.app.data_collection['Default orientation']
+        data = self.imviz.app.data_collection['has_wcs_2[SCI,1]']
+        link = new_cache.get_link(refdata, data, refdata.pixel_component_ids,
+                                  data.pixel_component_ids)
+        assert new_cache.stats['hits'] == 1
+        assert_allclose(link.offsets, offsets[-1])
+
     # Also test other exception handling here.
 
     def test_invalid_inputs(self):
@@ -278,6 +313,36 @@ class TestLink_WCS_GWCS(BaseImviz_WCS_GWCS):
         viewer2 = self.imviz.create_image_viewer(viewer_name='second')
         viewer2.state.reset_limits()
 
+    def test_live_mouseover(self):
+        self.imviz.link_data(align_by='wcs')
+        label_mouseover = self.imviz._coords_info
+        label_mouseover._readout_settle_time = 0.05
+        label_mouseover._readout_frame_interval = 10  # longer than this test takes
+        event = {'event': 'mousemove', 'domain': {'x': 2, 'y': 3}}
+        label_mouseover._viewer_mouse_event(self.viewer, event)
+        exact_text = label_mouseover.as_text()
+        exact_dict = label_mouseover.as_dict()
+        label_mouseover._viewer_mouse_event_live(
+            self.viewer, {'event': 'mouseleave', 'domain': {'x': None, 'y': None}})
+        assert label_mouseover.as_text() == ('', '', '')
+
+        # First move is shown right away from the local approximation.
+        label_mouseover._last_live_update = 0
+        label_mouseover._viewer_mouse_event_live(self.viewer, event)
+        approx_dict = label_mouseover.as_dict()
+        assert_allclose([approx_dict['world_ra'], approx_dict['world_dec']],
+                        [exact_dict['world_ra'], exact_dict['world_dec']], atol=1e-6)
+
+        # Moves faster than the frame rate are skipped, then shown exactly when settled.
+        label_mouseover._viewer_mouse_event_live(
+            self.viewer, {'event': 'mousemove', 'domain': {'x': 4, 'y': 5}})
+        assert label_mouseover.as_dict()['axes_x'] == 2
+        label_mouseover._settle_timer.join()
+        assert label_mouseover.as_dict()['axes_x'] == 4
+        label_mouseover._viewer_mouse_event_live(self.viewer, event)
+        label_mouseover._settle_timer.join()
+        assert label_mouseover.as_text() == exact_text
+
 
 class TestLink_GWCS_GWCS(BaseImviz_GWCS_GWCS):
 
@@ -79,6 +79,35 @@ def test_hst_acs_flt_wcs():
     assert not result[-1]
 
 
+def test_local_wcs_approximation():
+    w1 = WCS({'CTYPE1': 'RA---TAN', 'CUNIT1': 'deg', 'CDELT1': -0.0002777777778,
+              'CRPIX1': 1, 'CRVAL1': 359.9, 'CTYPE2': 'DEC--TAN', 'CUNIT2': 'deg',
+              'CDELT2': 0.0002777777778, 'CRPIX2': 1, 'CRVAL2': -20.8})
+    w2 = w1.deepcopy()
+    w2.wcs.crpix = [30, -20]
+    w2.wcs.pc = [[0.8, -0.6], [0.6, 0.8]]
+    cache = wcs_utils.LocalWCSApproximation(tile_size=32)
+
+    rng = np.random.default_rng(42)
+    for x, y in rng.uniform(-100, 500, (50, 2)):
+        sky = cache.pixel_to_world(w1, x, y)
+        assert sky.separation(w1.pixel_to_world(x, y)) < cache.sky_tolerance
+        assert_allclose(cache.pixel_to_pixel(w1, w2, x, y),
+                        wcs_utils.pixel_to_pixel(w1, w2, x, y), atol=cache.pixel_tolerance)
+    assert cache.stats['hits'] > 0
+    assert cache.stats['exact'] == 0
+
+    # Tiles that cannot meet the tolerance always use the exact transformation.
+    cache = wcs_utils.LocalWCSApproximation(pixel_tolerance=0, sky_tolerance=0 * u.deg)
+    assert cache.pixel_to_world(w1, 10.3, 20.7) == w1.pixel_to_world(10.3, 20.7)
+    assert cache.pixel_to_pixel(w1, w2, 10.3, 20.7) == tuple(
+        wcs_utils.pixel_to_pixel(w1, w2, 10.3, 20.7))
+    assert cache.stats['exact'] == 2
+
+    cache.clear()
+    assert cache.stats == {'hits': 0, 'misses': 0, 'exact': 0}
+
+
 def test_simple_gwcs():
     # https://gwcs.readthedocs.io/en/latest/#getting-started
     shift_by_crpix = models.Shift(-(2048 - 1) * u.pix) & models.Shift(-(1024 - 1) * u.pix)
@@ -15,7 +15,7 @@ from astropy import coordinates as coord
 from astropy.coordinates import SkyCoord
 from astropy.nddata import NDData
 from astropy.wcs import WCS
-from astropy.wcs.utils import proj_plane_pixel_scales
+from astropy.wcs.utils import pixel_to_pixel, proj_plane_pixel_scales
 
 from gwcs.wcs import WCS as GWCS
 
@@ -285,25 +285,177 @@ def draw_compass_mpl(image, orig_shape=None, wcs=None, show=True, zoom_limits=No
     return base64.b64encode(buff.getvalue()).decode('utf-8')
 
 
-def data_outside_gwcs_bounding_box(data, x, y):
-    """This is for internal use by Imviz coordinates transformation only."""
-    outside_bounding_box = False
-    if getattr(data.coords, 'bounding_box', None) is not None:
-        # then coords is a GWCS object
-        ints = data.coords.bounding_box.intervals
-        if isinstance(ints[0].lower, u.Quantity):
-            bb_xmin = ints[0].lower.value
-            bb_xmax = ints[0].upper.value
-            bb_ymin = ints[1].lower.value
-            bb_ymax = ints[1].upper.value
-        else:  # pragma: no cover
-            bb_xmin = ints[0].lower
-            bb_xmax = ints[0].upper
-            bb_ymin = ints[1].lower
-            bb_ymax = ints[1].upper
-        if not (bb_xmin <= x <= bb_xmax and bb_ymin <= y <= bb_ymax):
-            outside_bounding_box = True  # Has to be Python bool, not Numpy bool_
-    return outside_bounding_box
+def _gwcs_bounding_box_limits(coords):
+    """Return ``(xmin, xmax, ymin, ymax)`` of a GWCS bounding box or `None`."""
+    if getattr(coords, 'bounding_box', None) is None:
+        return None
+    # then coords is a GWCS object
+    ints = coords.bounding_box.intervals
+    if isinstance(ints[0].lower, u.Quantity):
+        return (ints[0].lower.value, ints[0].upper.value,
+                ints[1].lower.value, ints[1].upper.value)
+    else:  # pragma: no cover
+        return ints[0].lower, ints[0].upper, ints[1].lower, ints[1].upper
+
+
+def data_outside_gwcs_bounding_box(data, x, y, limits=None):
+    """This is for internal use by Imviz coordinates transformation only.
+    Pre-computed bounding box ``limits`` may be given to skip reading them from the GWCS.
+    """
+    if limits is None:
+        limits = _gwcs_bounding_box_limits(data.coords)
+    if limits is None:
+        return False
+    bb_xmin, bb_xmax, bb_ymin, bb_ymax = limits
+    # Has to be Python bool, not Numpy bool_
+    return not bool(bb_xmin <= x <= bb_xmax and bb_ymin <= y <= bb_ymax)
+
+
+class LocalWCSApproximation:
+    """Cache of local approximations of WCS transformations for the cursor readout.
+
+    The pixel plane is divided into square tiles. The first time a tile is needed,
+    the exact transformation is evaluated on a 3x3 grid spanning the tile and a
+    quadratic polynomial is fitted to it. The fit is then checked against the exact
+    transformation at four other points inside the tile; if the error exceeds the
+    tolerance anywhere (strong distortion, discontinuities, points outside of
+    a GWCS bounding box, or near a celestial pole), the tile is marked so that the
+    exact transformation is always used there instead.
+
+    This is for internal use by Imviz coordinates display only, while the cursor
+    is moving. The exact transformation is always used once the cursor stops.
+
+    Parameters
+    ----------
+    tile_size : int
+        Size of the square tiles, in pixels.
+    pixel_tolerance : float
+        Maximum error allowed for pixel-to-pixel approximations, in pixels.
+    sky_tolerance : `~astropy.units.Quantity`
+        Maximum angular error allowed for pixel-to-world approximations.
+    max_tiles : int
+        Maximum number of tiles to keep, least recently used tiles are dropped first.
+
+    """
+    _basis_grid = np.array([(dx, dy) for dy in (-0.5, 0, 0.5) for dx in (-0.5, 0, 0.5)])
+    _check_grid = np.array([(dx, dy) for dy in (-0.25, 0.25) for dx in (-0.25, 0.25)])
+
+    def __init__(self, tile_size=64, pixel_tolerance=1e-3, sky_tolerance=1 * u.mas,
+                 max_tiles=4096):
+        self.tile_size = tile_size
+        self.pixel_tolerance = pixel_tolerance
+        self.sky_tolerance = sky_tolerance
+        self.max_tiles = max_tiles
+        self._tiles = {}
+        self._bounding_boxes = {}
+        self.stats = {'hits': 0, 'misses': 0, 'exact': 0}
+
+    def clear(self):
+        """Drop all cached tiles."""
+        self._tiles.clear()
+        self._bounding_boxes.clear()
+        self.stats = {'hits': 0, 'misses': 0, 'exact': 0}
+
+    @staticmethod
+    def _design_matrix(dxy):
+        dx, dy = dxy[:, 0], dxy[:, 1]
+        return np.stack([np.ones_like(dx), dx, dy, dx * dx, dx * dy, dy * dy], axis=-1)
+
+    def _tile(self, key, objs, x, y, fit_func):
+        tx, ty = math.floor(x / self.tile_size), math.floor(y / self.tile_size)
+        center = np.array([(tx + 0.5) * self.tile_size, (ty + 0.5) * self.tile_size])
+        key = (*map(id, objs), key, tx, ty)
+        cached = self._tiles.pop(key, None)
+        # identity check guards against id() reuse after garbage collection
+        if cached is not None and all(a is b for a, b in zip(cached[0], objs)):
+            self.stats['hits'] += 1
+        else:
+            self.stats['misses'] += 1
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                try:
+                    coeffs = fit_func(center)
+                except Exception:
+                    coeffs = None
+            cached = (objs, coeffs)
+            if len(self._tiles) >= self.max_tiles:
+                self._tiles.pop(next(iter(self._tiles)))
+        # dicts preserve insertion order, so re-inserting keeps the most recent at the end
+        self._tiles[key] = cached
+        dxy = (np.array([[x, y]]) - center) / self.tile_size
+        return cached[1], self._design_matrix(dxy)[0]
+
+    def _fit(self, center, exact_func, error_func, tolerance):
+        basis_xy = center + self._basis_grid * self.tile_size
+        check_xy = center + self._check_grid * self.tile_size
+        values = exact_func(np.concatenate([basis_xy, check_xy]))
+        basis_values, check_values = values[:len(basis_xy)], values[len(basis_xy):]
+        coeffs = np.linalg.lstsq(self._design_matrix(self._basis_grid),
+                                 basis_values, rcond=None)[0]
+        predicted = self._design_matrix(self._check_grid) @ coeffs
+        errors = error_func(predicted, check_values)
+        if not np.all(errors <= tolerance):
+            return None
+        return coeffs
+
+    def pixel_to_pixel(self, wcs_from, wcs_to, x, y):
+        """Approximate ``astropy.wcs.utils.pixel_to_pixel(wcs_from, wcs_to, x, y)``
+        for scalar ``x`` and ``y``."""
+        def exact(xy):
+            return np.stack(pixel_to_pixel(wcs_from, wcs_to, xy[:, 0], xy[:, 1]), axis=-1)
+
+        def fit(center):
+            return self._fit(center, exact,
+                             lambda a, b: np.hypot(*(a - b).T),
+                             self.pixel_tolerance)
+
+        coeffs, row = self._tile('pixel', (wcs_from, wcs_to), x, y, fit)
+        if coeffs is None:
+            self.stats['exact'] += 1
+            return tuple(map(float, pixel_to_pixel(wcs_from, wcs_to, x, y)))
+        return tuple(map(float, row @ coeffs))
+
+    def pixel_to_world(self, wcs, x, y):
+        """Approximate ``wcs.pixel_to_world(x, y).icrs`` for scalar ``x`` and ``y``."""
+        def error(predicted, exact):
+            # small-angle separation is plenty for the sub-arcsec tolerances used here
+            coslat = np.cos(np.radians(exact[:, 1]))
+            return np.hypot((predicted[:, 0] - exact[:, 0]) * coslat,
+                            predicted[:, 1] - exact[:, 1]) * u.deg
+
+        def fit(center):
+            lon_zero = []
+
+            def exact(xy):
+                sky = wcs.pixel_to_world(xy[:, 0], xy[:, 1]).icrs
+                # fit longitude offsets from the tile center to avoid the 0/360 wrap
+                lon_zero.append(sky.ra.deg[4])
+                dlon = (sky.ra.deg - lon_zero[0] + 180) % 360 - 180
+                return np.stack([dlon, sky.dec.deg], axis=-1)
+
+            coeffs = self._fit(center, exact, error, self.sky_tolerance)
+            return None if coeffs is None else (coeffs, lon_zero[0])
+
+        fitted, row = self._tile('world', (wcs,), x, y, fit)
+        if fitted is None:
+            self.stats['exact'] += 1
+            return wcs.pixel_to_world(x, y).icrs
+        coeffs, lon_zero = fitted
+        dlon, lat = row @ coeffs
+        return SkyCoord((lon_zero + dlon) % 360, lat, unit='deg', frame='icrs')
+
+    def outside_bounding_box(self, data, x, y):
+        """Cached equivalent of `data_outside_gwcs_bounding_box`."""
+        key = id(data.coords)
+        cached = self._bounding_boxes.get(key)
+        if cached is None or cached[0] is not data.coords:
+            cached = (data.coords, _gwcs_bounding_box_limits(data.coords))
+            self._bounding_boxes[key] = cached
+        return data_outside_gwcs_bounding_box(data, x, y, limits=cached[1])
+
+
+# Shared by all Imviz viewers, since the same WCS objects are usually displayed in several.
+cursor_wcs_approximation = LocalWCSApproximation()
 
 
 def _rotated_wcs(
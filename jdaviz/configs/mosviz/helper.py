@@ -75,6 +75,9 @@ class Mosviz(ConfigHelper, LineListMixin):
 
         self._update_in_progress = False
 
+        # set by the directory parser when loading with lazy=True
+        self._lazy_rows = None
+
         self._initialize_table()
         self._default_visible_columns = []
 
@@ -99,6 +102,11 @@ class Mosviz(ConfigHelper, LineListMixin):
         self._freeze_states_on_row_change = msg.is_locked
 
     def _on_row_selected_begin(self, event):
+        if self._lazy_rows is not None:
+            # read the data for this row from disk (if not already loaded)
+            # before the table viewer sends them to the viewers
+            self._lazy_rows.materialize(event['new'])
+
         self._redshift_cache = self.get_column("Redshift")[event['new']]
 
         if not self._freeze_states_on_row_change:
@@ -117,6 +125,10 @@ class Mosviz(ConfigHelper, LineListMixin):
     def _on_row_selected_end(self, event):
         self._apply_redshift_from_table(value=self._redshift_cache, row=None)
 
+        if self._lazy_rows is not None:
+            self._lazy_rows.evict(keep=(event['new'],))
+            self._lazy_rows.prefetch(event['new'])
+
         if not self._freeze_states_on_row_change:
             return
 
@@ -268,14 +280,20 @@ class Mosviz(ConfigHelper, LineListMixin):
             return sp2_val
 
         table_data = self.app.data_collection['MOS Table']
-        redshifts = np.asarray([_get_sp_attribute(table_data, row, 'redshift', 0)
-                                for row in range(int(table_data.size))])
+        if self._lazy_rows is not None:
+            # avoid reading every row from disk just to check for redshifts
+            redshifts = np.zeros(int(table_data.size))
+        else:
+            redshifts = np.asarray([_get_sp_attribute(table_data, row, 'redshift', 0)
+                                    for row in range(int(table_data.size))])
         self._add_or_update_column(column_name='Redshift', data=redshifts,
                                    show=np.any(redshifts != 0))
 
     def load_data(self, spectra_1d=None, spectra_2d=None, images=None,
                   spectra_1d_label=None, spectra_2d_label=None,
-                  images_label=None, directory=None, instrument=None):
+                  images_label=None, directory=None, instrument=None,
+                  lazy=False, max_resident_rows=10, prefetch_depth=1,
+                  prefetch_max_bytes=None):
         """
         Load and parse a set of MOS spectra and images.
 
@@ -318,6 +336,26 @@ class Mosviz(ConfigHelper, LineListMixin):
 
         instrument : {'niriss', 'nircam', 'nirspec'}, optional
             Required and only used if ``directory`` is specified. Value is not case sensitive.
+
+        lazy : bool, optional
+            Only supported when loading a NIRSpec ``directory``.  If `True`, only
+            the FITS headers are read to populate the table, and the spectra and
+            images for a row are read when that row is first selected.
+
+        max_resident_rows : int, optional
+            Only used if ``lazy`` is `True`.  The maximum number of rows to keep
+            loaded at any given time, with the least recently selected rows
+            removed from the data collection first.
+
+        prefetch_depth : int, optional
+            Only used if ``lazy`` is `True`.  The number of rows before and after
+            the selected row to read in a background thread, so that stepping to
+            them does not wait on disk I/O.  Set to 0 to disable prefetching.
+
+        prefetch_max_bytes : int or None, optional
+            Only used if ``lazy`` is `True`.  The maximum size in bytes of the
+            prefetched data held in memory.  If `None`, only ``prefetch_depth``
+            limits the number of prefetched rows.
         """
         # Link data after everything is loaded
         self.app.auto_link = False
@@ -326,6 +364,9 @@ class Mosviz(ConfigHelper, LineListMixin):
         if isinstance(instrument, str):
             instrument = instrument.lower()
 
+        if lazy and (directory is None or instrument != 'nirspec'):
+            raise NotImplementedError("lazy loading is only supported for NIRSpec directories")
+
         if images is not None and not isinstance(images, (list, tuple)):
             single_image = True
         else:
@@ -340,7 +381,12 @@ class Mosviz(ConfigHelper, LineListMixin):
                         "Ambiguous MOS Instrument: Only JWST NIRSpec, NIRCam, and "
                         f"NIRISS folder parsing are currently supported but got '{instrument}'")
                 if instrument == "nirspec":
-                    super().load_data(directory, parser_reference="mosviz-nirspec-directory-parser")
+                    super().load_data(directory, parser_reference="mosviz-nirspec-directory-parser",
+                                      lazy=lazy, max_resident_rows=max_resident_rows,
+                                      prefetch_depth=prefetch_depth,
+                                      prefetch_max_bytes=prefetch_max_bytes)
+                    # rows are linked as they are loaded
+                    allow_link_table = not lazy
                 else:  # niriss or nircam
                     self.load_jwst_directory(directory, instrument=instrument)
             else:
@@ -909,6 +955,10 @@ class Mosviz(ConfigHelper, LineListMixin):
             raise ValueError(f"row must be between 0 and {len(data_labels)-1}")
 
         data_label = data_labels[row]
+        if self._lazy_rows is not None:
+            self._lazy_rows.materialize(row)
+            self._lazy_rows.evict(keep=(row, self.app.get_viewer(
+                self._default_table_viewer_reference_name).current_row))
         spectra = self.app.data_collection[data_label].get_object()
         if not apply_slider_redshift:
             return spectra
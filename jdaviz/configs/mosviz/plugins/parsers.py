@@ -1,9 +1,13 @@
+from collections import OrderedDict
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, wait
 import csv
 import os
 from pathlib import Path
+import threading
 import warnings
 
+import numpy as np
 from astropy import units as u
 from astropy.io import fits
 from astropy.io.registry import IORegistryError
@@ -18,7 +22,7 @@ from jdaviz.core.registries import data_parser_registry
 from jdaviz.core.events import SnackbarMessage
 from jdaviz.utils import standardize_metadata, PRIHDR_KEY, download_uri_to_path
 
-__all__ = ['mos_spec1d_parser', 'mos_spec2d_parser', 'mos_image_parser']
+__all__ = ['mos_spec1d_parser', 'mos_spec2d_parser', 'mos_image_parser', 'MosvizLazyRows']
 
 FALLBACK_NAME = "Unspecified"
 EXPECTED_FILES = {"niriss": ['1D Spectra C', '1D Spectra R',
@@ -145,14 +149,13 @@ def link_data_in_table(app, data_obj=None):
     app.session.data_collection.add_link(wc_spec_ids)
 
 
-@data_parser_registry("mosviz-nirspec-directory-parser")
-def mos_nirspec_directory_parser(app, data_obj, data_labels=None):
-
+def _find_nirspec_directory_files(level3_path):
+    """
+    Sort the files of a NIRSpec level 3 directory into lists of 1D spectra,
+    2D spectra, and images (if an image subdirectory is present).
+    """
     spectra_1d = []
     spectra_2d = []
-
-    # Load spectra
-    level3_path = Path(data_obj)
     for p in sorted(level3_path.glob('*.fits*')):
         file_path = str(p)
         if 'x1d' in file_path or 'c1d' in file_path:
@@ -160,20 +163,61 @@ def mos_nirspec_directory_parser(app, data_obj, data_labels=None):
         elif 's2d' in file_path:
             spectra_2d.append(file_path)
 
-    n_specs = mos_spec1d_parser(app, spectra_1d)
-    mos_spec2d_parser(app, spectra_2d)
-
-    # Load images, if present
-    image_path = None
-
+    images = []
     # Potential names of subdirectories where images are stored
     for image_dir_name in ("cutouts", "mosviz_cutouts", "images"):
         cur_path = level3_path / image_dir_name
         if cur_path.is_dir():
-            image_path = cur_path
+            images = list(map(str, sorted(cur_path.glob('*.fits*'))))
             break
-    if image_path is not None:
-        images = sorted(image_path.glob('*.fits*'))
+
+    return spectra_1d, spectra_2d, images
+
+
+@data_parser_registry("mosviz-nirspec-directory-parser")
+def mos_nirspec_directory_parser(app, data_obj, data_labels=None, lazy=False,
+                                 max_resident_rows=10, prefetch_depth=1,
+                                 prefetch_max_bytes=None):
+    """
+    Parse a directory of NIRSpec level 3 products (x1d/c1d and s2d files, plus
+    optional cutout images).
+
+    Parameters
+    ----------
+    app : `~jdaviz.app.Application`
+        The application-level object used to reference the viewers.
+    data_obj : str
+        Path to the directory.
+    data_labels : None
+        Not used.
+    lazy : bool, optional
+        If `True`, only the FITS headers are read to populate the MOS table and
+        the spectra and images of a row are only read once that row is
+        selected.  See `MosvizLazyRows`.
+    max_resident_rows : int, optional
+        Only used if ``lazy`` is `True`.  The maximum number of rows to keep
+        loaded in the data collection at any given time.
+    prefetch_depth : int, optional
+        Only used if ``lazy`` is `True`.  The number of rows on either side of
+        the selected row to read in the background.
+    prefetch_max_bytes : int or None, optional
+        Only used if ``lazy`` is `True`.  Memory limit for prefetched rows.
+    """
+    level3_path = Path(data_obj)
+    spectra_1d, spectra_2d, images = _find_nirspec_directory_files(level3_path)
+
+    if lazy:
+        return _mos_nirspec_directory_lazy_parser(app, spectra_1d, spectra_2d, images,
+                                                  max_resident_rows=max_resident_rows,
+                                                  prefetch_depth=prefetch_depth,
+                                                  prefetch_max_bytes=prefetch_max_bytes)
+
+    # Load spectra
+    n_specs = mos_spec1d_parser(app, spectra_1d)
+    mos_spec2d_parser(app, spectra_2d)
+
+    # Load images, if present
+    if len(images):
         n_images = len(images)
 
         # The amount of images needs to be equal to the amount of rows
@@ -185,9 +229,9 @@ def mos_nirspec_directory_parser(app, data_obj, data_labels=None):
                 kwargs = {'share_image': n_specs}
             else:
                 kwargs = {}
-            mos_image_parser(app, str(images[0]), **kwargs)
+            mos_image_parser(app, images[0], **kwargs)
         elif n_images == n_specs:
-            mos_image_parser(app, list(map(str, images)))
+            mos_image_parser(app, images)
         else:
             app.hub.broadcast(SnackbarMessage(
                 "The number of images in this directory does not match the "
@@ -197,6 +241,340 @@ def mos_nirspec_directory_parser(app, data_obj, data_labels=None):
     mos_meta_parser(app)
 
 
+def _header_values(headers, keys, fallback=FALLBACK_NAME):
+    """
+    Return the value of the first of ``keys`` found in any of ``headers``
+    (searched in order), or ``fallback`` if none are found.
+    """
+    if isinstance(keys, str):
+        keys = [keys]
+    for key in keys:
+        for header in headers:
+            if key in header:
+                return header.get(key)
+    return fallback
+
+
+def _scan_headers(filename):
+    """
+    Read the primary and first extension headers of a FITS file without
+    loading any of the data arrays.
+    """
+    headers = []
+    with fits.open(filename) as hdulist:
+        for hdu in hdulist[:2]:
+            headers.append(hdu.header)
+    # search the extension header first, then fall back on the primary header
+    return headers[::-1]
+
+
+def _mos_nirspec_directory_lazy_parser(app, spectra_1d, spectra_2d, images,
+                                       max_resident_rows=10, prefetch_depth=1,
+                                       prefetch_max_bytes=None):
+    n_specs = max(len(spectra_1d), len(spectra_2d))
+    if n_specs == 0:
+        raise ValueError("No valid files found in specified directory")
+    if len(spectra_1d) != len(spectra_2d):
+        raise ValueError("Lazy loading requires the same number of 1D and 2D spectra "
+                         f"but found {len(spectra_1d)} and {len(spectra_2d)}")
+
+    shared_image = None
+    if len(images) == 1:
+        shared_image = images[0]
+        images = []
+    elif len(images) and len(images) != n_specs:
+        app.hub.broadcast(SnackbarMessage(
+            "The number of images in this directory does not match the "
+            "number of spectra 1d and 2d files, please make the "
+            "amounts equal or load images separately.", color='warning', sender=app))
+        images = []
+
+    labels_1d = [f"1D Spectrum {i}" for i in range(n_specs)]
+    labels_2d = [f"2D Spectrum {i}" for i in range(n_specs)]
+    labels_im = [f"Image {i}" for i in range(len(images))]
+
+    rows = []
+    identifiers, filters_gratings, ras, decs = [], [], [], []
+    for i in range(n_specs):
+        row = {'1D Spectra': (labels_1d[i], spectra_1d[i]),
+               '2D Spectra': (labels_2d[i], spectra_2d[i])}
+        if len(images):
+            row['Images'] = (labels_im[i], images[i])
+        rows.append(row)
+
+        headers_1d = _scan_headers(spectra_1d[i])
+        headers_2d = _scan_headers(spectra_2d[i])
+        identifiers.append(_header_values(headers_1d, ['SOURCEID', 'OBJECT']))
+        filters_gratings.append(f"{_header_values(headers_2d, 'FILTER')}/"
+                                f"{_header_values(headers_2d, 'GRATING')}")
+        ras.append(_header_values(headers_1d, 'SRCRA', False))
+        decs.append(_header_values(headers_1d, 'SRCDEC', False))
+
+    with app.data_collection.delay_link_manager_update():
+        _add_to_table(app, labels_1d, '1D Spectra')
+        _add_to_table(app, labels_2d, '2D Spectra')
+
+        if shared_image is not None:
+            app._jdaviz_helper._shared_image = True
+            app.get_viewer(app._jdaviz_helper._default_table_viewer_reference_name)._shared_image = True  # noqa: E501
+            mos_image_parser(app, shared_image, share_image=n_specs)
+        elif len(images):
+            _add_to_table(app, labels_im, 'Images')
+
+        _add_to_table(app, identifiers, "Identifier")
+        _add_to_table(app, filters_gratings, "Filter/Grating")
+        if all(ras) and all(decs):
+            _add_to_table(app, ras, "R.A.")
+            _add_to_table(app, decs, "Dec.")
+        elif len(images):
+            headers_im = [_scan_headers(image) for image in images]
+            _add_to_table(app, [_header_values(h, 'OBJ_RA') for h in headers_im], "R.A.")
+            _add_to_table(app, [_header_values(h, 'OBJ_DEC') for h in headers_im], "Dec.")
+
+    app._jdaviz_helper._lazy_rows = MosvizLazyRows(app, rows,
+                                                   max_resident_rows=max_resident_rows,
+                                                   prefetch_depth=prefetch_depth,
+                                                   prefetch_max_bytes=prefetch_max_bytes)
+    return n_specs
+
+
+def _nbytes(data):
+    """Approximate the size in memory of the arrays of a parsed data object."""
+    if isinstance(data, Data):
+        return sum(data.get_component(cid).data.nbytes for cid in data.components)
+    nbytes = data.flux.nbytes + data.spectral_axis.nbytes
+    if data.uncertainty is not None:
+        nbytes += data.uncertainty.array.nbytes
+    if data.mask is not None:
+        nbytes += np.asarray(data.mask).nbytes
+    return nbytes
+
+
+class MosvizLazyRows:
+    """
+    Bookkeeping for MOS table rows whose spectra and images are only read
+    from disk (and added to the data collection) once the row is needed.
+
+    At most ``max_resident_rows`` rows are kept in the data collection, with
+    the least recently used rows removed first.  The files for the
+    ``prefetch_depth`` rows before and after the selected row are read in a
+    background thread so that they are ready when the user steps to them.
+
+    Parameters
+    ----------
+    app : `~jdaviz.app.Application`
+        The application-level object used to reference the viewers.
+    rows : list of dict
+        For each row in the MOS table, a dictionary mapping the table column
+        ('1D Spectra', '2D Spectra', 'Images') to a tuple of data label and
+        file path.
+    max_resident_rows : int, optional
+        Maximum number of rows to keep loaded at any given time.
+    prefetch_depth : int, optional
+        Number of rows on either side of the selected row to read in the
+        background.  Set to 0 to disable prefetching.
+    prefetch_max_bytes : int or None, optional
+        Maximum size of the prefetched (but not yet selected) data held in
+        memory.  If `None`, only ``prefetch_depth`` limits the prefetched rows.
+    """
+    def __init__(self, app, rows, max_resident_rows=10, prefetch_depth=1,
+                 prefetch_max_bytes=None):
+        if max_resident_rows < 1:
+            raise ValueError("max_resident_rows must be at least 1")
+        if prefetch_depth < 0:
+            raise ValueError("prefetch_depth must be non-negative")
+        self.app = app
+        self.rows = rows
+        self.max_resident_rows = max_resident_rows
+        self.prefetch_depth = prefetch_depth
+        self.prefetch_max_bytes = prefetch_max_bytes
+        # row index -> list of data labels, in least to most recently used order
+        self._resident = OrderedDict()
+        # row index -> Future resolving to {column: data}, in order of submission
+        self._prefetched = OrderedDict()
+        # guards _prefetched, which is also modified when a background read finishes
+        self._prefetch_lock = threading.RLock()
+        self._executor = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def resident_rows(self):
+        """Indices of the rows currently loaded in the data collection."""
+        return list(self._resident.keys())
+
+    def is_resident(self, row):
+        return row in self._resident
+
+    @property
+    def prefetched_rows(self):
+        """Indices of the rows which are read (or being read) in the background."""
+        return list(self._prefetched.keys())
+
+    def _read(self, column, filename):
+        if column == '1D Spectra':
+            try:
+                data = Spectrum.read(filename)
+            except IORegistryError:
+                data = SpectrumList.read(filename)[0]
+            data.meta = standardize_metadata(data.meta)
+        elif column == '2D Spectra':
+            try:
+                data = Spectrum.read(filename)
+            except IORegistryError:
+                with fits.open(filename) as hdulist:
+                    data = _parse_as_spectrum1d(hdulist, 1, False)
+            data.meta = standardize_metadata(data.meta)
+            # TODO: this should not be set to nirspec for all datasets
+            data.meta['INSTRUME'] = 'nirspec'
+        else:
+            data = _load_fits_image_from_filename(filename, self.app)[0]
+        return data
+
+    def _read_row(self, row):
+        return {column: self._read(column, filename)
+                for column, (label, filename) in self.rows[row].items()}
+
+    def prefetch(self, row):
+        """
+        Start reading the rows adjacent to ``row`` (wrapping around the ends of
+        the table, as in the table viewer's next/previous row navigation) in a
+        background thread.  Previously prefetched rows which are no longer
+        adjacent to ``row`` are discarded.
+
+        Parameters
+        ----------
+        row : int
+            Index of the currently selected row in the MOS table.
+        """
+        n_rows = len(self.rows)
+        wanted = []
+        for offset in range(1, self.prefetch_depth + 1):
+            for adjacent_row in ((row + offset) % n_rows, (row - offset) % n_rows):
+                if (adjacent_row != row and adjacent_row not in wanted
+                        and adjacent_row not in self._resident):
+                    wanted.append(adjacent_row)
+
+        with self._prefetch_lock:
+            for stale_row in [r for r in self._prefetched if r not in wanted]:
+                self._prefetched.pop(stale_row).cancel()
+
+            if not len(wanted):
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=2,
+                                                    thread_name_prefix='mosviz-prefetch')
+            for adjacent_row in wanted:
+                if adjacent_row not in self._prefetched:
+                    future = self._executor.submit(self._read_row, adjacent_row)
+                    self._prefetched[adjacent_row] = future
+                    future.add_done_callback(lambda future: self._enforce_prefetch_limit())
+
+    def _enforce_prefetch_limit(self):
+        if self.prefetch_max_bytes is None:
+            return
+        # keep the nearest rows (submitted first) and drop the rest once over the limit
+        with self._prefetch_lock:
+            total = 0
+            for row, future in list(self._prefetched.items()):
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    total += sum(_nbytes(data) for data in future.result().values())
+                    if total > self.prefetch_max_bytes:
+                        self._prefetched.pop(row)
+
+    def wait_for_prefetch(self, timeout=None):
+        """
+        Block until all background reads have finished.
+
+        Parameters
+        ----------
+        timeout : float or None, optional
+            Maximum number of seconds to wait.
+        """
+        with self._prefetch_lock:
+            futures = list(self._prefetched.values())
+        if len(futures):
+            wait(futures, timeout=timeout)
+            # the limit is also enforced as each read finishes, but that callback
+            # may not have run yet when the futures are marked as done
+            self._enforce_prefetch_limit()
+
+    def materialize(self, row):
+        """
+        Ensure all data for ``row`` are loaded into the data collection, and
+        mark the row as most recently used.
+
+        Parameters
+        ----------
+        row : int
+            Index of the row in the MOS table.
+
+        Returns
+        -------
+        data_labels : list of str
+            Labels of the data entries associated with the row.
+        """
+        if row in self._resident:
+            self._resident.move_to_end(row)
+            return self._resident[row]
+
+        dc = self.app.data_collection
+        labels = []
+        prefetched = {}
+        with self._prefetch_lock:
+            future = self._prefetched.pop(row, None)
+        if future is not None and not future.cancelled():
+            try:
+                prefetched = future.result()
+            except Exception:
+                # fall back on reading the files again below, which will
+                # raise the error in the main thread if it persists
+                prefetched = {}
+        # Links between rows are handled here instead of by the app, which
+        # would otherwise link against the first data in the collection.
+        auto_link, self.app.auto_link = self.app.auto_link, False
+        try:
+            with dc.delay_link_manager_update():
+                for column, (label, filename) in self.rows[row].items():
+                    if label not in dc.labels:
+                        data = prefetched.get(column)
+                        if data is None:
+                            data = self._read(column, filename)
+                        data.meta['mosviz_row'] = row
+                        self.app.add_data(data, label, notify_done=False)
+                    labels.append(label)
+
+                if '1D Spectra' in self.rows[row] and '2D Spectra' in self.rows[row]:
+                    wc_spec_1d = dc[self.rows[row]['1D Spectra'][0]].world_component_ids
+                    wc_spec_2d = dc[self.rows[row]['2D Spectra'][0]].world_component_ids
+                    dc.add_link(LinkSameWithUnits(wc_spec_1d[0], wc_spec_2d[1]))
+        finally:
+            self.app.auto_link = auto_link
+
+        self._resident[row] = labels
+        return labels
+
+    def evict(self, keep=()):
+        """
+        Remove the least recently used rows from the data collection until at
+        most ``max_resident_rows`` rows remain loaded.
+
+        Parameters
+        ----------
+        keep : iterable of int, optional
+            Rows which should not be removed, regardless of when they were
+            last used.
+        """
+        dc = self.app.data_collection
+        candidates = [row for row in self._resident if row not in keep]
+        while len(self._resident) > self.max_resident_rows and len(candidates):
+            row = candidates.pop(0)
+            for label in self._resident.pop(row):
+                if label in dc.labels:
+                    dc.remove(dc[label])
+
+
 @data_parser_registry("mosviz-spec1d-parser")
 def mos_spec1d_parser(app, data_obj, data_labels=None,
                       table_viewer_reference_name='table-viewer'):
@@ -307,31 +685,6 @@ def mos_spec2d_parser(app, data_obj, data_labels=None, add_to_table=True,
         getattr(app._jdaviz_helper, '_default_table_viewer_reference_name', None)
     )
 
-    # Note: This is also used by Specviz2D
-    def _parse_as_spectrum1d(hdulist, ext, transpose):
-        # Parse as a FITS file and assume the WCS is correct
-        data = hdulist[ext].data
-        header = hdulist[ext].header
-        metadata = standardize_metadata(header)
-        metadata[PRIHDR_KEY] = standardize_metadata(hdulist[0].header)
-        wcs = WCS(header, hdulist)
-        if transpose:
-            data = data.T
-            wcs = wcs.swapaxes(0, 1)
-
-        try:
-            data_unit = u.Unit(header['BUNIT'])
-        except Exception:
-            data_unit = u.count
-
-        # FITS WCS is invalid, so ignore it.
-        if wcs.spectral.naxis == 0:
-            kw = {}
-        else:
-            kw = {'wcs': wcs}
-
-        return Spectrum(flux=data * data_unit, meta=metadata, **kw)
-
     # Coerce into list-like object
     if (not isinstance(data_obj, (list, tuple, SpectrumCollection)) or
             isinstance(data_obj, fits.HDUList)):
@@ -403,6 +756,32 @@ def mos_spec2d_parser(app, data_obj, data_labels=None, add_to_table=True,
     return len(data_obj)
 
 
+# Note: This is also used by Specviz2D
+def _parse_as_spectrum1d(hdulist, ext, transpose):
+    # Parse as a FITS file and assume the WCS is correct
+    data = hdulist[ext].data
+    header = hdulist[ext].header
+    metadata = standardize_metadata(header)
+    metadata[PRIHDR_KEY] = standardize_metadata(hdulist[0].header)
+    wcs = WCS(header, hdulist)
+    if transpose:
+        data = data.T
+        wcs = wcs.swapaxes(0, 1)
+
+    try:
+        data_unit = u.Unit(header['BUNIT'])
+    except Exception:
+        data_unit = u.count
+
+    # FITS WCS is invalid, so ignore it.
+    if wcs.spectral.naxis == 0:
+        kw = {}
+    else:
+        kw = {'wcs': wcs}
+
+    return Spectrum(flux=data * data_unit, meta=metadata, **kw)
+
+
 def _load_fits_image_from_filename(filename, app):
     with fits.open(filename) as hdulist:
         # We do not use the generated labels
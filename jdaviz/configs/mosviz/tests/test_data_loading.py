@@ -3,6 +3,7 @@
 from zipfile import ZipFile
 
 import numpy as np
+from astropy import units as u
 import pytest
 from astropy.nddata import CCDData
 from specutils import Spectrum
@@ -258,3 +259,91 @@ def test_invalid_inputs(mosviz_helper):
 
     with pytest.raises(NotImplementedError, match="Please set valid values"):
         mosviz_helper.load_data()
+
+
+def _write_nirspec_directory(path, n_rows):
+    from astropy.io import fits
+
+    for i in range(n_rows):
+        spec = Spectrum(flux=np.random.random(10) * u.Jy,
+                        spectral_axis=np.linspace(1, 2, 10) * u.um)
+        spec.write(path / f"source{i}_x1d.fits", format="tabular-fits")
+        with fits.open(path / f"source{i}_x1d.fits", mode="update") as hdulist:
+            hdulist[0].header['SOURCEID'] = f"source{i}"
+
+        prihdr = fits.Header({'FILTER': 'F170LP', 'GRATING': 'G235M'})
+        hdr = fits.Header({'BUNIT': 'Jy', 'CTYPE1': 'WAVE', 'CUNIT1': 'um',
+                           'CRPIX1': 1, 'CRVAL1': 1, 'CDELT1': 0.1,
+                           'CTYPE2': 'OFFSET', 'CRPIX2': 1, 'CRVAL2': 0, 'CDELT2': 1})
+        fits.HDUList([fits.PrimaryHDU(header=prihdr),
+                      fits.ImageHDU(np.random.random((5, 10)), header=hdr, name='SCI')]
+                     ).writeto(path / f"source{i}_s2d.fits")
+
+
+def test_lazy_nirspec_directory(mosviz_helper, tmp_path):
+    _write_nirspec_directory(tmp_path, 4)
+
+    mosviz_helper.load_data(directory=tmp_path, instrument="nirspec",
+                            lazy=True, max_resident_rows=2)
+
+    dc = mosviz_helper.app.data_collection
+    lazy_rows = mosviz_helper._lazy_rows
+    assert len(lazy_rows) == 4
+    # only the first (selected) row is loaded
+    assert lazy_rows.resident_rows == [0]
+    assert dc.labels == ['MOS Table', '1D Spectrum 0', '2D Spectrum 0']
+
+    qtable = mosviz_helper.to_table()
+    assert len(qtable) == 4
+    assert list(qtable['Identifier']) == [f"source{i}" for i in range(4)]
+    assert np.all(qtable['Filter/Grating'] == 'F170LP/G235M')
+
+    table = mosviz_helper.app.get_viewer(mosviz_helper._default_table_viewer_reference_name)
+    table.select_row(1)
+    assert lazy_rows.resident_rows == [0, 1]
+    spec_viewer = mosviz_helper.app.get_viewer('spectrum-viewer')
+    assert [layer.layer.label for layer in spec_viewer.layers] == ['1D Spectrum 1']
+
+    # the least recently used row is removed from the data collection
+    table.select_row(3)
+    assert lazy_rows.resident_rows == [1, 3]
+    assert '1D Spectrum 0' not in dc.labels
+
+    sp = mosviz_helper.get_spectrum_1d(row=2, apply_slider_redshift=False)
+    assert isinstance(sp, Spectrum)
+    assert lazy_rows.resident_rows == [3, 2]
+    assert dc['1D Spectrum 2'].meta['mosviz_row'] == 2
+
+    with pytest.raises(NotImplementedError, match="lazy loading is only supported"):
+        mosviz_helper.load_data(spectra_1d=sp, lazy=True)
+
+
+def test_lazy_nirspec_directory_prefetch(mosviz_helper, tmp_path):
+    _write_nirspec_directory(tmp_path, 5)
+
+    mosviz_helper.load_data(directory=tmp_path, instrument="nirspec",
+                            lazy=True, prefetch_depth=1)
+
+    lazy_rows = mosviz_helper._lazy_rows
+    lazy_rows.wait_for_prefetch()
+    # adjacent rows wrap around the ends of the table
+    assert lazy_rows.resident_rows == [0]
+    assert lazy_rows.prefetched_rows == [1, 4]
+
+    table = mosviz_helper.app.get_viewer(mosviz_helper._default_table_viewer_reference_name)
+    table.next_row()
+    lazy_rows.wait_for_prefetch()
+    assert lazy_rows.resident_rows == [0, 1]
+    # row 4 is no longer adjacent and row 0 is already loaded
+    assert lazy_rows.prefetched_rows == [2]
+    assert mosviz_helper.app.data_collection['2D Spectrum 1'].meta['mosviz_row'] == 1
+
+    # a memory limit smaller than a single row disables prefetching
+    lazy_rows.prefetch_max_bytes = 1
+    table.next_row()
+    lazy_rows.wait_for_prefetch()
+    assert lazy_rows.resident_rows == [0, 1, 2]
+    assert lazy_rows.prefetched_rows == []
+
+    with pytest.raises(ValueError, match="prefetch_depth must be non-negative"):
+        type(lazy_rows)(mosviz_helper.app, lazy_rows.rows, prefetch_depth=-1)
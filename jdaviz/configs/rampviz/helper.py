@@ -1,3 +1,4 @@
+from astropy.nddata import NDDataArray
 from astropy.utils.decorators import deprecated
 from numbers import Number
 
@@ -25,6 +26,8 @@ class Rampviz(CubeConfigHelper):
         super().__init__(*args, **kwargs)
 
         self.cube_cache = {}
+        # data label -> RampIntegrations of the loaded ramp and diff cubes
+        self.ramp_integrations = {}
         self.load = self._load
 
     @deprecated(since="4.5", alternative="load")
@@ -83,6 +86,43 @@ class Rampviz(CubeConfigHelper):
         msg = SliceSelectSliceMessage(value=int(group_index), sender=self)
         self.app.hub.broadcast(msg)
 
+    def select_integration(self, integration, data_label=None):
+        """
+        Show another integration of a loaded ramp file in the group and diff viewers.
+
+        The ramp and diff cubes are updated in place (so subsets, viewer settings,
+        and auto-updating plugin results are kept). Integrations are read from the file
+        on demand and the most recently selected ones are kept in memory.
+
+        Parameters
+        ----------
+        integration : int
+            Index of the integration to show.
+        data_label : str or `None`
+            Label of the ramp (or diff) cube. Defaults to the loaded ramp cube.
+        """
+        if data_label is None:
+            if self._loaded_flux_cube is None:
+                raise ValueError("no ramp is loaded")
+            data_label = self._loaded_flux_cube.label
+        if data_label not in self.ramp_integrations:
+            raise ValueError(f"{data_label} is not a loaded ramp cube")
+        integrations = self.ramp_integrations[data_label]
+        ramp_data, diff_data = integrations[integration]
+
+        labels = [label for label, other in self.ramp_integrations.items()
+                  if other is integrations and label in self.app.data_collection.labels]
+        for label in labels:
+            data = self.app.data_collection[label]
+            values = diff_data if data.meta.get('_ramp_type') == 'diff' else ramp_data
+            data.meta['_ramp_integration'] = int(integration)
+            data.update_components({data.id['data']: values})
+            cube = self.cube_cache[label]
+            meta = {**cube.meta, '_ramp_integration': int(integration)}
+            self.cube_cache[label] = NDDataArray(values, unit=cube.unit, meta=meta)
+        for label in labels:
+            self.app._update_live_plugin_results(trigger_data_lbl=label)
+
     def get_data(self, data_label=None, spatial_subset=None,
                  temporal_subset=None, cls=None, use_display_units=False):
         """
@@ -3,7 +3,7 @@ import astropy.units as u
 from astropy.nddata import NDDataArray
 
 from functools import cached_property
-from traitlets import Bool, Float, List, Unicode, observe, Int
+from traitlets import Bool, Float, List, Unicode, observe
 from glue.core.message import (
     SubsetCreateMessage, SubsetDeleteMessage, SubsetUpdateMessage
 )
@@ -24,9 +24,80 @@ from jdaviz.core.user_api import PluginUserApi
 from jdaviz.configs.cubeviz.plugins.viewers import WithSliceIndicator
 
 
-__all__ = ['RampExtraction']
+__all__ = ['RampExtraction', 'collapse_pixels']
 
-rng = np.random.default_rng(seed=42)
+# maximum number of cube values gathered at a time when collapsing an aperture
+COLLAPSE_CHUNK_SIZE = 2**22
+
+# percentiles of the pixel ramp profiles shown in subset previews
+PREVIEW_PERCENTILES = (16, 50, 84)
+
+
+def collapse_pixels(data, pixels=None, function='mean', chunk_size=COLLAPSE_CHUNK_SIZE):
+    """
+    Collapse the pixels of a ramp cube (with the group axis last) into a ramp profile.
+
+    Pixels are gathered from the cube in chunks of at most ``chunk_size`` values, so
+    that large apertures are not copied out of the cube all at once.
+
+    Parameters
+    ----------
+    data : array-like
+        Ramp cube with shape ``(nx, ny, n_groups)``.
+    pixels : tuple of array-like or `None`
+        Indices of the pixels along the first two axes of the cube (as returned by
+        `~numpy.nonzero`), or `None` for all pixels.
+    function : str or callable
+        Name of the NumPy function to collapse with (``'mean'``, ``'median'``,
+        ``'min'``, ``'max'`` or ``'sum'``), or a function called as
+        ``function(values, axis=0)`` on the values of the pixels (with shape
+        ``(n_pixels, n)``) for chunks of groups.
+
+    Returns
+    -------
+    profile : `~numpy.ndarray`
+        Collapsed profile, with the group axis last.
+    """
+    n_groups = data.shape[-1]
+    if pixels is None:
+        n_pixels = data.shape[0] * data.shape[1]
+
+        def gather(start, stop, groups=slice(None)):
+            # chunks of whole rows along the first axis
+            return data[start:stop, :, groups].reshape(-1, len(range(n_groups)[groups]))
+        row_size = data.shape[1]
+    else:
+        pixels = tuple(np.asarray(ind) for ind in pixels)
+        n_pixels = len(pixels[0])
+
+        def gather(start, stop, groups=slice(None)):
+            return data[pixels[0][start:stop], pixels[1][start:stop], groups]
+        row_size = 1
+    if n_pixels == 0:
+        raise ValueError("aperture does not contain any pixels")
+
+    if function in ('mean', 'sum', 'min', 'max'):
+        # reduce chunks of pixels and combine the partial results
+        step = max(1, chunk_size // (n_groups * row_size))
+        n_steps = n_pixels // row_size
+        result = None
+        for start in range(0, n_steps, step):
+            values = gather(start, start + step)
+            if function in ('mean', 'sum'):
+                partial = values.sum(axis=0, dtype=np.float64)
+                result = partial if result is None else result + partial
+            else:
+                partial = getattr(np, function)(values, axis=0)
+                result = (partial if result is None
+                          else getattr(np, f"{function}imum")(result, partial))
+        return result / n_pixels if function == 'mean' else result
+
+    # other statistics need all the pixels at once, so reduce chunks of groups instead
+    reduce = getattr(np, function) if isinstance(function, str) else function
+    step = max(1, chunk_size // n_pixels)
+    n_steps = n_pixels // row_size
+    return np.concatenate([reduce(gather(0, n_steps, slice(start, start + step)), axis=0)
+                           for start in range(0, n_groups, step)], axis=-1)
 
 
 @tray_registry(
@@ -50,13 +121,12 @@ class RampExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
       Method to use for extracting a ramp profile
     * ``add_results`` (:class:`~jdaviz.core.template_mixin.AddResults`)
     * :meth:`extract`
+    * :meth:`extract_integrations`
     """
     template_file = __file__, "ramp_extraction.vue"
     uses_active_status = Bool(True).tag(sync=True)
     show_live_preview = Bool(False).tag(sync=True)
     show_subset_preview = Bool(True).tag(sync=True)
-    subset_preview_warning = Bool(False).tag(sync=True)
-    subset_preview_limit = Int(250).tag(sync=True)
 
     active_step = Unicode().tag(sync=True)
 
@@ -102,6 +172,8 @@ class RampExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
         self.aperture.select_default()
 
         self.extracted_ramp = None
+        # subset label -> (shape, spatial mask, pixel indices) of rasterized apertures
+        self._aperture_pixels = {}
 
         self.function = SelectPluginComponent(
             self,
@@ -148,47 +220,40 @@ class RampExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
 
         subset_lbl = msg.subset.label
         color = msg.subset.style.color
-        subset = self.app.get_subsets(subset_lbl)[0]
-        region = subset['region']
-
-        if region is None:
+        self._aperture_pixels.pop(subset_lbl, None)
+        if self.cube is None:
             return
-
-        # glue region has transposed coords relative to cached cube:
-        region_mask = region.to_mask().to_image(
-            self.cube.shape[:-1][::-1]
-        ).astype(bool).T
-        cube_subset = self.cube[region_mask]  # shape: (N pixels extracted, M groups)
-
-        n_pixels_in_extraction = cube_subset.shape[0]
-
-        if n_pixels_in_extraction < self.subset_preview_limit:
-            self.subset_preview_warning = False
-            select_from_cube_subset = Ellipsis
-        else:
-            self.subset_preview_warning = True
-            select_from_cube_subset = rng.integers(
-                0, n_pixels_in_extraction, size=self.subset_preview_limit
+        try:
+            _, pixels = self._get_aperture_pixels(subset_lbl)
+            # one band spanning the percentiles of the ramp profiles of the subset's pixels,
+            # with the median drawn as a line
+            y = collapse_pixels(
+                self.cube.data, pixels,
+                lambda values, axis: np.percentile(values, PREVIEW_PERCENTILES, axis=axis)
             )
+        except (AttributeError, ValueError, TypeError, KeyError, IndexError):
+            # not a spatial subset, or no pixels in the subset
+            self._on_subset_delete(msg)
+            return
 
-        marks = [
-            PluginLine(
-                self.integration_viewer, x=np.arange(cube_subset.shape[1]), y=y,
-                stroke_width=1, colors=[color], opacities=[0.25], label=subset_lbl,
-                visible=self._subset_preview_visible and subset_lbl == self.aperture.selected
-            )
-            for y in cube_subset[select_from_cube_subset]
-        ]
+        mark = PluginLine(
+            self.integration_viewer, x=np.arange(y.shape[-1]), y=y,
+            stroke_width=1, colors=[color], opacities=[0, 1, 0],
+            fill='between', fill_colors=[color], fill_opacities=[0.25, 0.25],
+            label=subset_lbl,
+            visible=self._subset_preview_visible and subset_lbl == self.aperture.selected
+        )
 
         self.integration_viewer.figure.marks = [
             mark for mark in self.integration_viewer.figure.marks
             if getattr(mark, 'label', None) != subset_lbl
-        ] + marks
+        ] + [mark]
 
         self.integration_viewer.reset_limits()
 
     def _on_subset_delete(self, msg={}):
         subset_lbl = msg.subset.label
+        self._aperture_pixels.pop(subset_lbl, None)
         self.integration_viewer.figure.marks = [
             mark for mark in self.integration_viewer.figure.marks
             if getattr(mark, 'label', None) != subset_lbl
@@ -219,7 +284,8 @@ class RampExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
     @property
     def user_api(self):
         expose = [
-            'dataset', 'function', 'aperture', 'add_results', 'extract'
+            'dataset', 'function', 'aperture', 'add_results', 'extract',
+            'extract_integrations'
         ]
 
         return PluginUserApi(self, expose=expose)
@@ -301,20 +367,32 @@ class RampExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
             return u.Unit(x_display_unit)
         return u.dimensionless_unscaled
 
+    def _get_aperture_pixels(self, subset_lbl):
+        # rasterize the subset's region once per subset (until it is updated)
+        # and cube shape, and keep the spatial mask with the indices of its pixels
+        shape = self.cube.shape[:-1]
+        cached = self._aperture_pixels.get(subset_lbl)
+        if cached is None or cached[0] != shape:
+            region = self.app.get_subsets(subset_name=subset_lbl)[0]['region']
+            # note: glue subset mask is transposed relative to cube
+            mask = region.to_mask().to_image(shape[::-1]).astype(bool).T
+            cached = (shape, mask, np.nonzero(mask))
+            self._aperture_pixels[subset_lbl] = cached
+        return cached[1:]
+
     @property
     def aperture_weight_mask(self):
-        cube_shape = self.cube.shape
         if self.aperture.selected != self.aperture.default_text:
+            return self._get_aperture_pixels(self.aperture.selected)[0]
 
-            # note: glue subset mask is transposed relative to cube
-            region_mask = self.app.get_subsets(
-                subset_name=self.aperture.selected
-            )[0]['region'].to_mask().to_image(
-                cube_shape[:-1]
-            ).astype(bool).T
-            return region_mask
+        return np.ones(self.cube.shape[:-1]).astype(bool)
 
-        return np.ones(cube_shape[:-1]).astype(bool)
+    @property
+    def _aperture_pixel_indices(self):
+        # indices of the aperture pixels, or None for the entire cube
+        if self.aperture.selected == self.aperture.default_text:
+            return None
+        return self._get_aperture_pixels(self.aperture.selected)[1]
 
     def _extract_from_aperture(self, **kwargs):
         # This plugin collapses over the *spatial axes* (optionally over a spatial subset,
@@ -327,17 +405,11 @@ class RampExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
             raise ValueError("aperture must be an ApertureSubsetSelect object")
 
         nddata = self.cube
-        mask = self.aperture_weight_mask
-
+        pixels = self._aperture_pixel_indices
         if nddata.mask is not None:
-            mask = mask & ~nddata.mask
+            pixels = np.nonzero(self.aperture_weight_mask & ~nddata.mask)
 
-        collapsed = getattr(np, selected_func)(
-            nddata.data[mask],
-            # after the fancy indexing above, axis=1 corresponds to groups, and
-            # operations over axis=0 corresponds to individual pixels:
-            axis=0
-        )
+        collapsed = collapse_pixels(nddata.data, pixels, selected_func)
         if nddata.unit is not None:
             collapsed <<= nddata.unit
 
@@ -395,6 +467,36 @@ class RampExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
 
         return ndd
 
+    @with_spinner()
+    def extract_integrations(self):
+        """
+        Extract the ramp profile of every integration of the ramp file according to the
+        plugin inputs.
+
+        The integrations are read from the file one at a time, so the full ramp file is
+        never held in memory.
+
+        Returns
+        -------
+        profiles : `~astropy.nddata.NDDataArray`
+            Ramp profiles with shape ``(n_integrations, n_groups)``.
+        """
+        if self.conflicting_aperture_and_function:
+            raise ValueError(self.conflicting_aperture_error_message)
+
+        integrations = getattr(self.app._jdaviz_helper, 'ramp_integrations',
+                               {}).get(self.dataset.selected)
+        if integrations is None:
+            raise ValueError(f"{self.dataset.selected} is not a loaded ramp cube")
+
+        function = self.function_selected.lower()
+        pixels = self._aperture_pixel_indices
+        profiles = np.empty((len(integrations), integrations.shape[-1]))
+        for integration, ramp_data in enumerate(integrations.iter_ramps()):
+            profiles[integration] = collapse_pixels(ramp_data, pixels, function)
+
+        return NDDataArray(data=profiles, unit=integrations.unit, meta=self.cube.meta)
+
     def vue_ramp_extraction(self, *args, **kwargs):
         try:
             self.extract(add_data=True)
@@ -1,7 +1,12 @@
+import numpy as np
 import pytest
+from astropy import units as u
+from numpy.testing import assert_allclose
 from regions import CirclePixelRegion, PixCoord
 from jdaviz.core.marks import Lines
 from jdaviz.configs.imviz.plugins.parsers import HAS_ROMAN_DATAMODELS
+from jdaviz.configs.rampviz.plugins.ramp_extraction.ramp_extraction import collapse_pixels
+from jdaviz.conftest import _make_jwst_ramp
 
 
 @pytest.mark.skipif(not HAS_ROMAN_DATAMODELS, reason="roman_datamodels is not installed")
@@ -45,9 +50,11 @@ def _ramp_extraction_previews(_rampviz_helper, _ramp_file):
         len(mark.x) == n_groups
     ]) == 1
 
-    # check that when the plugin is active, there's one ramp profile generated by the
-    # plugin per pixel in the subset (if show_subset_preview),
+    # check that when the plugin is active, there's one aggregated preview of the ramp
+    # profiles of the pixels in the subset (if show_subset_preview),
     # plus one live preview (if show_live_preview):
+    subset_state = subsets['Subset 1'][0]['subset_state']
+    pixel_profiles = ramp_extr.cube.data[subset_state.to_mask(ramp_cube)[..., 0]]
     for show_live_preview in [True, False]:
         for show_subset_preview in [True, False]:
             with ramp_extr.as_active():
@@ -55,11 +62,50 @@ def _ramp_extraction_previews(_rampviz_helper, _ramp_file):
                 ramp_extr.show_subset_preview = show_subset_preview
                 ramp_extr.aperture_selected = 'Subset 1'
 
-                subset_state = subsets[ramp_extr.aperture_selected][0]['subset_state']
-                n_pixels_in_subset = subset_state.to_mask(ramp_cube)[..., 0].sum()
-
-                assert len([
-                    mark for mark in integration_viewer.custom_marks
-                    if mark.visible and isinstance(mark, Lines) and
-                    len(mark.x) == n_groups
-                ]) == int(show_subset_preview) * n_pixels_in_subset + int(show_live_preview)
+                marks = [mark for mark in integration_viewer.custom_marks
+                         if mark.visible and isinstance(mark, Lines) and
+                         len(mark.x) == n_groups]
+                assert len(marks) == int(show_subset_preview) + int(show_live_preview)
+
+    subset_preview, = [mark for mark in integration_viewer.custom_marks
+                       if getattr(mark, 'label', None) == 'Subset 1']
+    assert_allclose(subset_preview.y, np.percentile(pixel_profiles, [16, 50, 84], axis=0))
+
+
+@pytest.mark.parametrize('function', ['mean', 'median', 'min', 'max', 'sum'])
+@pytest.mark.parametrize('with_pixels', [True, False])
+def test_collapse_pixels(function, with_pixels):
+    data = np.random.default_rng(0).integers(0, 1000, size=(12, 9, 7)).astype(np.uint16)
+    mask = np.zeros(data.shape[:-1], dtype=bool)
+    mask[2:8, 3:5] = True
+    mask[10, 0] = True
+    if not with_pixels:
+        mask[:] = True
+
+    expected = getattr(np, function)(data[mask], axis=0)
+    for chunk_size in (1, 20, 10**6):
+        collapsed = collapse_pixels(data, np.nonzero(mask) if with_pixels else None,
+                                    function, chunk_size=chunk_size)
+        assert_allclose(collapsed, expected)
+
+    with pytest.raises(ValueError, match='does not contain any pixels'):
+        collapse_pixels(data, np.nonzero(np.zeros_like(mask)), function)
+
+
+def test_extract_integrations(rampviz_helper):
+    ramp = _make_jwst_ramp(shape=(3, 10, 25, 25))
+    rampviz_helper.load(ramp, format='Ramp')
+    rampviz_helper.plugins['Subset Tools'].import_region(
+        CirclePixelRegion(center=PixCoord(12.5, 15.5), radius=2))
+
+    ramp_extr = rampviz_helper.plugins['Ramp Extraction']
+    ramp_extr.aperture = 'Subset 1'
+    ramp_extr.function = 'Max'
+    profiles = ramp_extr.extract_integrations()
+    assert profiles.shape == (3, 10)
+    assert profiles.unit == u.DN
+
+    # each integration's profile matches the extraction after selecting that integration
+    for integration in range(3):
+        rampviz_helper.select_integration(integration)
+        assert_allclose(profiles.data[integration], ramp_extr.extract(add_data=False).data[0, 0])
@@ -4,8 +4,7 @@ import astropy.units as u
 from astropy.coordinates import SpectralCoord
 import numpy as np
 from bqplot import LinearScale
-from specreduce.tracing import FlatTrace
-from specreduce.utils import measure_cross_dispersion_profile
+from specreduce.extract import _get_boxcar_weights
 from traitlets import Bool, Float, Integer, List, Unicode, observe
 
 from jdaviz.core.events import GlobalDisplayUnitChanged
@@ -20,6 +19,19 @@ from jdaviz.core.user_api import PluginUserApi
 __all__ = ['CrossDispersionProfile']
 
 
+def _profile_window(y_pixel, width, n_cross):
+    """
+    Boolean mask of the rows on the cross-dispersion axis that are included in
+    a profile of ``width`` centered at ``y_pixel``.  This matches the window used
+    by `specreduce.utils.measure_cross_dispersion_profile` for a flat trace, where
+    any row with non-zero boxcar weight is included and ``width=None`` (or the
+    full size of the axis) includes all rows.
+    """
+    if width is None or int(width) == n_cross:
+        return np.ones(n_cross, dtype=bool)
+    return _get_boxcar_weights(y_pixel, 0.5 * int(width), n_cross) > 0
+
+
 @tray_registry('cross-dispersion-profile', label="Cross Dispersion Profile")
 class CrossDispersionProfile(PluginTemplateMixin, PlotMixin):
     """
@@ -106,6 +118,9 @@ class CrossDispersionProfile(PluginTemplateMixin, PlotMixin):
 
         # attribute to access computed profile, will be a quantity array
         self._profile = None
+        # (dataset object, flux array, unit) of the dataset the profile was last
+        # measured for, so the full 2D array is only extracted once per dataset
+        self._profile_data = None
 
         # override default plot styling
         self.plot.figure.fig_margin = {'top': 60, 'bottom': 60, 'left': 65,
@@ -319,16 +334,22 @@ class CrossDispersionProfile(PluginTemplateMixin, PlotMixin):
         else:
             width = self.width
 
-        # create a FlatTrace at y_pixel
-        trace = FlatTrace(data, self.y_pixel)
-
-        profile = measure_cross_dispersion_profile(data,
-                                                   trace=trace,
-                                                   crossdisp_axis=0,
-                                                   width=width,
-                                                   pixel=self.pixel,
-                                                   pixel_range=None,
-                                                   align_along_trace=False)
+        # for a single column and a flat trace, the profile is the column itself
+        # within the window, so there is no need to build full-image masks (as
+        # specreduce.utils.measure_cross_dispersion_profile does) on every update
+        if self._profile_data is None or self._profile_data[0] is not data:
+            self._profile_data = (data, np.asarray(getattr(data, 'data', data)),
+                                  getattr(data, 'unit', None))
+        _, arr, unit = self._profile_data
+
+        if self.pixel < 0 or self.pixel > arr.shape[1] - 1:
+            raise ValueError('Pixels chosen to measure cross dispersion profile are'
+                             ' out of image bounds.')
+
+        window = _profile_window(self.y_pixel, width, arr.shape[0])
+        profile = arr[window, self.pixel].astype(float)
+        if unit is not None:
+            profile = profile * unit
 
         # convert profile, which was computed in data units, to display unit
         if self.sa_display_unit != '':
@@ -3,6 +3,9 @@ import astropy.units as u
 from astropy.modeling.fitting import LevMarLSQFitter
 from astropy.modeling.models import Gaussian1D
 from astropy.tests.helper import assert_quantity_allclose
+import pytest
+from specreduce.tracing import FlatTrace
+from specreduce.utils import measure_cross_dispersion_profile
 from specutils import Spectrum
 
 
@@ -92,3 +95,25 @@ def test_cross_dispersion_profile(specviz2d_helper):
     # todo: add tests to cover selecting new datasets (e.g background image
     # from the spectral extraction plugin) once JDAT-5426 is resolved. need
     # to test that dataset_selected behaves correctly
+
+
+@pytest.mark.parametrize(('y_pixel', 'width'), [(5, None), (5, 4), (5, 7), (1, 3), (10, 5),
+                                                (3, 20), (6, 11)])
+def test_cross_dispersion_profile_matches_specreduce(specviz2d_helper, y_pixel, width):
+    arr = np.random.default_rng(0).random((11, 30))
+    arr[4, 7] = np.nan
+    data = Spectrum(flux=arr * u.Jy, spectral_axis=np.arange(30) * u.nm)
+    specviz2d_helper.load_data(data)
+
+    cdp = specviz2d_helper.plugins['Cross Dispersion Profile']
+    cdp.y_pixel = y_pixel
+    cdp.use_full_width = width is None
+    if width is not None:
+        cdp.width = width
+
+    for pixel in (0, 7, 29):
+        cdp.pixel = pixel
+        expected = measure_cross_dispersion_profile(data, trace=FlatTrace(data, y_pixel),
+                                                    width=width, pixel=pixel,
+                                                    align_along_trace=False)
+        assert_quantity_allclose(cdp.profile, expected, equal_nan=True)
@@ -1,4 +1,6 @@
+import multiprocessing as mp
 import numpy as np
+from copy import copy, deepcopy
 from functools import cached_property
 
 from traitlets import Bool, List, Unicode, observe
@@ -18,6 +20,7 @@ from jdaviz.core.template_mixin import (PluginTemplateMixin,
 from jdaviz.core.user_api import PluginUserApi
 from jdaviz.core.custom_traitlets import IntHandleEmpty, FloatHandleEmpty
 from jdaviz.core.marks import PluginMarkCollection, PluginLine
+from jdaviz.utils import parallelize_calculation
 
 from astropy.modeling import models
 from astropy.nddata import StdDevUncertainty, VarianceUncertainty, UnknownUncertainty
@@ -34,6 +37,181 @@ _model_cls = {'Spline': models.Spline1D,
               'Chebyshev': models.Chebyshev1D}
 
 
+def _boxcar_cumsums(sp2d):
+    """
+    Cumulative sums along the cross-dispersion axis of the (masked) flux and of
+    the unmasked pixel coverage of a 2D spectrum, with a leading row of zeros
+    so that row ``k`` is the sum over pixels ``0..k-1``.  These allow evaluating
+    a boxcar extraction for any window in O(n_columns), see
+    `_boxcar_extract_from_cumsums`.
+    """
+    data = np.asarray(sp2d.data, dtype=float)
+    good = np.isfinite(data)
+    if sp2d.mask is not None:
+        good &= ~np.asarray(sp2d.mask, dtype=bool)
+    zeros = np.zeros((1, data.shape[1]))
+    cum_data = np.concatenate([zeros, np.cumsum(np.where(good, data, 0.0), axis=0)])
+    cum_good = np.concatenate([zeros, np.cumsum(good, axis=0, dtype=float)])
+    return cum_data, cum_good
+
+
+def _boxcar_extract_from_cumsums(sp2d, cumsums, trace, width):
+    """
+    Boxcar extraction equivalent to `specreduce.extract.BoxcarExtract` (with
+    the default ``mask_treatment='apply'``), using the precomputed cumulative
+    sums from `_boxcar_cumsums`.  Pixel ``j`` covers ``[j-0.5, j+0.5]``, so
+    linearly interpolating the cumulative sums at the window edges gives the
+    same partial-pixel weights as specreduce.
+    """
+    if width <= 0:
+        raise ValueError("The window width must be positive")
+    cum_data, cum_good = cumsums
+    n_cross, n_disp = cum_data.shape[0] - 1, cum_data.shape[1]
+    centers = np.asarray(np.ma.getdata(trace.trace), dtype=float)
+    lower = np.clip(centers - width / 2, -0.5, n_cross - 0.5)
+    upper = np.clip(centers + width / 2, -0.5, n_cross - 0.5)
+    # when both edges fall in the same pixel, specreduce assigns that pixel the
+    # weight of the upper edge only
+    same_pixel = np.round(lower) == np.round(upper)
+    lower[same_pixel] = np.round(upper[same_pixel]) - 0.5
+    columns = np.arange(n_disp)
+
+    def _interp(cumsum, edges):
+        t = edges + 0.5
+        k = np.clip(np.floor(t).astype(int), 0, n_cross - 1)
+        return cumsum[k, columns] + (t - k) * (cumsum[k + 1, columns] - cumsum[k, columns])
+
+    data_sum = _interp(cum_data, upper) - _interp(cum_data, lower)
+    good_sum = _interp(cum_good, upper) - _interp(cum_good, lower)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        flux = data_sum / good_sum * (upper - lower)
+
+    return Spectrum(flux * sp2d.unit, spectral_axis=sp2d.spectral_axis)
+
+
+def _trace_from_params(sp2d, trace_type, trace_pixel, trace_order=3, trace_bins=None,
+                       trace_window=None, trace_peak_method='Gaussian'):
+    """
+    Create a new specreduce Trace for ``sp2d``.  ``trace_bins=None`` disables binning.
+    """
+    if trace_type == 'Flat':
+        return tracing.FlatTrace(sp2d, trace_pixel)
+
+    if trace_type in _model_cls:
+        trace_model = _model_cls[trace_type](degree=trace_order)
+        return tracing.FitTrace(sp2d,
+                                guess=trace_pixel,
+                                bins=int(trace_bins) if trace_bins is not None else None,
+                                window=trace_window,
+                                peak_method=trace_peak_method.lower(),
+                                trace_model=trace_model)
+
+    raise NotImplementedError(f"trace_type={trace_type} not implemented")
+
+
+def _bg_from_params(sp2d, trace, bg_type, bg_separation, bg_width, bg_statistic):
+    """
+    Create a specreduce Background for ``sp2d`` relative to ``trace``.  For the
+    'Manual' type, ``trace`` defines the center of the background window itself.
+    """
+    statistic = bg_statistic.lower()
+    if bg_type == 'Manual':
+        return background.Background(sp2d, [trace], width=bg_width, statistic=statistic)
+    elif bg_type == 'OneSided':
+        return background.Background.one_sided(sp2d, trace, bg_separation,
+                                               width=bg_width, statistic=statistic)
+    elif bg_type == 'TwoSided':
+        return background.Background.two_sided(sp2d, trace, bg_separation,
+                                               width=bg_width, statistic=statistic)
+
+    raise NotImplementedError(f"bg_type={bg_type} not implemented")
+
+
+def _extract_from_params(sp2d, trace, ext_type, ext_width, horne_ext_profile='Gaussian',
+                         self_prof_n_bins=10, self_prof_interp_degree_x=1,
+                         self_prof_interp_degree_y=1):
+    """
+    Create a specreduce extraction object for ``sp2d`` along ``trace``.
+    """
+    if ext_type == 'Boxcar':
+        return extract.BoxcarExtract(sp2d, trace, width=ext_width)
+
+    if ext_type != 'Horne':
+        raise NotImplementedError(f"extraction type '{ext_type}' not supported")
+
+    # do not modify the uncertainty of the (possibly cached) input spectrum
+    sp2d = copy(sp2d)
+    if sp2d.uncertainty is None:
+        sp2d.uncertainty = VarianceUncertainty(np.ones_like(sp2d.data))
+
+    if not hasattr(sp2d.uncertainty, 'uncertainty_type'):
+        sp2d.uncertainty = StdDevUncertainty(sp2d.uncert)
+
+    if horne_ext_profile == 'Self (interpolated)':
+
+        # check inputs
+        if self_prof_n_bins <= 0:
+            raise ValueError('`self_prof_n_bins` must be greater than 0.')
+        if self_prof_interp_degree_x <= 0:
+            raise ValueError('`self_prof_interp_degree_x` must be greater than 0.')
+        if self_prof_interp_degree_y <= 0:
+            raise ValueError('`self_prof_interp_degree_y` must be greater than 0.')
+
+        # setup dict of interpolation options
+        spatial_profile = {'name': 'interpolated_profile',
+                           'n_bins_interpolated_profile': self_prof_n_bins,
+                           'interp_degree': (self_prof_interp_degree_x,
+                                             self_prof_interp_degree_y)}
+
+    elif horne_ext_profile == 'Gaussian':
+        spatial_profile = 'gaussian'
+
+    else:
+        raise ValueError("Horne extraction profile must either be 'Gaussian' or 'Self (interpolated)'")  # noqa
+
+    return extract.HorneExtract(sp2d, trace, spatial_profile=spatial_profile)
+
+
+class ExtractionWorker:
+    """
+    Callable that runs the trace, background and extraction steps with a
+    fixed set of parameters on each of a chunk of 2D spectra, for use with
+    `~jdaviz.utils.parallelize_calculation`.
+
+    ``params`` must contain the keyword arguments of `_trace_from_params`
+    and `_extract_from_params` as well as ``bg_type``, ``bg_trace_pixel``,
+    ``bg_separation``, ``bg_width`` and ``bg_statistic``.  If ``bg_type`` is
+    `None`, the extraction is done on the input without background subtraction.
+    """
+    _trace_keys = ('trace_type', 'trace_pixel', 'trace_order', 'trace_bins',
+                   'trace_window', 'trace_peak_method')
+    _bg_keys = ('bg_separation', 'bg_width', 'bg_statistic')
+    _ext_keys = ('ext_type', 'ext_width', 'horne_ext_profile', 'self_prof_n_bins',
+                 'self_prof_interp_degree_x', 'self_prof_interp_degree_y')
+
+    def __init__(self, spectra, indices, params):
+        self.spectra = spectra
+        self.indices = indices
+        self.params = params
+
+    def extract(self, sp2d):
+        params = self.params
+        trace = _trace_from_params(sp2d, **{k: params[k] for k in self._trace_keys})
+        if params['bg_type'] is not None:
+            if params['bg_type'] == 'Manual':
+                bg_trace = tracing.FlatTrace(sp2d, params['bg_trace_pixel'])
+            else:
+                bg_trace = trace
+            bg = _bg_from_params(sp2d, bg_trace, params['bg_type'],
+                                 **{k: params[k] for k in self._bg_keys})
+            sp2d = bg.sub_image()
+        ext = _extract_from_params(sp2d, trace, **{k: params[k] for k in self._ext_keys})
+        return ext.spectrum
+
+    def __call__(self):
+        return [(index, self.extract(sp2d)) for index, sp2d in zip(self.indices, self.spectra)]
+
+
 @tray_registry('spectral-extraction-2d', label="2D Spectral Extraction",
                category="data:reduction")
 class SpectralExtraction2D(PluginTemplateMixin):
@@ -112,6 +290,7 @@ class SpectralExtraction2D(PluginTemplateMixin):
     * :meth:`import_extract`
     * :meth:`export_extract`
     * :meth:`export_extract_spectrum`
+    * :meth:`export_extract_spectra`
     """
     dialog = Bool(False).tag(sync=True)
     template_file = __file__, "spectral_extraction.vue"
@@ -360,6 +539,10 @@ class SpectralExtraction2D(PluginTemplateMixin):
         self.app.hub.subscribe(self, ViewerVisibleLayersChangedMessage,
                                lambda _: self._update_plugin_marks())
 
+        # intermediate results (trace, background, etc) for the live previews,
+        # see _cached_step
+        self._preview_cache = {}
+
         if self.config == "deconfigged":
             self.observe_traitlets_for_relevancy(traitlets_to_observe=['trace_dataset_items'])
 
@@ -386,7 +569,8 @@ class SpectralExtraction2D(PluginTemplateMixin):
                                            'self_prof_interp_degree_x',
                                            'self_prof_interp_degree_y',
                                            'import_extract',
-                                           'export_extract', 'export_extract_spectrum'))
+                                           'export_extract', 'export_extract_spectrum',
+                                           'export_extract_spectra'))
 
     def _clear_default_inputs(self):
         self.trace_pixel = 0
@@ -512,6 +696,8 @@ class SpectralExtraction2D(PluginTemplateMixin):
         if not (self.is_active):
             for step, mark in self.marks.items():
                 mark.clear()
+            # no need to hold on to intermediate arrays while the previews are hidden
+            self._preview_cache = {}
             return
 
         if self.active_step == '':
@@ -580,7 +766,7 @@ class SpectralExtraction2D(PluginTemplateMixin):
         # also called by any of the _interaction_in_*_step
         if self.interactive_extract:
             try:
-                sp1d = self.export_extract_spectrum(add_data=False)
+                sp1d = self._preview_extract_spectrum()
             except Exception as e:
                 # NOTE: ignore error, but will be raised when clicking ANY of the export buttons
                 # NOTE: FitTrace or manual background are often giving a
@@ -620,7 +806,7 @@ class SpectralExtraction2D(PluginTemplateMixin):
             return
 
         try:
-            trace = self.export_trace(add_data=False)
+            trace = self._get_trace()
         except Exception:
             # NOTE: ignore error, but will be raised when clicking ANY of the export buttons
             self.marks['trace'].clear()
@@ -743,6 +929,21 @@ class SpectralExtraction2D(PluginTemplateMixin):
         else:
             self.ext_uncert_warn = False
 
+    def _cached_step(self, step, key, refs, func):
+        """
+        Return the result of ``func`` for a given ``step`` from the cache if
+        it was last computed with the same ``key``, otherwise recompute it.
+        Keys may include the ``id`` of input objects, in which case those
+        objects must be passed in ``refs`` so that they stay alive (and their
+        ``id`` is not reused) for as long as the entry is cached.
+        """
+        cached = self._preview_cache.get(step)
+        if cached is not None and cached[0] == key:
+            return cached[2]
+        result = func()
+        self._preview_cache[step] = (key, refs, result)
+        return result
+
     def _set_create_kwargs(self, **kwargs):
         invalid_kwargs = [k for k in kwargs.keys() if not hasattr(self, k)]
         if len(invalid_kwargs):
@@ -795,6 +996,33 @@ class SpectralExtraction2D(PluginTemplateMixin):
         if len(kwargs) and self.active_step != 'trace':
             self.update_marks(step='trace')
 
+        # the cached trace is shared with the live previews, and Trace.shift
+        # modifies the trace in-place
+        trace = deepcopy(self._get_trace())
+
+        if add_data:
+            self.trace_add_results.add_results_from_plugin(trace,
+                                                           format='Trace',
+                                                           replace=False)
+
+        return trace
+
+    def _get_trace(self):
+        # the trace fit is only redone if one of its inputs changed
+        refs = [self.trace_dataset.selected_obj]
+        if self.trace_trace_selected != 'New Trace':
+            refs.append(self.trace_trace.selected_obj)
+            key = ('offset', self.trace_trace_selected, self.trace_offset)
+        elif self.trace_type_selected == 'Flat':
+            key = ('Flat', self.trace_pixel)
+        else:
+            key = (self.trace_type_selected, self.trace_order, self.trace_pixel,
+                   self.trace_bins if self.trace_do_binning else None,
+                   self.trace_window, self.trace_peak_method_selected)
+        key += tuple(id(ref) for ref in refs)
+        return self._cached_step('trace', key, refs, self._build_trace)
+
+    def _build_trace(self):
         if self.trace_trace_selected != 'New Trace':
             # then we're offsetting an existing trace
             # for FlatTrace, we can keep and expose a new FlatTrace (which has the advantage of
@@ -807,41 +1035,31 @@ class SpectralExtraction2D(PluginTemplateMixin):
                 trace = tracing.ArrayTrace(self.trace_dataset.selected_obj,
                                            self.trace_trace.selected_obj.trace+self.trace_offset)
 
-        elif self.trace_type_selected == 'Flat':
-            trace = tracing.FlatTrace(self.trace_dataset.selected_obj,
-                                      self.trace_pixel)
-
-        elif self.trace_type_selected in _model_cls:
-            trace_model = _model_cls[self.trace_type_selected](degree=self.trace_order)
-            trace = tracing.FitTrace(self.trace_dataset.selected_obj,
-                                     guess=self.trace_pixel,
-                                     bins=int(self.trace_bins) if self.trace_do_binning else None,
-                                     window=self.trace_window,
-                                     peak_method=self.trace_peak_method_selected.lower(),
-                                     trace_model=trace_model)
-
         else:
-            raise NotImplementedError(f"trace_type={self.trace_type_selected} not implemented")
-
-        if add_data:
-            self.trace_add_results.add_results_from_plugin(trace,
-                                                           format='Trace',
-                                                           replace=False)
+            trace = _trace_from_params(self.trace_dataset.selected_obj,
+                                       **self._trace_params())
 
         return trace
 
+    def _trace_params(self):
+        return {'trace_type': self.trace_type_selected,
+                'trace_pixel': self.trace_pixel,
+                'trace_order': self.trace_order,
+                'trace_bins': self.trace_bins if self.trace_do_binning else None,
+                'trace_window': self.trace_window,
+                'trace_peak_method': self.trace_peak_method_selected}
+
     def vue_create_trace(self, *args):
         self.export_trace(add_data=True)
 
     def _get_bg_trace(self):
         if self.bg_type_selected == 'Manual':
-            trace = tracing.FlatTrace(self.trace_dataset.get_selected_spectrum(
-                                      use_display_units=True),
+            trace = tracing.FlatTrace(self.trace_dataset.selected_spectrum,
                                       self.bg_trace_pixel)
         elif self.bg_trace_selected == 'From Plugin':
-            trace = self.export_trace(add_data=False)
+            trace = self._get_trace()
         else:
-            trace = self.bg_trace.get_selected_spectrum(use_disaply_units=True)
+            trace = self.bg_trace.get_selected_spectrum(use_display_units=True)
 
         return trace
 
@@ -890,31 +1108,25 @@ class SpectralExtraction2D(PluginTemplateMixin):
         if len(kwargs) and self.active_step != 'bg':
             self.update_marks(step='bg')
 
-        trace = self._get_bg_trace()
+        return self._get_bg()
 
+    def _get_bg(self):
+        # the background is only recomputed if the trace or a background input changed
+        trace = self._get_bg_trace()
+        spectrum = self.bg_dataset.selected_spectrum
         if self.bg_type_selected == 'Manual':
-            bg = background.Background(self.bg_dataset.get_selected_spectrum(
-                                       use_display_units=True),
-                                       [trace], width=self.bg_width,
-                                       statistic=self.bg_statistic.selected.lower())
-        elif self.bg_type_selected == 'OneSided':
-            bg = background.Background.one_sided(self.bg_dataset.get_selected_spectrum(
-                                                 use_display_units=True),
-                                                 trace,
-                                                 self.bg_separation,
-                                                 width=self.bg_width,
-                                                 statistic=self.bg_statistic.selected.lower())
-        elif self.bg_type_selected == 'TwoSided':
-            bg = background.Background.two_sided(self.bg_dataset.get_selected_spectrum(
-                                                 use_display_units=True),
-                                                 trace,
-                                                 self.bg_separation,
-                                                 width=self.bg_width,
-                                                 statistic=self.bg_statistic.selected.lower())
-        else:  # pragma: no cover
-            raise NotImplementedError(f"bg_type={self.bg_type_selected} not implemented")
+            # a new (but equivalent) FlatTrace is created on every call
+            trace_key = ('Manual', self.bg_trace_pixel, id(self.trace_dataset.selected_spectrum))
+        else:
+            trace_key = id(trace)
+        key = (trace_key, id(spectrum), self.bg_type_selected, self.bg_separation,
+               self.bg_width, self.bg_statistic_selected)
+        return self._cached_step('bg', key, [trace, spectrum, self.trace_dataset.selected_spectrum],
+                                 lambda: self._build_bg(trace, spectrum))
 
-        return bg
+    def _build_bg(self, trace, spectrum):
+        return _bg_from_params(spectrum, trace, self.bg_type_selected, self.bg_separation,
+                               self.bg_width, self.bg_statistic_selected)
 
     @with_spinner('bg_img_spinner')
     def export_bg_img(self, add_data=False, **kwargs):
@@ -993,15 +1205,32 @@ class SpectralExtraction2D(PluginTemplateMixin):
 
     def _get_ext_trace(self):
         if self.ext_trace_selected == 'From Plugin':
-            return self.export_trace(add_data=False)
+            return self._get_trace()
         else:
             return self.ext_trace.get_selected_spectrum(use_display_units=True)
 
     def _get_ext_input_spectrum(self):
         if self.ext_dataset_selected == 'From Plugin':
-            return self.export_bg_sub(add_data=False)
+            bg = self._get_bg()
+            return self._cached_step('bg_sub', (id(bg),), [bg], bg.sub_image)
         else:
-            return self.ext_dataset.get_selected_spectrum(use_display_units=True)
+            return self.ext_dataset.selected_spectrum
+
+    def _preview_extract_spectrum(self):
+        # same result as export_extract_spectrum, but only recomputes the stages
+        # whose inputs changed since the last preview
+        trace = self._get_ext_trace()
+        inp_sp2d = self._get_ext_input_spectrum()
+        if self.ext_type_selected == 'Boxcar':
+            cumsums = self._cached_step('ext_cumsums', (id(inp_sp2d),), [inp_sp2d],
+                                        lambda: _boxcar_cumsums(inp_sp2d))
+            return _boxcar_extract_from_cumsums(inp_sp2d, cumsums, trace, self.ext_width)
+
+        key = (id(trace), id(inp_sp2d), self.ext_type_selected,
+               self.horne_ext_profile_selected, self.self_prof_n_bins,
+               self.self_prof_interp_degree_x, self.self_prof_interp_degree_y)
+        return self._cached_step('ext', key, [trace, inp_sp2d],
+                                 lambda: self.export_extract().spectrum)
 
     def import_extract(self, ext):
         """
@@ -1031,44 +1260,15 @@ class SpectralExtraction2D(PluginTemplateMixin):
         trace = self._get_ext_trace()
         inp_sp2d = self._get_ext_input_spectrum()
 
-        if self.ext_type_selected == 'Boxcar':
-            ext = extract.BoxcarExtract(inp_sp2d, trace, width=self.ext_width)
-        elif self.ext_type_selected == 'Horne':
-            spatial_profile = None
-            if inp_sp2d.uncertainty is None:
-                inp_sp2d.uncertainty = VarianceUncertainty(np.ones_like(inp_sp2d.data))
-
-            if not hasattr(inp_sp2d.uncertainty, 'uncertainty_type'):
-                inp_sp2d.uncertainty = StdDevUncertainty(inp_sp2d.uncert)
-
-            if self.horne_ext_profile_selected == 'Self (interpolated)':
-
-                # check inputs
-                if self.self_prof_n_bins <= 0:
-                    raise ValueError('`self_prof_n_bins` must be greater than 0.')
-                if self.self_prof_interp_degree_x <= 0:
-                    raise ValueError('`self_prof_interp_degree_x` must be greater than 0.')
-                if self.self_prof_interp_degree_y <= 0:
-                    raise ValueError('`self_prof_interp_degree_y` must be greater than 0.')
-
-                # setup dict of interpolation options
-                n_bins_interpolated_profile = self.self_prof_n_bins
-                interp_degree = (self.self_prof_interp_degree_x, self.self_prof_interp_degree_y)
-                spatial_profile = {'name': 'interpolated_profile',
-                                   'n_bins_interpolated_profile': n_bins_interpolated_profile,
-                                   'interp_degree': interp_degree}
-
-            elif self.horne_ext_profile_selected == 'Gaussian':
-                spatial_profile = 'gaussian'
-
-            else:
-                raise ValueError("Horne extraction profile must either be 'Gaussian' or 'Self (interpolated)'")  # noqa
+        return _extract_from_params(inp_sp2d, trace, **self._ext_params())
 
-            ext = extract.HorneExtract(inp_sp2d, trace, spatial_profile=spatial_profile)
-        else:
-            raise NotImplementedError(f"extraction type '{self.ext_type_selected}' not supported")  # noqa
-
-        return ext
+    def _ext_params(self):
+        return {'ext_type': self.ext_type_selected,
+                'ext_width': self.ext_width,
+                'horne_ext_profile': self.horne_ext_profile_selected,
+                'self_prof_n_bins': self.self_prof_n_bins,
+                'self_prof_interp_degree_x': self.self_prof_interp_degree_x,
+                'self_prof_interp_degree_y': self.self_prof_interp_degree_y}
 
     @with_spinner('spinner')
     def export_extract_spectrum(self, add_data=False, **kwargs):
@@ -1085,23 +1285,114 @@ class SpectralExtraction2D(PluginTemplateMixin):
         spectrum = extract.spectrum
 
         if add_data:
-            # TODO: eventually generalize this logic into add_results_from_plugin
-            if not len(self.marks_viewers1d):
-                # no spectrum1d viewer, create one now and set the default viewer
-                viewer_ref = self.app.return_unique_name('1D Spectrum',
-                                                         typ='viewer')
-                self.app._on_new_viewer(NewViewerMessage(Spectrum1DViewer,
-                                                         data=None,
-                                                         sender=self.app),
-                                        vid=viewer_ref, name=viewer_ref,
-                                        open_data_menu_if_empty=False)
-                self.ext_add_results.viewer = viewer_ref
-
+            self._ensure_spectrum1d_viewer()
             self.ext_add_results.add_results_from_plugin(spectrum,
                                                          format='1D Spectrum',
                                                          replace=False)
 
         return spectrum
 
+    def _ensure_spectrum1d_viewer(self):
+        # TODO: eventually generalize this logic into add_results_from_plugin
+        if not len(self.marks_viewers1d):
+            # no spectrum1d viewer, create one now and set the default viewer
+            viewer_ref = self.app.return_unique_name('1D Spectrum',
+                                                     typ='viewer')
+            self.app._on_new_viewer(NewViewerMessage(Spectrum1DViewer,
+                                                     data=None,
+                                                     sender=self.app),
+                                    vid=viewer_ref, name=viewer_ref,
+                                    open_data_menu_if_empty=False)
+            self.ext_add_results.viewer = viewer_ref
+
+    def export_extract_spectra(self, datasets, add_data=False, labels=None, n_cpu=None):
+        """
+        Extract 1D spectra from many 2D spectra with the trace, background, and
+        extraction parameters currently defined in the plugin, without changing
+        the plugin's selections.
+
+        The trace and background are generated independently for each input, so
+        ``trace_trace``, ``bg_trace`` and ``ext_trace`` must all be set to their
+        defaults ("New Trace" / "From Plugin").  If ``ext_dataset`` is "From Plugin",
+        each input is background-subtracted before extraction, otherwise the
+        extraction is done directly on each input.
+
+        Parameters
+        ----------
+        datasets : list
+            Data labels (of 2D spectra in the app) and/or `~specutils.Spectrum` objects.
+        add_data : bool
+            Whether to add the resulting spectra to the application, according to the
+            options defined in ``ext_add_results``.
+        labels : list of str, optional
+            Data labels for the resulting spectra when ``add_data=True``.  Defaults to
+            the input label with " (extracted)" appended, or the label defined in
+            ``ext_add_results`` for inputs that are not in the app.
+        n_cpu : int, optional
+            Number of processes to use.  If `None`, it will use max cores minus one.
+            Set this to 1 to run in the current process.
+
+        Returns
+        -------
+        spectra : list of `~specutils.Spectrum`
+            Extracted spectra, in the same order as ``datasets``.
+        """
+        if self.trace_trace_selected != 'New Trace':
+            raise ValueError("trace_trace must be 'New Trace' for batch extraction")
+        if self.bg_trace_selected != 'From Plugin' or self.ext_trace_selected != 'From Plugin':
+            raise ValueError("bg_trace and ext_trace must be 'From Plugin' for batch extraction")
+        if labels is not None and len(labels) != len(datasets):
+            raise ValueError("labels must have the same length as datasets")
+
+        spectra = []
+        for dataset in datasets:
+            if isinstance(dataset, str):
+                if dataset not in self.trace_dataset.labels:
+                    raise ValueError(f"{dataset} is not a valid 2D spectrum")
+                dataset = self._specviz_helper.get_data(data_label=dataset, cls=Spectrum,
+                                                        use_display_units=True)
+            elif not isinstance(dataset, Spectrum):
+                raise TypeError("datasets must be data labels or specutils.Spectrum objects")
+            spectra.append(dataset)
+
+        params = {**self._trace_params(), **self._ext_params(),
+                  'bg_type': (self.bg_type_selected
+                              if self.ext_dataset_selected == 'From Plugin' else None),
+                  'bg_trace_pixel': self.bg_trace_pixel,
+                  'bg_separation': self.bg_separation,
+                  'bg_width': self.bg_width,
+                  'bg_statistic': self.bg_statistic_selected}
+
+        if n_cpu is None:
+            n_cpu = mp.cpu_count() - 1
+        n_cpu = max(min(n_cpu, len(spectra)), 1)
+
+        results = [None] * len(spectra)
+        if n_cpu > 1:
+            def collect_result(chunk):
+                for index, spectrum in chunk:
+                    results[index] = spectrum
+
+            workers = (ExtractionWorker([spectra[i] for i in indices], indices, params)
+                       for indices in np.array_split(np.arange(len(spectra)), n_cpu))
+            parallelize_calculation(workers, collect_result, n_cpu=n_cpu)
+        else:
+            worker = ExtractionWorker(spectra, range(len(spectra)), params)
+            results = [worker.extract(sp2d) for sp2d in spectra]
+
+        if add_data and len(results):
+            if labels is None:
+                labels = [f"{dataset} (extracted)" if isinstance(dataset, str)
+                          else self.ext_add_results.label
+                          for dataset in datasets]
+            self._ensure_spectrum1d_viewer()
+            with self.app._jdaviz_helper.batch_load():
+                for spectrum, label in zip(results, labels):
+                    self.ext_add_results.add_results_from_plugin(
+                        spectrum, label=self.app.return_unique_name(label),
+                        format='1D Spectrum', replace=False)
+
+        return results
+
     def vue_extract_spectrum(self, *args):
         self.export_extract_spectrum(add_data=True)
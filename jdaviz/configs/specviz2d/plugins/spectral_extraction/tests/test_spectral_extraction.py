@@ -622,3 +622,95 @@ class TestTwo2dSpectra:
         # Check that the 1D viewer updated its x-axis limits to match the 2D viewer
         expected = (x_min_1d + dx, x_max_1d + dx, y_min_1d, y_max_1d)
         assert_allclose(viewer_1d.get_limits(), expected)
+
+
+@pytest.mark.parametrize('width', [0.5, 3, 4.2, 40])
+def test_boxcar_extract_from_cumsums(width):
+    from jdaviz.configs.specviz2d.plugins.spectral_extraction.spectral_extraction import (
+        _boxcar_cumsums, _boxcar_extract_from_cumsums)
+
+    np.random.seed(42)
+    data = np.random.random((20, 50))
+    data[5, 10] = np.nan
+    data[:, 30] = np.nan
+    sp2d = Spectrum(flux=data * u.Jy, spectral_axis=np.arange(50) * u.um)
+    trace = tracing.ArrayTrace(sp2d, np.linspace(1.3, 18.7, 50))
+
+    expected = extract.BoxcarExtract(sp2d, trace, width=width).spectrum
+    result = _boxcar_extract_from_cumsums(sp2d, _boxcar_cumsums(sp2d), trace, width)
+
+    assert_quantity_allclose(result.spectral_axis, expected.spectral_axis)
+    assert_quantity_allclose(result.flux, expected.flux, equal_nan=True)
+
+    with pytest.raises(ValueError, match="The window width must be positive"):
+        _boxcar_extract_from_cumsums(sp2d, _boxcar_cumsums(sp2d), trace, 0)
+
+
+@pytest.mark.filterwarnings('ignore')
+def test_preview_cache(specviz2d_helper, mos_spectrum2d):
+    specviz2d_helper.load_data(mos_spectrum2d)
+    pext = specviz2d_helper.app.get_tray_item_from_name('spectral-extraction-2d')
+    pext.trace_type_selected = 'Polynomial'
+
+    with pext.as_active():
+        trace = pext._get_trace()
+        # unrelated changes do not refit the trace
+        pext.ext_width = 3
+        assert pext._get_trace() is trace
+        assert pext._get_ext_trace() is trace
+
+        # exported traces are copies of the cached trace
+        exported_trace = pext.export_trace()
+        assert exported_trace is not trace
+        exported_trace.shift(2)
+        assert_allclose(pext._get_trace().trace, trace.trace)
+
+        bg = pext._get_bg()
+        pext.ext_width = 5
+        assert pext._get_bg() is bg
+        pext.bg_width = pext.bg_width + 1
+        assert pext._get_bg() is not bg
+
+        # the cached preview matches the full extraction
+        assert_quantity_allclose(pext._preview_extract_spectrum().flux,
+                                 pext.export_extract_spectrum().flux)
+
+        pext.trace_pixel = pext.trace_pixel + 1
+        assert pext._get_trace() is not trace
+
+    # the cache is released when the plugin is no longer active
+    assert pext._preview_cache == {}
+
+
+@pytest.mark.filterwarnings('ignore')
+@pytest.mark.parametrize('n_cpu', [1, 2])
+def test_export_extract_spectra(specviz2d_helper, n_cpu):
+    # gaussian cross-dispersion profile centered on pixel 7.3
+    y = np.arange(15)[:, np.newaxis]
+    flux = np.exp(-0.5 * ((y - 7.3) / 1.5) ** 2) * np.ones((1, 200))
+    flux += np.random.default_rng(0).normal(0, 0.01, flux.shape)
+    first = Spectrum(flux * u.Jy, spectral_axis=np.arange(200) * u.um)
+    second = Spectrum(2 * flux * u.Jy, spectral_axis=np.arange(200) * u.um)
+    specviz2d_helper.load(first, data_label='first')
+    pext = specviz2d_helper.plugins['2D Spectral Extraction']
+    pext.trace_type = 'Polynomial'
+    pext.bg_type = 'OneSided'
+    pext.bg_separation = 3
+    pext.ext_width = 3
+
+    expected = pext.export_extract_spectrum()
+    n_data = len(specviz2d_helper.app.data_collection)
+
+    spectra = pext.export_extract_spectra(['first', second], n_cpu=n_cpu)
+    assert len(spectra) == 2
+    assert_quantity_allclose(spectra[0].flux, expected.flux)
+    assert_quantity_allclose(spectra[1].flux, 2 * expected.flux)
+    assert len(specviz2d_helper.app.data_collection) == n_data
+
+    pext.export_extract_spectra(['first', second], add_data=True, labels=['a', 'b'], n_cpu=n_cpu)
+    assert {'a', 'b'} <= set(specviz2d_helper.app.data_collection.labels)
+
+    with pytest.raises(ValueError, match='not a valid 2D spectrum'):
+        pext.export_extract_spectra(['not a label'])
+    with pytest.raises(ValueError, match='same length'):
+        pext.export_extract_spectra(['first'], labels=['a', 'b'])
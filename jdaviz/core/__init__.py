@@ -1,2 +1,7 @@
 # Import glue translators because this registers them - not used directly here
 import glue_astronomy.translators as _glue_astronomy_translators  # noqa
+
+# The configs (and the plugins they register) and the core modules import each other, which
+# only resolves when the configs are imported first.  ``import jdaviz`` no longer does that,
+# so do it here for code that imports from ``jdaviz.core`` directly.
+import jdaviz.configs  # noqa
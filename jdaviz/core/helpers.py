@@ -7,6 +7,7 @@ See also https://github.com/spacetelescope/jdaviz/issues/104 for more details
 on the motivation behind this concept.
 """
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from inspect import isclass
 
@@ -18,13 +19,13 @@ from glue.core.subset import Subset, MaskSubsetState
 from glue.config import data_translator
 from ipywidgets.widgets import widget_serialization
 
+from astropy.io import fits
 from astropy.nddata import NDDataArray, CCDData, StdDevUncertainty
 import astropy.units as u
 from astropy.utils.decorators import deprecated
 from regions.core.core import Region
 from specutils import Spectrum, SpectralRegion
 
-from jdaviz.app import Application
 from jdaviz.configs.default.plugins.viewers import JdavizViewerWindow
 from jdaviz.core.events import SnackbarMessage, ExitBatchLoadMessage, SliceSelectSliceMessage
 from jdaviz.core.loaders.resolvers import find_matching_resolver
@@ -61,6 +62,8 @@ class ConfigHelper(HubListener):
 
     def __init__(self, app=None, verbosity=None, history_verbosity=None):
         if app is None:
+            # imported here since jdaviz.app is imported by (and so after) the configs
+            from jdaviz.app import Application
             self.app = Application(configuration=self._default_configuration)
         else:
             self.app = app
@@ -83,6 +86,7 @@ class ConfigHelper(HubListener):
 
         self._in_batch_load = 0
         self._delayed_show_in_viewer_labels = {}  # label: viewer_reference pairs
+        self._deferred_loads = None  # list of load() arguments during a parallel batch_load
 
     def _propagate_callback_to_viewers(self, method, msg):
         # viewers don't have access to the app/hub to subscribe to messages, so we'll
@@ -93,19 +97,40 @@ class ConfigHelper(HubListener):
                 getattr(viewer, method)(msg)
 
     @contextmanager
-    def batch_load(self):
+    def batch_load(self, parallel=False, n_cpu=None):
         """
         Context manager to delay linking and loading data into viewers
+
+        Parameters
+        ----------
+        parallel : bool, optional
+            If `True`, calls to ``load`` within the context are deferred until it exits.
+            The inputs are then read and parsed concurrently in a pool of threads, and the
+            resulting data are added to the app one at a time, in the order in which
+            ``load`` was called.  Deferred calls to ``load`` return `None`.
+        n_cpu : int or `None`, optional
+            Maximum number of threads used to parse the inputs if ``parallel`` is `True`.
+            Defaults to the default of `~concurrent.futures.ThreadPoolExecutor`.
         """
         # we'll use a counter instead of a boolean to allow the user to nest multiple
         # context managers.  Once they're all exited, then the linking/showing will
         # take place.
+        defers_loads = parallel and self._deferred_loads is None
+        if defers_loads:
+            self._deferred_loads = []
         self._in_batch_load += 1
-        with self.app.data_collection.delay_link_manager_update():
-            # user entrypoint (anything within the with-statement will get called here)
-            yield
+        try:
+            with self.app.data_collection.delay_link_manager_update():
+                # user entrypoint (anything within the with-statement will get called here)
+                yield
+                if defers_loads:
+                    deferred_loads, self._deferred_loads = self._deferred_loads, None
+                    self._load_staged(deferred_loads, n_cpu=n_cpu)
+        finally:
+            if defers_loads:
+                self._deferred_loads = None
+            self._in_batch_load -= 1
 
-        self._in_batch_load -= 1
         if not self._in_batch_load:
             self.app.hub.broadcast(ExitBatchLoadMessage(sender=self.app))
 
@@ -115,6 +140,34 @@ class ConfigHelper(HubListener):
                                              visible=True, replace=False)
             self._delayed_show_in_viewer_labels = {}
 
+    def _load_staged(self, deferred_loads, n_cpu=None):
+        """
+        Resolve and parse the inputs of deferred ``load`` calls concurrently, then
+        import them into the data collection serially, in order.
+        """
+        def stage(args, kwargs):
+            resolver = self._stage_load(*args, **kwargs)
+            parsed = resolver._obj.parser.output
+            if isinstance(parsed, fits.HDUList):
+                # FITS extensions are read lazily, so read them here in the worker
+                # thread rather than when the importer builds the data.
+                for hdu in parsed:
+                    hdu.data
+            return resolver
+
+        if not len(deferred_loads):
+            return
+        with ThreadPoolExecutor(max_workers=n_cpu) as executor:
+            futures = [executor.submit(stage, args, kwargs)
+                       for args, kwargs in deferred_loads]
+            # failed inputs are re-raised in turn, after the earlier inputs are imported
+            for future in futures:
+                resolver = future.result()
+                try:
+                    resolver.load()
+                finally:
+                    resolver._obj._cleanup()
+
     def load_data(self, data, data_label=None, parser_reference=None, **kwargs):
         if data_label:
             kwargs['data_label'] = data_label
@@ -201,6 +254,20 @@ class ConfigHelper(HubListener):
             Additional kwargs are passed on to both the loader and importer, as applicable.
             Any kwargs that do not match valid inputs are silently ignored.
         """
+        if self._deferred_loads is not None:
+            self._deferred_loads.append(((inp, loader, format, target), kwargs))
+            return
+        resolver = self._stage_load(inp, loader, format, target, **kwargs)
+        out = resolver.load()
+        # force cleanup before returning
+        resolver._obj._cleanup()
+        return out
+
+    def _stage_load(self, inp=None, loader=None, format=None, target=None, **kwargs):
+        """
+        Find the resolver for ``inp`` and apply ``kwargs`` to its importer, reading the
+        parsed input into memory, without adding anything to the data collection.
+        """
         resolver = find_matching_resolver(self.app, inp,
                                           resolver=loader,
                                           format=format,
@@ -215,10 +282,7 @@ class ConfigHelper(HubListener):
 
         importer = resolver.importer
         importer._obj._apply_kwargs(kwargs)
-        out = resolver.load()
-        # force cleanup before returning
-        resolver._obj._cleanup()
-        return out
+        return resolver
 
     @property
     def data_labels(self):
@@ -272,6 +336,19 @@ class ConfigHelper(HubListener):
     def plugin_plots(self):
         return self.app._plugin_plots
 
+    @property
+    def profiler(self):
+        """
+        Access the profiler of the session, which records (once enabled with
+        ``profiler.enable()``) the wall time and optionally the peak memory allocation of
+        plugin actions, loader stages, hub messages, and image viewer renders.
+
+        Returns
+        -------
+        profiler : `~jdaviz.core.profiling.Profiler`
+        """
+        return self.app.profiler
+
     @property
     def viewers(self):
         """
@@ -723,6 +800,55 @@ class ConfigHelper(HubListener):
         return self._get_data(data_label=data_label,
                               cls=cls, use_display_units=use_display_units)
 
+    def select_stack_source(self, source, data_label=None):
+        """
+        Show another source of a spectrum list loaded as a stack (with
+        ``stack_sources`` enabled in the spectrum list importer).
+
+        The entry of the selected source is updated in place (so viewer settings and
+        auto-updating plugin results are kept).
+
+        Parameters
+        ----------
+        source : int or str
+            Position of the source in the stack, or its label (for example,
+            ``'Exposure 1, Source ID: 1111'``) or source ID.
+        data_label : str or `None`
+            Label of the stack (or of its selected source). Defaults to the most recently
+            loaded stack.
+
+        Returns
+        -------
+        spectrum : `~specutils.Spectrum`
+            Spectrum of the selected source, on its own spectral axis.
+        """
+        dc = self.app.data_collection
+        if data_label is None:
+            stack_labels = [data.label for data in dc if '_spectrum_stack' in data.meta]
+            if not len(stack_labels):
+                raise ValueError("no spectrum stack is loaded")
+            data_label = stack_labels[-1]
+        elif data_label not in dc.labels:
+            raise ValueError(f"{data_label} is not a loaded data entry")
+        data_label = dc[data_label].meta.get('_spectrum_stack_label', data_label)
+        if '_spectrum_stack' not in dc[data_label].meta:
+            raise ValueError(f"{data_label} is not a spectrum stack")
+        stack = dc[data_label].meta['_spectrum_stack']
+        source_label = dc[data_label].meta['_spectrum_stack_source_label']
+
+        index = stack.source_index(source)
+        spec = stack.gridded_spectrum(index)
+        data = dc[source_label]
+        values = {'flux': spec.flux.value, 'mask': spec.mask}
+        if spec.uncertainty is not None:
+            values['uncertainty'] = spec.uncertainty.array
+        data.meta['_spectrum_stack_source'] = index
+        data.meta['source'] = spec.meta['source']
+        data.update_components({data.id[comp]: value for comp, value in values.items()
+                                if comp in data.component_ids()})
+        self.app._update_live_plugin_results(trigger_data_lbl=source_label)
+        return stack[index]
+
 
 class ImageConfigHelper(ConfigHelper):
     """`ConfigHelper` that uses an image viewer as its primary viewer.
@@ -0,0 +1,186 @@
+import threading
+import weakref
+
+from glue.core import HubListener
+from glue.core.message import DataCollectionAddMessage, DataCollectionDeleteMessage
+
+from jdaviz.core.events import SnackbarMessage, SubsetRenameMessage
+
+__all__ = ['LiveResultsScheduler']
+
+
+class LiveResultsScheduler(HubListener):
+    """Schedule the re-computation of auto-updating plugin results.
+
+    Plugin results added with ``auto_update_result`` enabled store their plugin inputs
+    in ``data.meta['_update_live_plugin_results']``, along with the data and subset
+    inputs that they depend on.  This keeps an index from those dependencies to the
+    labels of the results so that an update to data or a subset does not need to scan
+    the whole data collection.
+
+    Triggers are coalesced per result and debounced by ``delay`` seconds, so that
+    dragging a subset only re-computes its dependent results once it settles.  The
+    re-computation then runs in a background thread, one result at a time, and any
+    result that was triggered again in the meantime is skipped in favor of its most
+    recent trigger, so the final state always reflects the final inputs.  With
+    ``delay=0``, results are re-computed immediately in the calling thread.
+
+    Parameters
+    ----------
+    app : `~jdaviz.app.Application`
+        The application whose data collection holds the results.
+    delay : float
+        Debounce delay, in seconds.
+
+    """
+    def __init__(self, app, delay=0.25):
+        self._app = weakref.ref(app)
+        self.delay = delay
+        self._index = None
+        self._pending = {}  # result label -> generation of its latest trigger
+        self._generation = 0
+        self._timer = None
+        self._lock = threading.Lock()  # guards _pending, _generation and _timer
+        self._run_lock = threading.Lock()  # results are re-computed one at a time
+
+        hub = app.hub
+        for msg_cls in (DataCollectionAddMessage, DataCollectionDeleteMessage,
+                        SubsetRenameMessage):
+            hub.subscribe(self, msg_cls, handler=lambda msg: self.invalidate())
+
+    @property
+    def app(self):
+        return self._app()
+
+    def invalidate(self):
+        """Rebuild the dependency index the next time it is needed."""
+        self._index = None
+
+    @property
+    def index(self):
+        """Dictionary from ``('data', label)`` or ``('subset', label)`` to the set of labels
+        of the live results that depend on it."""
+        if self._index is None:
+            index = {}
+            for data in self.app.data_collection:
+                plugin_inputs = data.meta.get('_update_live_plugin_results', None)
+                if plugin_inputs is None:
+                    continue
+                subscriptions = plugin_inputs.get('_subscriptions', {})
+                for kind in ('data', 'subset'):
+                    for attr in subscriptions.get(kind, []):
+                        index.setdefault((kind, plugin_inputs.get(attr)), set()).add(data.label)
+            self._index = index
+        return self._index
+
+    @staticmethod
+    def _matches(plugin_inputs, trigger_data_lbl=None, trigger_subset=None):
+        data_subs = plugin_inputs.get('_subscriptions', {}).get('data', [])
+        subset_subs = plugin_inputs.get('_subscriptions', {}).get('subset', [])
+        if (trigger_data_lbl is not None and
+                not any(plugin_inputs.get(attr) == trigger_data_lbl for attr in data_subs)):
+            # trigger data does not match subscribed data entries
+            return False
+        if trigger_subset is not None:
+            if not any(plugin_inputs.get(attr) == trigger_subset.label for attr in subset_subs):
+                # trigger subset does not match subscribed subsets
+                return False
+            if not any(plugin_inputs.get(attr) == trigger_subset.data.label
+                       for attr in data_subs):
+                # trigger parent data of subset does not match subscribed data entries
+                return False
+        return True
+
+    def dependents(self, trigger_data_lbl=None, trigger_subset=None):
+        """Yield ``(data, plugin_inputs)`` for the live results depending on the given
+        data label and/or subset, in data collection order."""
+        if trigger_subset is not None:
+            labels = self.index.get(('subset', trigger_subset.label), set())
+        elif trigger_data_lbl is not None:
+            labels = self.index.get(('data', trigger_data_lbl), set())
+        else:
+            labels = set.union(set(), *self.index.values())
+        if not labels:
+            return
+        for data in self.app.data_collection:
+            if data.label not in labels:
+                continue
+            plugin_inputs = data.meta.get('_update_live_plugin_results', None)
+            if plugin_inputs is None:
+                continue
+            if self._matches(plugin_inputs, trigger_data_lbl, trigger_subset):
+                yield data, plugin_inputs
+
+    def schedule(self, trigger_data_lbl=None, trigger_subset=None, delay=None):
+        """Schedule re-computation of the live results depending on the given data label
+        and/or subset, after ``delay`` seconds (defaults to ``self.delay``)."""
+        labels = [data.label for data, _ in self.dependents(trigger_data_lbl, trigger_subset)]
+        if not labels:
+            return
+        delay = self.delay if delay is None else delay
+        with self._lock:
+            self._generation += 1
+            for label in labels:
+                # re-inserting moves the label to the end so results run in trigger order
+                self._pending.pop(label, None)
+                self._pending[label] = self._generation
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if delay > 0:
+                self._timer = threading.Timer(delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if delay <= 0:
+            self.flush()
+
+    def cancel(self, labels=None):
+        """Drop pending re-computations of the given result labels (or all of them)."""
+        with self._lock:
+            for label in list(self._pending if labels is None else labels):
+                self._pending.pop(label, None)
+
+    def flush(self):
+        """Re-compute all pending results now, in the calling thread."""
+        with self._run_lock:
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        return
+                    label = next(iter(self._pending))
+                    generation = self._pending.pop(label)
+                self._run(label, generation)
+
+    @property
+    def is_pending(self):
+        """Whether any re-computation is waiting to run."""
+        return len(self._pending) > 0
+
+    def _is_stale(self, label, generation):
+        # a newer trigger for the same result was scheduled after this one was dequeued
+        return self._pending.get(label, generation) > generation
+
+    def _run(self, label, generation):
+        app = self.app
+        if app is None or label not in app.data_collection.labels:
+            # result was removed since it was scheduled
+            return
+        data = app.data_collection[label]
+        plugin_inputs = data.meta.get('_update_live_plugin_results', None)
+        if plugin_inputs is None or self._is_stale(label, generation):
+            return
+        # update and overwrite data
+        # make a new instance of the plugin to avoid changing any UI settings
+        plg = app._jdaviz_helper.plugins.get(data.meta.get('plugin'))._obj.new()
+        if not plg.supports_auto_update:
+            raise NotImplementedError(f"{data.meta.get('plugin')} does not support live-updates")  # noqa
+        plg.user_api.from_dict(plugin_inputs)
+        # keep auto-updating, even if the option is hidden from the user API
+        # (can remove this line if auto_update is exposed to the user API in the future)
+        plg.add_results.auto_update_result = True
+        try:
+            plg()
+        except Exception as e:
+            app.hub.broadcast(SnackbarMessage(
+                f"Auto-update for {plugin_inputs['add_results']['label']} failed: {e}",
+                sender=app, color="error"))
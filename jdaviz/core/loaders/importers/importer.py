@@ -24,6 +24,7 @@ class BaseImporter(PluginTemplateMixin):
     # over any parsers not included in the list).  If not empty but no valid parsers are in
     # the list, the first remaining match will be used.
     parser_preference = []
+    _profile_category = 'loader'
 
     import_disabled = Bool(False).tag(sync=True)
     import_spinner = Bool(False).tag(sync=True)
@@ -307,6 +308,10 @@ class BaseImporterToDataCollection(BaseImporter):
         if self.app.config in CONFIGS_WITH_LOADERS:
             self.app._link_new_data_by_component_type(data_label)
 
+        if viewer_select is False:
+            # only added to the data collection, can be added to viewers from their data menus
+            return
+
         viewer_select = viewer_select if viewer_select is not None else self.viewer
         if viewer_select.create_new.selected:
             viewer_reference = viewer_select.create_new.selected_item.get('reference')
@@ -1,5 +1,8 @@
+import tempfile
 import numpy as np
 import warnings
+from collections import OrderedDict
+from functools import cached_property
 from traitlets import Any, Bool, List, Unicode, observe
 from astropy import units as u
 from astropy.io import fits
@@ -28,7 +31,12 @@ from jdaviz.utils import (standardize_metadata,
                           PRIHDR_KEY)
 
 
-__all__ = ['RampImporter']
+__all__ = ['RampImporter', 'RampIntegrations']
+
+# group differences are computed in chunks of about this size
+_DIFF_CHUNK_BYTES = 64 * 1024**2
+# larger diff cubes are backed by a temporary file instead of memory
+_DIFF_MEMMAP_BYTES = 2 * 1024**3
 
 
 def move_group_axis_last(x):
@@ -38,6 +46,130 @@ def move_group_axis_last(x):
     return np.transpose(x, (1, 2, 0))
 
 
+def diff_dtype(dtype):
+    """
+    Smallest data type that can hold the differences between groups of a ramp
+    with data type ``dtype`` without overflowing.
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind in 'biu':
+        # differences of (unsigned) integers can be negative and need one more bit,
+        # uint16 raw ramps become int32 instead of int64 or float64:
+        return np.dtype(f'i{min(2 * dtype.itemsize, 8)}')
+    return dtype
+
+
+def group_differences(ramp_data, chunk_bytes=_DIFF_CHUNK_BYTES, memmap_bytes=_DIFF_MEMMAP_BYTES):
+    """
+    Differences between consecutive groups of a ramp.
+
+    Parameters
+    ----------
+    ramp_data : array-like
+        Ramp with the group axis first, as stored in ramp files. Memory-mapped
+        arrays are only read one chunk at a time.
+    chunk_bytes : int
+        Approximate size of the chunks of the ramp read at a time.
+    memmap_bytes : int
+        Diff cubes larger than this are written to a memory-mapped temporary file.
+
+    Returns
+    -------
+    diff_data : `~numpy.ndarray`
+        Differences with the group axis last, beginning with a group of zeros so that
+        it has the same shape as ``move_group_axis_last(ramp_data)``. The data type
+        is given by `diff_dtype`.
+    """
+    n_groups, ny, nx = ramp_data.shape
+    shape, dtype = (ny, nx, n_groups), diff_dtype(ramp_data.dtype)
+    if np.prod(shape) * dtype.itemsize > memmap_bytes:
+        # the mapping stays valid after the temporary file is closed (and deleted)
+        with tempfile.TemporaryFile() as f:
+            diff_data = np.memmap(f, dtype=dtype, mode='w+', shape=shape)
+    else:
+        diff_data = np.empty(shape, dtype=dtype)
+    diff_data[..., 0] = 0
+
+    # view of the output with the group axis first, to match the input
+    diff_groups_first = np.moveaxis(diff_data, -1, 0)
+    rows_per_chunk = max(1, chunk_bytes // max(1, n_groups * nx * dtype.itemsize))
+    for start in range(0, ny, rows_per_chunk):
+        rows = slice(start, start + rows_per_chunk)
+        chunk = np.asarray(ramp_data[:, rows])
+        np.subtract(chunk[1:], chunk[:-1], out=diff_groups_first[1:, rows], dtype=dtype)
+    return diff_data
+
+
+class RampIntegrations:
+    """
+    On-demand access to the integrations of a ramp file.
+
+    Integrations are only read when they are requested, and the most recently
+    requested integrations are kept in memory along with their group differences,
+    so that stepping back and forth between integrations does not re-read the file.
+
+    Parameters
+    ----------
+    ramp_data : array-like
+        Ramp with the integration axis first and the group axis second, or a single
+        integration with the group axis first. Memory-mapped arrays and FITS sections
+        (`~astropy.io.fits.Section`) are only read one integration at a time.
+    unit : `~astropy.units.Unit`
+        Unit of the ramp.
+    cache_size : int
+        Number of integrations to keep in memory.
+    """
+    def __init__(self, ramp_data, unit=u.DN, cache_size=4):
+        self._ramp_data = ramp_data
+        self._single = len(ramp_data.shape) == 3
+        self.unit = unit
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return 1 if self._single else self._ramp_data.shape[0]
+
+    @property
+    def shape(self):
+        """Shape of the ramp cube of each integration, with the group axis last."""
+        n_groups, ny, nx = self._ramp_data.shape[-3:]
+        return ny, nx, n_groups
+
+    def _read(self, integration):
+        integration = int(integration)
+        if not 0 <= integration < len(self):
+            raise IndexError(f"integration {integration} out of range for ramp "
+                             f"with {len(self)} integrations")
+        return self._ramp_data if self._single else self._ramp_data[integration]
+
+    def __getitem__(self, integration):
+        """
+        Ramp and diff cubes of an integration, with the group axis last.
+        """
+        integration = int(integration)
+        if integration in self._cache:
+            self._cache.move_to_end(integration)
+            return self._cache[integration]
+
+        ramp_data = self._read(integration)
+        cubes = move_group_axis_last(np.asarray(ramp_data)), group_differences(ramp_data)
+        self._cache[integration] = cubes
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return cubes
+
+    def iter_ramps(self):
+        """
+        Iterate over the ramp cubes of all integrations (group axis last), reading one
+        integration at a time without adding them to the cache.
+        """
+        for integration in range(len(self)):
+            if integration in self._cache:
+                yield self._cache[integration][0]
+            else:
+                yield move_group_axis_last(np.asarray(self._read(integration)))
+
+
 @loader_importer_registry('Ramp')
 class RampImporter(BaseImporterToDataCollection):
     template_file = __file__, "./ramp.vue"
@@ -100,7 +232,8 @@ class RampImporter(BaseImporterToDataCollection):
             integration_options = [str(i) for i in range(len(self.input.data))]
         elif isinstance(self.input, fits.HDUList):
             # TODO: this will need to be adjusted if adding extension selection
-            integration_options = [str(i) for i in range(len(self.input[1].data))]
+            # (the number of integrations is read from the header to avoid reading the ramp)
+            integration_options = [str(i) for i in range(self.input[1].header.get('NAXIS4', 0))]
         else:
             integration_options = []
         self.integration = SelectPluginComponent(self,
@@ -219,9 +352,12 @@ class RampImporter(BaseImporterToDataCollection):
             return False
 
         try:
-            self.output
+            # integrations (and their diff cubes) are only read on import
+            _, integrations = self._ramp_integrations
         except Exception:
             return False
+        if len(integrations.shape) != 3:
+            return False
         return True
 
     @observe('data_label_value', 'function_selected')
@@ -231,12 +367,22 @@ class RampImporter(BaseImporterToDataCollection):
         self.ext_data_label_default = f"{base} ({self.function_selected.lower()})"
 
     @property
-    def output(self):
-        integration = 0  # TODO: integration/extension select
-
+    def integration_index(self):
+        """Index of the integration to load."""
+        if self.integration_selected == '':
+            return 0
+        return int(self.integration_selected)
+
+    @cached_property
+    def _ramp_integrations(self):
+        """
+        The metadata and the `RampIntegrations` of the input, from which the
+        ramp of each integration is read on demand in its native data type.
+        """
         # NOTE: each if-statement should provide meta and ramp_data
         # if there is specific handling for flux_unit, ramp_data should
         # be a quantity with the unit attached
+        flux_unit = None
         if Level1bModel is not None and isinstance(self.input, Level1bModel):
             meta = standardize_metadata({
                 key: value for key, value in self.input.to_flat_dict(
@@ -245,7 +391,7 @@ class RampImporter(BaseImporterToDataCollection):
                 if key.startswith('meta')
             })
 
-            ramp_data = self.input.data[integration]
+            ramp_data = self.input.data
         elif (RampModel is not None and ScienceRawModel is not None
               and isinstance(self.input, (RampModel, ScienceRawModel))):
             meta = standardize_roman_metadata(self.input)
@@ -269,32 +415,38 @@ class RampImporter(BaseImporterToDataCollection):
                 warnings.warn("Invalid BUNIT, using DN as data unit", UserWarning)
                 flux_unit = u.DN
 
-            # index the ramp array by the integration to load. returns all groups and pixels.
-            # cast from uint16 to integers:
-            ramp_data = hdu.data[integration].astype(int) * flux_unit
+            # For HDUs backed by a file whose data was not read yet, the section reads only
+            # the integrations that are requested (in the native, usually uint16, data type)
+            # instead of the full (and possibly rescaled) 4D array:
+            if hdu._data_loaded or hdu._data_offset is None:
+                ramp_data = hdu.data
+            else:
+                ramp_data = hdu.section
         elif isinstance(self.input, np.ndarray):
             meta = {}
             ramp_data = self.input
         else:
             raise NotImplementedError(f"Unsupported input for RampImporter: {type(self.input)}")
 
-        # last axis is the group axis, first two are spatial axes:
-        diff_data = np.vstack([
-            # begin with a group of zeros, so
-            # that `diff_data.ndim == data.ndim`
-            np.zeros((1, *ramp_data[0].shape)),
-            np.diff(ramp_data, axis=0)
-        ])
+        if isinstance(ramp_data, u.Quantity):
+            flux_unit = ramp_data.unit
+            ramp_data = ramp_data.value
+        elif flux_unit is None:
+            # if the ramp cube has no units, assume DN:
+            flux_unit = u.DN
 
-        # if the ramp cube has no units, assume DN:
-        flux_unit = getattr(ramp_data, 'unit', u.DN)
+        return meta, RampIntegrations(ramp_data, unit=flux_unit)
 
-        ramp_cube = NDDataArray(move_group_axis_last(ramp_data),
-                                unit=flux_unit,
-                                meta=meta)
-        diff_cube = NDDataArray(move_group_axis_last(diff_data),
-                                unit=flux_unit,
-                                meta=meta)
+    @property
+    def output(self):
+        meta, integrations = self._ramp_integrations
+        ramp_data, diff_data = integrations[self.integration_index]
+
+        # last axis is the group axis, first two are spatial axes.
+        # Neither cube is a copy of the ramp in a wider data type (the ramp is only
+        # transposed) and the diff cube is computed in chunks:
+        ramp_cube = NDDataArray(ramp_data, unit=integrations.unit, meta=meta)
+        diff_cube = NDDataArray(diff_data, unit=integrations.unit, meta=meta)
 
         return ramp_cube, diff_cube
 
@@ -305,8 +457,10 @@ class RampImporter(BaseImporterToDataCollection):
         ext_data_label = self.ext_data_label_value
 
         ramp_cube, diff_cube = self.output
+        _, integrations = self._ramp_integrations
 
         ramp_cube.meta['_ramp_type'] = 'group'
+        ramp_cube.meta['_ramp_integration'] = self.integration_index
         self.add_to_data_collection(ramp_cube,
                                     data_label,
                                     viewer_select=self.viewer)
@@ -317,11 +471,18 @@ class RampImporter(BaseImporterToDataCollection):
         self.app._jdaviz_helper.cube_cache[data_label] = ramp_cube
 
         diff_cube.meta['_ramp_type'] = 'diff'
+        diff_cube.meta['_ramp_integration'] = self.integration_index
         self.add_to_data_collection(diff_cube,
                                     diff_data_label,
                                     viewer_select=self.diff_viewer)
         self.app._jdaviz_helper.cube_cache[diff_data_label] = diff_cube
 
+        # other integrations are loaded on demand, see Rampviz.select_integration
+        if not hasattr(self.app._jdaviz_helper, 'ramp_integrations'):
+            self.app._jdaviz_helper.ramp_integrations = {}
+        self.app._jdaviz_helper.ramp_integrations[data_label] = integrations
+        self.app._jdaviz_helper.ramp_integrations[diff_data_label] = integrations
+
         if not self.auto_extract:
             return
 
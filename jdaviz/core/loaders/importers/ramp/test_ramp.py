@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+from astropy.io import fits
+from numpy.testing import assert_array_equal
+
+from jdaviz.core.loaders.importers.ramp.ramp import (RampIntegrations, diff_dtype,
+                                                     group_differences, move_group_axis_last)
+
+
+@pytest.mark.parametrize(('dtype', 'expected'), [(np.uint16, np.int32), (np.int16, np.int32),
+                                                 (np.uint32, np.int64), (np.float32, np.float32),
+                                                 (np.float64, np.float64)])
+def test_diff_dtype(dtype, expected):
+    assert diff_dtype(dtype) == expected
+
+
+@pytest.mark.parametrize('chunk_bytes', [1, 100, 2**30])
+@pytest.mark.parametrize('memmap_bytes', [0, 2**30])
+def test_group_differences(chunk_bytes, memmap_bytes):
+    rng = np.random.default_rng(seed=42)
+    ramp = rng.integers(0, 2**16, size=(6, 11, 7)).astype(np.uint16)
+
+    diff = group_differences(ramp, chunk_bytes=chunk_bytes, memmap_bytes=memmap_bytes)
+    expected = np.concatenate([np.zeros((1, 11, 7)), np.diff(ramp.astype(float), axis=0)])
+    assert diff.dtype == np.int32
+    assert isinstance(diff, np.memmap) == (memmap_bytes == 0)
+    assert_array_equal(diff, move_group_axis_last(expected))
+
+
+class CountingRamp:
+    # stand-in for a memory-mapped ramp that records which integrations are read
+    def __init__(self, data):
+        self.data = data
+        self.shape = data.shape
+        self.reads = []
+
+    def __getitem__(self, integration):
+        self.reads.append(integration)
+        return self.data[integration]
+
+
+def test_ramp_integrations():
+    rng = np.random.default_rng(seed=42)
+    ramp = CountingRamp(rng.integers(0, 2**16, size=(5, 4, 3, 2)).astype(np.uint16))
+    integrations = RampIntegrations(ramp, cache_size=2)
+    assert len(integrations) == 5
+    assert integrations.shape == (3, 2, 4)
+
+    ramp_data, diff_data = integrations[3]
+    assert_array_equal(ramp_data, move_group_axis_last(ramp.data[3]))
+    assert_array_equal(diff_data, group_differences(ramp.data[3]))
+
+    # recently selected integrations are not read again, the least recent is evicted
+    integrations[1]
+    integrations[3]
+    integrations[0]
+    integrations[3]
+    assert ramp.reads == [3, 1, 0]
+    integrations[1]
+    assert ramp.reads == [3, 1, 0, 1]
+
+    # the streaming pass reads integrations that are not cached, without caching them
+    ramps = list(integrations.iter_ramps())
+    assert ramp.reads == [3, 1, 0, 1, 0, 2, 4]
+    assert list(integrations._cache) == [3, 1]
+    for integration, ramp_data in enumerate(ramps):
+        assert_array_equal(ramp_data, move_group_axis_last(ramp.data[integration]))
+
+    with pytest.raises(IndexError):
+        integrations[5]
+
+    # a single integration
+    assert len(RampIntegrations(ramp.data[0])) == 1
+    assert_array_equal(RampIntegrations(ramp.data[0])[0][0], move_group_axis_last(ramp.data[0]))
+
+
+def test_load_uint16_fits_ramp(rampviz_helper, tmp_path):
+    rng = np.random.default_rng(seed=42)
+    ramp = np.cumsum(rng.integers(0, 2**10, size=(2, 8, 6, 5)), axis=1).astype(np.uint16)
+    filename = tmp_path / 'ramp.fits'
+    hdu = fits.ImageHDU(ramp, name='SCI')
+    hdu.header['BUNIT'] = 'DN'
+    fits.HDUList([fits.PrimaryHDU(), hdu]).writeto(filename)
+
+    with fits.open(filename) as hdulist:
+        rampviz_helper.load(hdulist, format='Ramp', data_label='ramp')
+        # only the loaded integration was read from the file
+        assert not hdulist[1]._data_loaded
+
+    ramp_cube = rampviz_helper.cube_cache['ramp']
+    diff_cube = rampviz_helper.cube_cache['ramp[DIFF]']
+    # the ramp keeps its native data type and the diff cube uses the smallest safe one
+    assert ramp_cube.data.dtype == np.uint16
+    assert diff_cube.data.dtype == np.int32
+    assert_array_equal(ramp_cube.data, move_group_axis_last(ramp[0]))
+    assert_array_equal(diff_cube.data[..., 1:],
+                       move_group_axis_last(np.diff(ramp[0].astype(int), axis=0)))
+    assert_array_equal(diff_cube.data[..., 0], 0)
+
+
+def test_select_integration(rampviz_helper, tmp_path):
+    rng = np.random.default_rng(seed=42)
+    ramp = np.cumsum(rng.integers(0, 2**10, size=(3, 8, 6, 5)), axis=1).astype(np.uint16)
+    filename = tmp_path / 'ramp.fits'
+    hdu = fits.ImageHDU(ramp, name='SCI')
+    hdu.header['BUNIT'] = 'DN'
+    fits.HDUList([fits.PrimaryHDU(), hdu]).writeto(filename)
+
+    with fits.open(filename) as hdulist:
+        rampviz_helper.load(hdulist, format='Ramp', data_label='ramp', integration='1')
+        ramp_dc = rampviz_helper.app.data_collection['ramp']
+        assert ramp_dc.meta['_ramp_integration'] == 1
+        assert_array_equal(ramp_dc.get_component('data').data, move_group_axis_last(ramp[1]))
+
+        rampviz_helper.select_integration(2)
+        assert not hdulist[1]._data_loaded
+
+    diff_dc = rampviz_helper.app.data_collection['ramp[DIFF]']
+    for data in (ramp_dc, diff_dc):
+        assert data.meta['_ramp_integration'] == 2
+    assert_array_equal(ramp_dc.get_component('data').data, move_group_axis_last(ramp[2]))
+    assert_array_equal(rampviz_helper.cube_cache['ramp'].data, move_group_axis_last(ramp[2]))
+    assert_array_equal(diff_dc.get_component('data').data, group_differences(ramp[2]))
+
+    # the last integrations stay in memory after the file is closed
+    rampviz_helper.select_integration(1)
+    assert_array_equal(ramp_dc.get_component('data').data, move_group_axis_last(ramp[1]))
+
+    with pytest.raises(ValueError, match='not a loaded ramp cube'):
+        rampviz_helper.select_integration(0, data_label='ramp (median)')
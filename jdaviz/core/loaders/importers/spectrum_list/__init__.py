@@ -1 +1,2 @@
-from .spectrum_list import *  # noqa
\ No newline at end of file
+from .spectrum_list import *  # noqa
+from .spectrum_stack import *  # noqa
@@ -3,6 +3,7 @@ import numpy as np
 import warnings
 
 from astropy.nddata import StdDevUncertainty
+from astropy.table import Table
 from specutils import Spectrum, SpectrumList, SpectrumCollection
 from traitlets import List, Bool, Any, observe
 
@@ -11,6 +12,7 @@ from jdaviz.core.unit_conversion_utils import (to_flux_density_unit,
 from jdaviz.core.registries import loader_importer_registry
 from jdaviz.core.loaders.importers import (BaseImporterToDataCollection,
                                            _spectrum_assign_component_type)
+from jdaviz.core.loaders.importers.spectrum_list.spectrum_stack import SpectrumStack
 from jdaviz.core.template_mixin import SelectFileExtensionComponent
 from jdaviz.core.user_api import ImporterUserApi
 from jdaviz.core.events import SnackbarMessage
@@ -30,6 +32,7 @@ class SpectrumListImporter(BaseImporterToDataCollection):
 
     input_in_sb = Bool(False).tag(sync=True)
     convert_to_flux_density = Bool(True).tag(sync=True)
+    stack_sources = Bool(False).tag(sync=True)
 
     disable_dropdown = Bool(False).tag(sync=True)
 
@@ -110,7 +113,7 @@ class SpectrumListImporter(BaseImporterToDataCollection):
 
     @property
     def user_api(self):
-        expose = ['sources', 'convert_to_flux_density']
+        expose = ['sources', 'convert_to_flux_density', 'stack_sources']
         return ImporterUserApi(self, expose)
 
     @property
@@ -247,10 +250,33 @@ class SpectrumListImporter(BaseImporterToDataCollection):
     def assign_component_type(self, comp_id, comp, units, physical_type):
         return _spectrum_assign_component_type(comp_id, comp, units, physical_type)
 
+    def _stack_selected_sources(self):
+        index = Table(rows=[[item[k] for k in ('label', 'name', 'ver', 'suffix')]
+                            for item in self.sources.selected_item_list],
+                      names=('label', 'name', 'ver', 'suffix'), dtype=(str, str, str, str))
+        return SpectrumStack.from_spectra(self.output, index=index)
+
     def __call__(self):
         if not self.sources.selected:
             raise ValueError("No sources selected.")
 
+        if self.stack_sources:
+            # one entry with all the sources (shown stacked), and one with the selected source
+            # (see ``select_stack_source``), instead of one entry per source
+            stack = self._stack_selected_sources()
+            stack_label = f"{self.data_label_value}_stack"
+            source_label = f"{self.data_label_value}_source"
+            with self.app._jdaviz_helper.batch_load():
+                self.add_to_data_collection(stack.gridded_spectrum(), stack_label,
+                                            viewer_select=False)
+                self.add_to_data_collection(stack.gridded_spectrum(0), source_label)
+            dc = self.app.data_collection
+            dc[stack_label].meta.update({'_spectrum_stack': stack,
+                                         '_spectrum_stack_source_label': source_label})
+            dc[source_label].meta.update({'_spectrum_stack_label': stack_label,
+                                          '_spectrum_stack_source': 0})
+            return
+
         with self.app._jdaviz_helper.batch_load():
             for spec_obj, item_dict in zip(self.output, self.sources.selected_item_list):
                 data_label = f"{self.data_label_value}_{item_dict['suffix']}"
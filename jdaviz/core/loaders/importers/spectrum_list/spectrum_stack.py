@@ -0,0 +1,220 @@
+from functools import cached_property
+
+import numpy as np
+from astropy import units as u
+from astropy.nddata import StdDevUncertainty
+from astropy.table import Table
+from specutils import Spectrum
+
+__all__ = ['SpectrumStack']
+
+
+class SpectrumStack:
+    """
+    Columnar storage of many 1D spectra with different spectral axes, such as the sources
+    of a WFSS multi-source product.
+
+    The samples of all the spectra are stored in flat (ragged) arrays, with the offset of
+    each spectrum into those arrays and an index table with one row per spectrum, so that
+    thousands of spectra can be loaded as a single data entry. For display, the spectra
+    are also interpolated onto a common spectral grid (or used as-is if they already
+    share their spectral axis) as a 2D array with one row per spectrum.
+
+    Parameters
+    ----------
+    spectral_axis, flux : `~astropy.units.Quantity`
+        Concatenated spectral axes and fluxes of the spectra.
+    offsets : array-like
+        Start of each spectrum in the concatenated arrays, followed by their total length.
+    uncertainty : array-like or `None`
+        Concatenated standard deviation uncertainties, in the units of ``flux``.
+    mask : array-like or `None`
+        Concatenated masks.
+    index : `~astropy.table.Table` or `None`
+        Table with one row per spectrum.  A ``label`` column is used to select spectra
+        by label.
+    meta : dict or `None`
+        Metadata of the stack.
+    """
+    def __init__(self, spectral_axis, flux, offsets, uncertainty=None, mask=None,
+                 index=None, meta=None):
+        self.spectral_axis = spectral_axis
+        self.flux = flux
+        self.offsets = np.asarray(offsets, dtype=int)
+        self.uncertainty = None if uncertainty is None else np.asarray(uncertainty)
+        self.mask = None if mask is None else np.asarray(mask, dtype=bool)
+        if index is None:
+            index = Table({'label': [f"1D Spectrum at index: {i}" for i in range(len(self))]})
+        else:
+            index = Table(index, copy=False)
+        if len(index) != len(self):
+            raise ValueError(f"index has {len(index)} rows for {len(self)} spectra")
+        index['length'] = self.lengths
+        self.index = index
+        self.meta = {} if meta is None else meta
+
+    @classmethod
+    def from_spectra(cls, spectra, index=None, meta=None):
+        """
+        Stack a list of 1D `~specutils.Spectrum` objects, which must have compatible
+        spectral and flux units.
+        """
+        spectra = list(spectra)
+        if not len(spectra):
+            raise ValueError("no spectra to stack")
+        spectral_unit = spectra[0].spectral_axis.unit
+        flux_unit = spectra[0].flux.unit
+        has_uncertainty = any(spec.uncertainty is not None for spec in spectra)
+        has_mask = any(spec.mask is not None for spec in spectra)
+
+        spectral_axes, fluxes, uncertainties, masks = [], [], [], []
+        for spec in spectra:
+            if spec.flux.ndim != 1:
+                raise ValueError("only 1D spectra can be stacked")
+            # the values under masked spectral axes or fluxes are kept, masks come from spec.mask
+            spectral_axis = getattr(spec.spectral_axis, 'unmasked', spec.spectral_axis)
+            flux = getattr(spec.flux, 'unmasked', spec.flux)
+            try:
+                spectral_axes.append(u.Quantity(spectral_axis).to_value(spectral_unit,
+                                                                        u.spectral()))
+                fluxes.append(u.Quantity(flux).to_value(flux_unit))
+            except u.UnitConversionError:
+                raise ValueError("spectra of a stack must have compatible units")
+            if has_uncertainty:
+                if spec.uncertainty is None:
+                    uncertainties.append(np.full(spec.flux.shape, np.nan))
+                else:
+                    uncertainty = spec.uncertainty.represent_as(StdDevUncertainty)
+                    uncertainties.append(u.Quantity(uncertainty.array,
+                                                    spec.flux.unit).to_value(flux_unit))
+            if has_mask:
+                masks.append(np.zeros(spec.flux.shape, dtype=bool) if spec.mask is None
+                             else np.asarray(spec.mask, dtype=bool))
+
+        offsets = np.concatenate([[0], np.cumsum([len(flux) for flux in fluxes])])
+        return cls(np.concatenate(spectral_axes) * spectral_unit,
+                   np.concatenate(fluxes) * flux_unit,
+                   offsets,
+                   uncertainty=np.concatenate(uncertainties) if has_uncertainty else None,
+                   mask=np.concatenate(masks) if has_mask else None,
+                   index=index, meta=meta)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def lengths(self):
+        """Number of samples of each spectrum."""
+        return np.diff(self.offsets)
+
+    def source_index(self, source):
+        """
+        Position of a spectrum in the stack, from its position, or from its value in the
+        ``label``, ``name`` or ``suffix`` columns of the index.
+        """
+        if isinstance(source, (int, np.integer)):
+            if not -len(self) <= source < len(self):
+                raise IndexError(f"source {source} out of range for {len(self)} spectra")
+            return int(source) % len(self)
+        for column in ('label', 'name', 'suffix'):
+            if column in self.index.colnames:
+                matches = np.flatnonzero(self.index[column] == str(source))
+                if len(matches):
+                    return int(matches[0])
+        raise ValueError(f"{source} is not a source of the stack")
+
+    def _source_meta(self, i):
+        return {name: self.index[name][i].item() for name in self.index.colnames}
+
+    def __getitem__(self, source):
+        i = self.source_index(source)
+        sl = slice(self.offsets[i], self.offsets[i + 1])
+        uncertainty = self.uncertainty
+        return Spectrum(spectral_axis=self.spectral_axis[sl],
+                        flux=self.flux[sl],
+                        uncertainty=None if uncertainty is None else StdDevUncertainty(
+                            uncertainty[sl]),
+                        mask=None if self.mask is None else self.mask[sl],
+                        meta={**self.meta, 'source': self._source_meta(i)})
+
+    @property
+    def _shares_spectral_axis(self):
+        lengths = self.lengths
+        if np.any(lengths != lengths[0]):
+            return False
+        rows = self.spectral_axis.value.reshape(len(self), lengths[0])
+        return bool(np.all(rows == rows[0]))
+
+    @cached_property
+    def spectral_grid(self):
+        """
+        Common spectral axis of the stack: the spectral axis of the spectra if they all
+        share it, otherwise a uniform grid spanning all of them with the median sampling of
+        the spectra.
+        """
+        if self._shares_spectral_axis:
+            return self.spectral_axis[:self.lengths[0]]
+        values = self.spectral_axis.value
+        unit = self.spectral_axis.unit
+        steps = np.abs(np.diff(values))
+        # exclude the steps between the end of a spectrum and the start of the next
+        steps[self.offsets[1:-1] - 1] = np.nan
+        steps = steps[np.isfinite(steps) & (steps > 0)]
+        if not len(steps):
+            return np.unique(values) * unit
+        step = np.median(steps)
+        vmin, vmax = np.nanmin(values), np.nanmax(values)
+        return np.linspace(vmin, vmax, int(round((vmax - vmin) / step)) + 1) * unit
+
+    @cached_property
+    def _gridded(self):
+        grid = self.spectral_grid.value
+        n = len(self)
+        if self._shares_spectral_axis:
+            shape = (n, len(grid))
+            flux = self.flux.value.reshape(shape)
+            uncertainty = None if self.uncertainty is None else self.uncertainty.reshape(shape)
+            mask = (np.zeros(shape, dtype=bool) if self.mask is None
+                    else self.mask.reshape(shape))
+            return flux, uncertainty, mask
+
+        flux = np.full((n, len(grid)), np.nan)
+        uncertainty = None if self.uncertainty is None else np.full_like(flux, np.nan)
+        mask = np.ones(flux.shape, dtype=bool)
+        values = self.spectral_axis.value
+        for i in range(n):
+            sl = slice(self.offsets[i], self.offsets[i + 1])
+            x = values[sl]
+            if len(x) == 0:
+                continue
+            order = np.argsort(x)
+            x = x[order]
+            flux[i] = np.interp(grid, x, self.flux.value[sl][order], left=np.nan, right=np.nan)
+            if uncertainty is not None:
+                uncertainty[i] = np.interp(grid, x, self.uncertainty[sl][order],
+                                           left=np.nan, right=np.nan)
+            # grid points outside of a spectrum or next to a masked sample are masked
+            sample_mask = (np.zeros(len(x)) if self.mask is None
+                           else self.mask[sl][order].astype(float))
+            mask[i] = np.interp(grid, x, sample_mask, left=1, right=1) > 0
+        return flux, uncertainty, mask
+
+    def gridded_spectrum(self, source=None):
+        """
+        Spectra of the stack on the common spectral grid, as a 2D `~specutils.Spectrum`
+        with one row per spectrum, or the 1D spectrum of a single ``source``.
+        """
+        flux, uncertainty, mask = self._gridded
+        meta = dict(self.meta)
+        if source is not None:
+            i = self.source_index(source)
+            flux = flux[i]
+            uncertainty = None if uncertainty is None else uncertainty[i]
+            mask = mask[i]
+            meta['source'] = self._source_meta(i)
+        return Spectrum(spectral_axis=self.spectral_grid,
+                        flux=flux * self.flux.unit,
+                        uncertainty=None if uncertainty is None else StdDevUncertainty(
+                            uncertainty),
+                        mask=mask,
+                        meta=meta)
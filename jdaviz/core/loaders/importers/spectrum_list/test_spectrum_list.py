@@ -12,6 +12,7 @@ from jdaviz.core.loaders.importers.spectrum_list.spectrum_list import (
     SpectrumListImporter,
     combine_lists_to_1d_spectrum
 )
+from jdaviz.core.loaders.importers.spectrum_list.spectrum_stack import SpectrumStack
 
 from jdaviz.conftest import FakeSpectrumListImporter, FakeSpectrumListConcatenatedImporter
 from jdaviz.utils import create_data_hash
@@ -521,3 +522,77 @@ class TestSpectrumListConcatenatedImporter:
         assert np.all(result.flux == spec.flux)
         assert np.all(result.spectral_axis == spec.spectral_axis)
         assert np.all(result.uncertainty.array == spec.uncertainty.array)
+
+
+def test_spectrum_stack():
+    spectra = [Spectrum(spectral_axis=np.arange(10 + i) * u.um + i * 0.5 * u.um,
+                        flux=np.arange(10 + i) * u.Jy,
+                        uncertainty=StdDevUncertainty(np.full(10 + i, 0.1)))
+               for i in range(3)]
+    # spectra with different spectral units and without uncertainties can be stacked
+    spectra.append(Spectrum(spectral_axis=np.arange(10) * 1000 * u.nm, flux=np.ones(10) * u.Jy,
+                            mask=np.arange(10) > 7))
+    stack = SpectrumStack.from_spectra(spectra)
+
+    assert len(stack) == 4
+    np.testing.assert_array_equal(stack.lengths, [10, 11, 12, 10])
+    np.testing.assert_array_equal(stack.index['label'], [f'1D Spectrum at index: {i}'
+                                                         for i in range(4)])
+    # spectra are retrieved as they were stacked
+    spec = stack['1D Spectrum at index: 1']
+    np.testing.assert_array_equal(spec.spectral_axis, spectra[1].spectral_axis)
+    np.testing.assert_array_equal(spec.flux, spectra[1].flux)
+    np.testing.assert_array_equal(spec.uncertainty.array, 0.1)
+    assert not np.any(spec.mask)
+    assert spec.meta['source']['length'] == 11
+    spec = stack[-1]
+    assert spec.spectral_axis.unit == u.um
+    assert np.all(np.isnan(spec.uncertainty.array))
+    np.testing.assert_array_equal(spec.mask, spectra[-1].mask)
+
+    # on the common grid, spectra are interpolated and masked outside of their coverage
+    gridded = stack.gridded_spectrum()
+    assert gridded.flux.shape == (4, len(stack.spectral_grid))
+    np.testing.assert_allclose(stack.spectral_grid[[0, -1]], [0, 12] * u.um)
+    source = stack.gridded_spectrum(1)
+    valid = ~source.mask
+    np.testing.assert_allclose(source.flux[valid].value,
+                               source.spectral_axis[valid].value - 0.5)
+    assert np.all(source.mask[source.spectral_axis < 0.5 * u.um])
+    assert np.all(gridded.mask[3][stack.spectral_grid > 7 * u.um])
+
+    with pytest.raises(ValueError, match='is not a source'):
+        stack['not a source']
+    with pytest.raises(IndexError):
+        stack[4]
+    with pytest.raises(ValueError, match='compatible units'):
+        SpectrumStack.from_spectra([spectra[0], Spectrum(spectral_axis=np.arange(3) * u.um,
+                                                         flux=np.ones(3) * u.s)])
+
+
+def test_spectrum_list_importer_stack(deconfigged_helper, premade_spectrum_list):
+    ldr = deconfigged_helper.loaders['object']
+    ldr.object = premade_spectrum_list
+    ldr.format = '1D Spectrum List'
+    ldr.importer.sources.select_all()
+    ldr.importer.stack_sources = True
+    ldr.importer()
+
+    dc = deconfigged_helper.app.data_collection
+    assert dc.labels == ['1D Spectrum_stack', '1D Spectrum_source']
+    stack = dc['1D Spectrum_stack'].meta['_spectrum_stack']
+    assert len(stack) == len(premade_spectrum_list)
+    assert dc['1D Spectrum_stack'].shape == (len(stack), len(stack.spectral_grid))
+    viewer = deconfigged_helper.viewers['1D Spectrum']
+    assert viewer.data_menu.data_labels_loaded == ['1D Spectrum_source']
+
+    spec = deconfigged_helper.select_stack_source('Exposure 1, Source ID: 1111')
+    assert spec.meta['source']['suffix'] == 'EXP-1_ID-1111'
+    source = dc['1D Spectrum_source']
+    assert source.meta['_spectrum_stack_source'] == 4
+    gridded = stack.gridded_spectrum(4)
+    np.testing.assert_array_equal(source['flux'], gridded.flux.value)
+    assert len(dc) == 2
+
+    with pytest.raises(ValueError, match='not a loaded data entry'):
+        deconfigged_helper.select_stack_source(0, data_label='not loaded')
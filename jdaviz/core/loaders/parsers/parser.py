@@ -1,10 +1,21 @@
 from functools import cached_property
+from jdaviz.core.profiling import profiled
 from jdaviz.core.template_mixin import WithCache
 
 __all__ = ['BaseParser']
 
 
 class BaseParser(WithCache):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # record parsing (computing the output) with the profiler of the app, if enabled
+        output = vars(cls).get('output')
+        if isinstance(output, cached_property):
+            profiled_output = cached_property(profiled('loader',
+                                                       f"{cls.__name__}.output")(output.func))
+            setattr(cls, 'output', profiled_output)
+            profiled_output.__set_name__(cls, 'output')
+
     def __init__(self, app, inp):
         self._app = app
         self._input = inp
@@ -236,6 +236,8 @@ class BaseResolver(PluginTemplateMixin, CustomToolbarToggleMixin):
     default_input = None
     default_input_cast = None
     requires_api_support = False
+    _profiled_methods = ('parse_input', 'load')
+    _profile_category = 'loader'
 
     spinner = Unicode("").tag(sync=True)
 
@@ -0,0 +1,287 @@
+import fnmatch
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+__all__ = ['Profiler', 'profiled', 'profile_methods']
+
+
+class Profiler:
+    """
+    Opt-in instrumentation of a session, recording the wall time (and optionally the
+    peak memory allocation) of plugin actions, loader stages, hub messages and viewer
+    renders into a ring buffer.
+
+    Recording is disabled by default, in which case instrumented calls only check
+    `enabled` before running.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of records kept, older records are dropped first.
+    """
+    def __init__(self, capacity=10000):
+        self._records = deque(maxlen=capacity)
+        self._enabled = False
+        self._track_memory = False
+        self._started_tracemalloc = False
+        self._local = threading.local()
+        self._t0 = time.perf_counter()
+
+    @property
+    def enabled(self):
+        """Whether calls are recorded."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value):
+        if value:
+            self.enable(track_memory=self._track_memory)
+        else:
+            self.disable()
+
+    @property
+    def track_memory(self):
+        """Whether the peak memory allocated during each call is recorded."""
+        return self._track_memory
+
+    @property
+    def capacity(self):
+        return self._records.maxlen
+
+    def enable(self, track_memory=False):
+        """
+        Start recording.
+
+        Parameters
+        ----------
+        track_memory : bool
+            Whether to also record the peak memory allocated during each call (with
+            `tracemalloc`, which slows down allocations while enabled).  Peaks are
+            approximate for calls running concurrently in several threads.
+        """
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        elif not track_memory and self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._track_memory = track_memory
+        self._enabled = True
+
+    def disable(self):
+        """Stop recording (the records are kept)."""
+        self._enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def clear(self):
+        """Remove all records."""
+        self._records.clear()
+
+    @property
+    def records(self):
+        """
+        List of records, oldest first, as dictionaries with the ``category``, ``name``,
+        ``start`` (in seconds since the profiler was created), ``duration`` (in seconds),
+        ``peak_memory`` (in bytes, `None` if not tracked) and ``thread`` of each call.
+        """
+        return list(self._records)
+
+    def __len__(self):
+        return len(self._records)
+
+    @contextmanager
+    def measure(self, category, name):
+        """
+        Context manager recording the time spent in its block (if enabled).
+
+        Parameters
+        ----------
+        category : str
+            Kind of call, for example ``'plugin'``, ``'loader'``, ``'hub'`` or ``'viewer'``.
+        name : str
+            Name of the call within the category.
+        """
+        if not self._enabled:
+            yield
+            return
+
+        track_memory = self._track_memory and tracemalloc.is_tracing()
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        frame = {'children_peak': 0}
+        if track_memory:
+            frame['start_memory'] = tracemalloc.get_traced_memory()[0]
+            # nested calls reset the peak, so each call keeps the highest peak of its children
+            tracemalloc.reset_peak()
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            peak_memory = None
+            if track_memory and tracemalloc.is_tracing():
+                peak = max(tracemalloc.get_traced_memory()[1], frame['children_peak'])
+                peak_memory = max(0, peak - frame['start_memory'])
+                if stack:
+                    stack[-1]['children_peak'] = max(stack[-1]['children_peak'], peak)
+            self._records.append({'category': category,
+                                  'name': name,
+                                  'start': start - self._t0,
+                                  'duration': duration,
+                                  'peak_memory': peak_memory,
+                                  'thread': threading.get_ident()})
+
+    def summary(self, category=None):
+        """
+        Statistics of the recorded calls, grouped by category and name.
+
+        Parameters
+        ----------
+        category : str or `None`
+            Only include calls of this category.
+
+        Returns
+        -------
+        table : `~astropy.table.Table`
+            Table with the ``category``, ``name``, number of calls (``count``), ``total_time``,
+            ``mean_time`` and ``max_time`` (in seconds), and ``peak_memory`` (in bytes, -1 if
+            not tracked) of each kind of call, sorted by decreasing total time.
+        """
+        from astropy.table import Table
+
+        stats = {}
+        for record in self._records:
+            if category is not None and record['category'] != category:
+                continue
+            key = (record['category'], record['name'])
+            stat = stats.setdefault(key, {'count': 0, 'total': 0., 'max': 0., 'peak': -1})
+            stat['count'] += 1
+            stat['total'] += record['duration']
+            stat['max'] = max(stat['max'], record['duration'])
+            if record['peak_memory'] is not None:
+                stat['peak'] = max(stat['peak'], record['peak_memory'])
+
+        rows = sorted(stats.items(), key=lambda item: -item[1]['total'])
+        return Table(rows=[(cat, name, stat['count'], stat['total'],
+                            stat['total'] / stat['count'], stat['max'], stat['peak'])
+                           for (cat, name), stat in rows],
+                     names=('category', 'name', 'count', 'total_time', 'mean_time',
+                            'max_time', 'peak_memory'),
+                     dtype=(str, str, int, float, float, float, int))
+
+    def to_chrome_trace(self, filename=None):
+        """
+        Records in the Chrome trace event format, which can be opened in
+        ``chrome://tracing`` or https://ui.perfetto.dev.
+
+        Parameters
+        ----------
+        filename : str or `None`
+            If given, the trace is also written to this JSON file.
+
+        Returns
+        -------
+        trace : dict
+        """
+        pid = os.getpid()
+        events = []
+        for record in self._records:
+            event = {'name': record['name'],
+                     'cat': record['category'],
+                     'ph': 'X',
+                     'ts': record['start'] * 1e6,
+                     'dur': record['duration'] * 1e6,
+                     'pid': pid,
+                     'tid': record['thread']}
+            if record['peak_memory'] is not None:
+                event['args'] = {'peak_memory': record['peak_memory']}
+            events.append(event)
+        trace = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+        if filename is not None:
+            with open(filename, 'w') as f:
+                json.dump(trace, f)
+        return trace
+
+    def instrument_hub(self, hub):
+        """
+        Record the time spent broadcasting each message (running all its handlers) on
+        ``hub``, by message type.
+        """
+        broadcast = hub.broadcast
+
+        @functools.wraps(broadcast)
+        def profiled_broadcast(message):
+            if not self._enabled:
+                return broadcast(message)
+            with self.measure('hub', type(message).__name__):
+                return broadcast(message)
+
+        hub.broadcast = profiled_broadcast
+
+    def instrument_viewer(self, viewer, name):
+        """
+        Record the time spent rendering the composite image of an image ``viewer``
+        (other viewers are left untouched).
+        """
+        frb = getattr(viewer, '_composite_image', None)
+        if frb is None or not hasattr(frb, 'array_maker'):
+            return
+        array_maker = frb.array_maker
+
+        @functools.wraps(array_maker)
+        def profiled_array_maker(*args, **kwargs):
+            if not self._enabled:
+                return array_maker(*args, **kwargs)
+            with self.measure('viewer', f"{getattr(viewer, 'reference', None) or name}.render"):
+                return array_maker(*args, **kwargs)
+
+        frb.array_maker = profiled_array_maker
+
+
+def _get_profiler(obj):
+    return getattr(getattr(obj, 'app', None), 'profiler', None)
+
+
+def profiled(category, name=None):
+    """
+    Decorator on a method of an object with an ``app`` attribute, recording its calls
+    with the profiler of the app (when enabled) under ``name`` (defaults to the qualified
+    name of the method).
+    """
+    def decorator(func):
+        call_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            profiler = _get_profiler(self)
+            if profiler is None or not profiler.enabled:
+                return func(self, *args, **kwargs)
+            with profiler.measure(category, call_name):
+                return func(self, *args, **kwargs)
+
+        wrapper._profiled = True
+        return wrapper
+    return decorator
+
+
+def profile_methods(cls, patterns, category):
+    """
+    Record the calls to the methods defined in ``cls`` whose name matches any of the
+    glob ``patterns`` (see `profiled`).
+    """
+    for attr, value in list(vars(cls).items()):
+        if (inspect.isfunction(value) and not getattr(value, '_profiled', False)
+                and any(fnmatch.fnmatchcase(attr, pattern) for pattern in patterns)):
+            setattr(cls, attr, profiled(category)(value))
@@ -0,0 +1,221 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from joblib import Parallel, delayed
+
+__all__ = ['TaskCancelledError', 'PluginTask', 'run_on_main_thread']
+
+
+class TaskCancelledError(Exception):
+    """Raised when requesting the result of a plugin task that was cancelled."""
+
+
+def _kernel_io_loop():
+    # event loop of the Jupyter kernel, which runs callbacks in the main thread
+    try:
+        from IPython import get_ipython
+    except ImportError:  # pragma: no cover
+        return None
+    kernel = getattr(get_ipython(), 'kernel', None)
+    io_loop = getattr(kernel, 'io_loop', None)
+    return io_loop if hasattr(io_loop, 'add_callback') else None
+
+
+def run_on_main_thread(func):
+    """
+    Call ``func`` in the main thread: through the event loop of the Jupyter kernel when
+    called from another thread in a kernel, or directly otherwise.  Does not wait for
+    ``func`` to run.
+    """
+    io_loop = _kernel_io_loop()
+    if io_loop is None or threading.current_thread() is threading.main_thread():
+        func()
+    else:
+        io_loop.add_callback(func)
+
+
+class PluginTask:
+    """
+    Chunked computation of a plugin, which can run in a background thread, reports its
+    progress, and can be cancelled between chunks.
+
+    The ``workers`` (callables without arguments, each computing one chunk) are run
+    in order, in up to ``n_workers`` threads or processes, and each of their results is
+    passed to ``collect`` as soon as it is available.  Once all chunks are done,
+    ``finalize`` is called (in the main thread, where it can add results to the app)
+    and its return value is the result of the task.
+
+    Parameters
+    ----------
+    workers : iterable
+        Callables without arguments, one per chunk.
+    collect : callable or `None`
+        Called with the result of each chunk.
+    finalize : callable or `None`
+        Called without arguments once all chunks are done, its return value is the result
+        of the task.  Defaults to returning the list of the results of the chunks.
+    n_chunks : int or `None`
+        Number of chunks, used to report progress.  Defaults to ``len(workers)``.
+    n_workers : int
+        Number of chunks computed at a time.
+    backend : {'threads', 'processes'}
+        Whether chunks are computed in threads or (with joblib) in processes.
+    on_progress : callable or `None`
+        Called with the fraction of chunks done after each chunk.
+    on_done : callable or `None`
+        Called with the task (in the main thread) once it is done, failed, or cancelled.
+    """
+    def __init__(self, workers, collect=None, finalize=None, n_chunks=None, n_workers=1,
+                 backend='threads', on_progress=None, on_done=None):
+        if backend not in ('threads', 'processes'):
+            raise ValueError("backend must be 'threads' or 'processes'")
+        if n_chunks is None:
+            workers = list(workers)
+            n_chunks = len(workers)
+        self._workers = workers
+        self.n_chunks = n_chunks
+        self.n_workers = max(1, n_workers)
+        self.backend = backend
+        self._results = []
+        self._collect = collect if collect is not None else self._results.append
+        self._finalize = finalize if finalize is not None else lambda: self._results
+        self._on_progress = on_progress
+        self._on_done = on_done
+
+        self.chunks_done = 0
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._finalize_lock = threading.Lock()
+        self._finalized = False
+        self._result = None
+        self._exception = None
+        self._thread = None
+
+    @property
+    def progress(self):
+        """Fraction of the chunks that are done."""
+        return self.chunks_done / self.n_chunks if self.n_chunks else 1.
+
+    @property
+    def running(self):
+        return self._thread is not None and not self._done.is_set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set() and not self._finalized
+
+    def done(self):
+        """Whether the task is done, failed, or was cancelled."""
+        return self._done.is_set()
+
+    def cancel(self):
+        """Stop the task after the chunks being computed are done."""
+        self._cancel.set()
+
+    def start(self, background=True):
+        """
+        Run the task, in a background thread if ``background``, otherwise in the calling
+        thread (in which case its result is returned).
+        """
+        if self._thread is not None:
+            raise ValueError("task was already started")
+        if not background:
+            self._thread = threading.current_thread()
+            self._run()
+            return self.result()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _iter_results(self):
+        if self.n_workers == 1:
+            for worker in self._workers:
+                if self._cancel.is_set():
+                    return
+                yield worker()
+        elif self.backend == 'processes':
+            results = Parallel(n_jobs=self.n_workers, return_as='generator')(
+                delayed(worker)() for worker in self._workers)
+            try:
+                yield from results
+            finally:
+                # stops scheduling the remaining chunks when cancelled
+                results.close()
+        else:
+            # only submit a few chunks ahead, so that cancelling does not wait for all of them
+            with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+                futures = []
+                workers = iter(self._workers)
+                for worker in workers:
+                    futures.append(executor.submit(worker))
+                    if len(futures) == 2 * self.n_workers:
+                        break
+                while futures:
+                    result = futures.pop(0).result()
+                    if self._cancel.is_set():
+                        for future in futures:
+                            future.cancel()
+                        return
+                    worker = next(workers, None)
+                    if worker is not None:
+                        futures.append(executor.submit(worker))
+                    yield result
+
+    def _run(self):
+        results = self._iter_results()
+        try:
+            for result in results:
+                if self._cancel.is_set():
+                    break
+                self._collect(result)
+                self.chunks_done += 1
+                if self._on_progress is not None:
+                    self._on_progress(self.progress)
+        except Exception as e:
+            self._exception = e
+        finally:
+            results.close()
+        if self._exception is None and not self._cancel.is_set():
+            run_on_main_thread(self._run_finalize)
+        else:
+            run_on_main_thread(self._set_done)
+
+    def _run_finalize(self):
+        with self._finalize_lock:
+            if self._finalized or self._done.is_set():
+                return
+            self._finalized = True
+            try:
+                self._result = self._finalize()
+            except Exception as e:
+                self._exception = e
+        self._set_done()
+
+    def _set_done(self):
+        if self._done.is_set():
+            return
+        self._done.set()
+        if self._on_done is not None:
+            self._on_done(self)
+
+    def result(self, timeout=None):
+        """
+        Wait for the task to finish and return its result.  Raises the exception of the
+        task if it failed, or `TaskCancelledError` if it was cancelled.
+        """
+        if (threading.current_thread() is threading.main_thread()
+                and self._thread is not None and self._thread is not threading.main_thread()):
+            # finalize is scheduled on the main thread, which would be blocked here
+            self._thread.join(timeout)
+            if not self._thread.is_alive():
+                if self._exception is None and not self._cancel.is_set():
+                    self._run_finalize()
+                else:
+                    self._set_done()
+        if not self._done.wait(timeout):
+            raise TimeoutError("task is still running")
+        if self._exception is not None:
+            raise self._exception
+        if not self._finalized:
+            raise TaskCancelledError("task was cancelled")
+        return self._result
@@ -57,7 +57,9 @@ from jdaviz.core.marks import (PluginMarkCollection,
                                LineAnalysisContinuumLeft,
                                LineAnalysisContinuumRight,
                                ShadowLine, ApertureMark)
+from jdaviz.core.profiling import profile_methods
 from jdaviz.core.region_translators import regions2roi, regions2aperture
+from jdaviz.core.tasks import PluginTask
 from jdaviz.core.tools import ICON_DIR
 from jdaviz.core.user_api import UserApiWrapper, PluginUserApi
 from jdaviz.core.registries import tray_registry
@@ -627,6 +629,17 @@ class PluginTemplateMixin(TemplateMixin):
     previews_temp_disabled = Bool(False).tag(sync=True)  # noqa use along-side @with_temp_disable() and <plugin-previews-temp-disabled :previews_temp_disabled.sync="previews_temp_disabled" :previews_last_time="previews_last_time" :show_live_preview.sync="show_live_preview"/>
     previews_last_time = Float(0).tag(sync=True)
     supports_auto_update = Bool(False).tag(sync=True)  # noqa whether this plugin supports auto-updating plugin results (requires __call__ method)
+    task_running = Bool(False).tag(sync=True)  # noqa use along-side self._run_task() and <plugin-task-progress :running="task_running" :progress="task_progress" :message="task_message" @cancel="cancel_task"/>
+    task_progress = Float(0).tag(sync=True)  # noqa percentage of the chunks of the running task that are done
+    task_message = Unicode("").tag(sync=True)
+
+    # methods (glob patterns) whose calls are recorded by the profiler of the app, if enabled
+    _profiled_methods = ('__call__', 'calculate_*')
+    _profile_category = 'plugin'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        profile_methods(cls, cls._profiled_methods, cls._profile_category)
 
     def __init__(self, app, tray_instance=False, **kwargs):
         self._plugin_name = kwargs.pop('plugin_name', None)
@@ -678,6 +691,59 @@ class PluginTemplateMixin(TemplateMixin):
         new._plugin_name = self._plugin_name
         return new
 
+    def _run_task(self, workers, collect=None, finalize=None, n_chunks=None, n_workers=1,
+                  backend='threads', message='', background=False):
+        """
+        Run a chunked computation as a `~jdaviz.core.tasks.PluginTask`, reporting its
+        progress to the ``task_progress`` traitlet.
+
+        With ``background``, the task runs in a background thread (so that the app stays
+        responsive and the task can be cancelled with ``cancel_task``) and is returned,
+        with ``finalize`` (which should add any results to the app) called in the main
+        thread once it is done.  Otherwise, the result of ``finalize`` is returned.
+        """
+        if self.task_running:
+            raise ValueError(f"{self._plugin_name} is already running a task")
+
+        def on_progress(progress):
+            self.task_progress = 100 * progress
+
+        def on_done(task):
+            self.task_running = False
+            self.task_message = ''
+            if not background:
+                return
+            if task.cancelled:
+                self.hub.broadcast(SnackbarMessage(f"{message or 'Task'} cancelled",
+                                                   color='warning', sender=self))
+            elif task._exception is not None:
+                self.hub.broadcast(SnackbarMessage(f"{message or 'Task'} failed: {task._exception}",  # noqa
+                                                   color='error', sender=self,
+                                                   traceback=task._exception))
+
+        self._task = PluginTask(workers, collect=collect, finalize=finalize, n_chunks=n_chunks,
+                                n_workers=n_workers, backend=backend,
+                                on_progress=on_progress, on_done=on_done)
+        self.task_progress = 0
+        self.task_message = message
+        self.task_running = True
+        try:
+            return self._task.start(background=background)
+        except Exception:
+            self.task_running = False
+            raise
+
+    def cancel_task(self):
+        """
+        Cancel the task running in the background, if any.
+        """
+        task = getattr(self, '_task', None)
+        if task is not None and not task.done():
+            task.cancel()
+
+    def vue_cancel_task(self, *args):
+        self.cancel_task()  # pragma: no cover
+
     @property
     def plugin_description(self):
         return self._plugin_description
@@ -4,6 +4,7 @@ import warnings
 
 import numpy as np
 from astropy import units as u
+from astropy.io import fits
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.nddata import CCDData, NDDataArray
 from glue.core import ComponentID
@@ -413,3 +414,32 @@ def test_get_loader_default_args(deconfigged_helper, spectrum1d):
 
     parser = deconfigged_helper._get_loader('object', parser_name='object')
     assert isinstance(parser, ObjectParser)
+
+
+def test_batch_load_parallel(imviz_helper, tmp_path):
+    filenames = []
+    for i in range(4):
+        filename = tmp_path / f'image_{i}.fits'
+        fits.PrimaryHDU(np.full((10, 12), i, dtype=float)).writeto(filename)
+        filenames.append(str(filename))
+
+    with imviz_helper.batch_load(parallel=True, n_cpu=2):
+        for filename in filenames:
+            assert imviz_helper.load(filename) is None
+        # loads are deferred until the context exits
+        assert len(imviz_helper.app.data_collection) == 0
+
+    assert imviz_helper.data_labels == [f'image_{i}[PRIMARY,1]' for i in range(4)]
+    for i, data in enumerate(imviz_helper.app.data_collection):
+        np.testing.assert_array_equal(data.get_component(data.main_components[0]).data, i)
+    assert imviz_helper._deferred_loads is None
+    assert imviz_helper._in_batch_load == 0
+
+    # a failing input is raised at exit, after the inputs before it are loaded
+    with pytest.raises(ValueError, match='no valid loaders'):
+        with imviz_helper.batch_load(parallel=True):
+            imviz_helper.load(filenames[0], data_label='again')
+            imviz_helper.load(str(tmp_path / 'missing.fits'))
+    assert 'again' in imviz_helper.data_labels
+    assert imviz_helper._deferred_loads is None
+    assert imviz_helper._in_batch_load == 0
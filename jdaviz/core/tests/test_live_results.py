@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+from glue.core.roi import CircularROI
+
+from jdaviz.core.live_results import LiveResultsScheduler
+
+# Cubeviz automatically extracts a live-updating spectrum for each spatial subset
+LABEL = 'Spectrum (Subset 1, sum)'
+
+
+def _update_subset(cubeviz_helper, radius):
+    cubeviz_helper.plugins['Subset Tools'].import_region(
+        CircularROI(xc=5, yc=5, radius=radius),
+        edit_subset='Subset 1', combination_mode='replace')
+
+
+def test_live_results_debounced(cubeviz_helper, spectrum1d_cube_largest):
+    cubeviz_helper.load_data(spectrum1d_cube_largest)
+    cubeviz_helper.plugins['Subset Tools'].import_region(CircularROI(xc=5, yc=5, radius=2))
+    orig_flux = cubeviz_helper.get_data(LABEL).flux.sum()
+
+    scheduler = cubeviz_helper.app._live_results
+    assert scheduler.index[('subset', 'Subset 1')] == {LABEL}
+    assert LABEL in scheduler.index[('data', '3D Spectrum [FLUX]')]
+    assert ('subset', 'Subset 2') not in scheduler.index
+
+    scheduler.delay = 60  # long enough to never fire on its own during this test
+    with patch.object(LiveResultsScheduler, '_run', autospec=True,
+                      side_effect=LiveResultsScheduler._run) as run:
+        # simulate dragging the subset: each step is a separate subset update
+        for radius in (2.5, 3, 3.5):
+            _update_subset(cubeviz_helper, radius)
+        assert run.call_count == 0
+        assert scheduler.is_pending
+
+        # all the intermediate updates are coalesced into a single run
+        scheduler._timer.cancel()
+        scheduler.flush()
+        assert run.call_count == 1
+        assert not scheduler.is_pending
+
+    assert cubeviz_helper.get_data(LABEL).flux.sum() > orig_flux
+    # the index follows the result as it is re-created by the update
+    assert scheduler.index[('subset', 'Subset 1')] == {LABEL}
+
+
+def test_live_results_background(cubeviz_helper, spectrum1d_cube_largest):
+    cubeviz_helper.load_data(spectrum1d_cube_largest)
+    cubeviz_helper.plugins['Subset Tools'].import_region(CircularROI(xc=5, yc=5, radius=2))
+    orig_flux = cubeviz_helper.get_data(LABEL).flux.sum()
+
+    scheduler = cubeviz_helper.app._live_results
+    scheduler.delay = 0.05
+    _update_subset(cubeviz_helper, 3)
+    scheduler._timer.join()
+    assert not scheduler.is_pending
+    assert cubeviz_helper.get_data(LABEL).flux.sum() > orig_flux
+
+    # deleting the subset removes the result and anything still pending for it
+    scheduler.delay = 60
+    _update_subset(cubeviz_helper, 2)
+    assert scheduler.is_pending
+    scheduler._timer.cancel()
+    cubeviz_helper.app.data_collection.remove_subset_group(
+        cubeviz_helper.app.data_collection.subset_groups[0])
+    assert not scheduler.is_pending
+    assert LABEL not in cubeviz_helper.app.data_collection.labels
@@ -0,0 +1,143 @@
+import json
+import time
+import warnings
+
+import numpy as np
+import pytest
+
+from jdaviz.core.profiling import Profiler, profiled
+
+
+class _Plugin:
+    def __init__(self, profiler):
+        self.app = type('App', (), {'profiler': profiler})()
+
+    @profiled('plugin')
+    def compute(self, value):
+        return value * 2
+
+
+def test_profiler_disabled():
+    profiler = Profiler()
+    assert not profiler.enabled
+    with profiler.measure('plugin', 'noop'):
+        pass
+    assert _Plugin(profiler).compute(2) == 4
+    assert len(profiler) == 0
+
+
+def test_profiler_records():
+    profiler = Profiler(capacity=3)
+    profiler.enable()
+    plugin = _Plugin(profiler)
+    assert plugin.compute(2) == 4
+    with profiler.measure('viewer', 'imviz-0.render'):
+        time.sleep(0.01)
+
+    records = profiler.records
+    assert [(r['category'], r['name']) for r in records] == [
+        ('plugin', '_Plugin.compute'), ('viewer', 'imviz-0.render')]
+    assert records[1]['duration'] >= 0.01
+    assert records[0]['peak_memory'] is None
+
+    # oldest records are dropped from the ring buffer
+    for i in range(3):
+        plugin.compute(i)
+    assert len(profiler) == profiler.capacity == 3
+    assert {r['category'] for r in profiler.records} == {'plugin'}
+
+    profiler.disable()
+    plugin.compute(0)
+    assert len(profiler) == 3
+    profiler.clear()
+    assert len(profiler) == 0
+
+
+def test_profiler_summary():
+    profiler = Profiler()
+    profiler.enable()
+    for _ in range(3):
+        with profiler.measure('hub', 'SnackbarMessage'):
+            pass
+    with profiler.measure('loader', 'SpecutilsParser.output'):
+        time.sleep(0.01)
+
+    summary = profiler.summary()
+    assert list(summary['name']) == ['SpecutilsParser.output', 'SnackbarMessage']
+    assert list(summary['count']) == [1, 3]
+    assert np.all(summary['peak_memory'] == -1)
+    assert len(profiler.summary(category='hub')) == 1
+    assert len(profiler.summary(category='viewer')) == 0
+
+
+def test_profiler_memory():
+    profiler = Profiler()
+    profiler.enable(track_memory=True)
+    try:
+        with profiler.measure('plugin', 'outer'):
+            with profiler.measure('plugin', 'inner'):
+                data = np.ones(100000)
+            del data
+    finally:
+        profiler.disable()
+
+    inner, outer = profiler.records
+    assert inner['peak_memory'] >= 800000
+    assert outer['peak_memory'] >= inner['peak_memory']
+
+
+def test_profiler_chrome_trace(tmp_path):
+    profiler = Profiler()
+    profiler.enable()
+    with profiler.measure('hub', 'AddDataMessage'):
+        pass
+
+    filename = tmp_path / 'trace.json'
+    trace = profiler.to_chrome_trace(filename)
+    with open(filename) as f:
+        assert json.load(f) == trace
+    event, = trace['traceEvents']
+    assert event['name'] == 'AddDataMessage'
+    assert event['cat'] == 'hub'
+    assert event['ph'] == 'X'
+
+
+def test_app_profiling(specviz_helper, spectrum1d, tmp_path):
+    logger = specviz_helper.plugins['Logger']
+    assert not specviz_helper.profiler.enabled
+    logger.profiling_enabled = True
+    assert specviz_helper.profiler.enabled
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        specviz_helper.load_data(spectrum1d, data_label='test')
+    mf = specviz_helper.plugins['Model Fitting']
+    mf.create_model_component('Linear1D', 'L')
+    mf.calculate_fit()
+
+    categories = set(specviz_helper.profiler.summary()['category'])
+    assert {'hub', 'loader', 'plugin'}.issubset(categories)
+    assert 'ModelFitting.calculate_fit' in specviz_helper.profiler.summary('plugin')['name']
+    assert len(logger.profiling_summary(category='hub')) > 0
+
+    filename = tmp_path / 'trace.json'
+    logger.export_profiling_trace(str(filename))
+    assert filename.exists()
+
+    logger.profiling_enabled = False
+    n_records = len(specviz_helper.profiler)
+    mf.calculate_fit()
+    assert len(specviz_helper.profiler) == n_records
+
+    logger.clear_profiling()
+    assert len(specviz_helper.profiler) == 0
+
+
+@pytest.mark.parametrize('capacity', (1, 10))
+def test_profiler_capacity(capacity):
+    profiler = Profiler(capacity=capacity)
+    profiler.enable()
+    for i in range(20):
+        with profiler.measure('plugin', str(i)):
+            pass
+    assert [r['name'] for r in profiler.records] == [str(i) for i in range(20 - capacity, 20)]
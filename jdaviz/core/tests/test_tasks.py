@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+
+from jdaviz.core.tasks import PluginTask, TaskCancelledError
+
+
+class _Square:
+    # picklable, so that it can also run in processes
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self):
+        return self.value ** 2
+
+
+@pytest.mark.parametrize('n_workers', (1, 2))
+def test_plugin_task_result(n_workers):
+    progress = []
+    done = []
+    task = PluginTask([_Square(i) for i in range(5)], n_workers=n_workers,
+                      on_progress=progress.append, on_done=done.append)
+    assert task.start(background=False) == [0, 1, 4, 9, 16]
+    assert progress == [0.2, 0.4, 0.6, 0.8, 1.0]
+    assert done == [task]
+    assert task.done() and not task.cancelled
+
+
+def test_plugin_task_processes():
+    collected = []
+    task = PluginTask([_Square(i) for i in range(4)], collect=collected.append,
+                      finalize=lambda: sum(collected), n_workers=2, backend='processes')
+    assert task.start().result(timeout=60) == 14
+    assert collected == [0, 1, 4, 9]
+
+
+def test_plugin_task_cancel():
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(10)
+        return 0
+
+    finalized = []
+    task = PluginTask([blocking] + [lambda: 1] * 10, finalize=lambda: finalized.append(1))
+    task.start()
+    assert started.wait(10)
+    assert task.running
+    task.cancel()
+    release.set()
+    with pytest.raises(TaskCancelledError):
+        task.result(timeout=10)
+    assert task.cancelled
+    assert task.chunks_done == 0
+    assert finalized == []
+
+    with pytest.raises(ValueError, match='already started'):
+        task.start()
+
+
+def test_plugin_task_exception():
+    def fail():
+        raise RuntimeError('chunk failed')
+
+    done = []
+    task = PluginTask([lambda: 1, fail, lambda: 1], on_done=done.append)
+    task.start()
+    with pytest.raises(RuntimeError, match='chunk failed'):
+        task.result(timeout=10)
+    assert task.chunks_done == 1
+    assert done == [task]
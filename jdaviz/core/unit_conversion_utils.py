@@ -83,22 +83,29 @@ def viewer_flux_conversion_equivalencies(values, spec):
         A list of unit equivalencies for flux and surface brightness conversions.
     """
 
+    return _viewer_flux_conversion_equivalencies(values, spec.spectral_axis,
+                                                 spec.meta.get('_pixel_scale_factor'))
+
+
+def _viewer_flux_conversion_equivalencies(values, spectral_axis, pix_fac=None):
+    """
+    Same as `viewer_flux_conversion_equivalencies`, but from the spectral axis and
+    pixel scale factor (``meta['_pixel_scale_factor']``) of the spectrum, so that
+    callers can cache those instead of the spectrum itself.
+    """
     # if we are converting only 2 values, assume it is a viewer y limits case.
     is_viewer_limits = not np.isscalar(values) and len(values) == 2
 
-    spectral_values = spec.spectral_axis
+    spectral_values = spectral_axis
     if is_viewer_limits:
         # for viewer limits case, use only the 0th spectral axis value for spectral_density
         spectral_values = spectral_values[0]
     elif not np.isscalar(values) and len(values) != spectral_values.size:
         # Need this for setting the y-limits but values from viewer might be downscaled
-        spectral_values = spec.spectral_axis[0]
+        spectral_values = spectral_axis[0]
 
     # Next, pixel scale factor
-    pix_fac = None
-    if '_pixel_scale_factor' in spec.meta:
-        pix_fac = spec.meta['_pixel_scale_factor']
-
+    if pix_fac is not None:
         if isinstance(pix_fac, u.Quantity):
             pix_fac = pix_fac.value
 
@@ -9,6 +9,7 @@ import ipysplitpanes
 import ipyvue
 
 import jdaviz
+import jdaviz.configs
 from jdaviz.app import custom_components
 
 config = None
@@ -9,7 +9,7 @@ from ipywidgets.widgets import widget_serialization
 
 from jdaviz import Specviz, Specviz2d
 from jdaviz.core.config import get_configuration
-from jdaviz.app import Application
+from jdaviz.app import Application, UnitConverterWithSpectral
 from jdaviz.configs.default.plugins.gaussian_smooth.gaussian_smooth import GaussianSmooth
 from jdaviz.core.unit_conversion_utils import (flux_conversion_general,
                                                viewer_flux_conversion_equivalencies)
@@ -280,6 +280,40 @@ def test_to_unit(cubeviz_helper):
                                  equivalencies=u.spectral_density(cube.spectral_axis[0])))
 
 
+def test_unit_converter_caches_flux_plans(specviz_helper, spectrum1d, monkeypatch):
+    specviz_helper.load_data(spectrum1d, data_label='test')
+    data = specviz_helper.app.data_collection['test']
+    cid = data.id['flux']
+    spec = data.get_object(cls=Spectrum)
+    target_units = u.erg / u.cm**2 / u.s / u.AA
+
+    n_translations = []
+    get_object = data.get_object
+
+    def counting_get_object(*args, **kwargs):
+        n_translations.append(1)
+        return get_object(*args, **kwargs)
+
+    monkeypatch.setattr(data, 'get_object', counting_get_object)
+
+    for values in (np.arange(spec.flux.size, dtype=float), np.arange(spec.flux.size) + 1.,
+                   [1, 2], [3, 4], 5.):
+        converted = UnitConverterWithSpectral().to_unit(data, cid, values,
+                                                        spec.flux.unit, target_units)
+        expected = flux_conversion_general(values, spec.flux.unit, target_units,
+                                           viewer_flux_conversion_equivalencies(values, spec),
+                                           with_unit=False)
+        assert np.allclose(converted, expected)
+
+    # the data is only translated to a Spectrum once for all conversions
+    assert len(n_translations) == 1
+
+    # changing the pixel scale factor invalidates the cached plan
+    data.meta['_pixel_scale_factor'] = 2.
+    UnitConverterWithSpectral().to_unit(data, cid, [1, 2], spec.flux.unit, target_units)
+    assert len(n_translations) == 2
+
+
 def test_all_plugins_have_description(cubeviz_helper, specviz_helper,
                                       mosviz_helper, imviz_helper,
                                       rampviz_helper, specviz2d_helper):
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import pytest
+
+# Packages that should only be imported once an app or helper is created.
+HEAVY_MODULES = ('glue', 'glue_jupyter', 'bqplot', 'specutils', 'photutils',
+                 'specreduce', 'astroquery', 'jdaviz.app', 'jdaviz.configs')
+
+
+def _import_profile(statement):
+    # Import in a fresh interpreter, since this one has imported everything already.
+    code = (f"import sys, time; t0 = time.perf_counter(); {statement}; "
+            "print(time.perf_counter() - t0); print(' '.join(sys.modules))")
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                         text=True, check=True).stdout.splitlines()
+    return float(out[0]), set(out[1].split())
+
+
+@pytest.mark.parametrize('statement', ('import jdaviz', 'import jdaviz.cli'))
+def test_import_is_lazy(statement):
+    import_time, modules = _import_profile(statement)
+    loaded = [name for name in HEAVY_MODULES if name in modules]
+    assert loaded == [], f'{statement} took {import_time:.2f} s and imported {loaded}'
+
+
+def test_lazy_top_level_api():
+    import jdaviz
+    from jdaviz.configs.imviz import Imviz
+    from jdaviz.core.launcher import open as jdaviz_open
+
+    assert jdaviz.Imviz is Imviz
+    assert jdaviz.open is jdaviz_open
+    assert 'Specviz2d' in dir(jdaviz)
+    with pytest.raises(AttributeError):
+        jdaviz.not_an_attribute
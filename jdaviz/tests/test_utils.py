@@ -7,7 +7,7 @@ import pytest
 from astropy.io import fits
 from astropy.units.quantity import Quantity
 
-from jdaviz.utils import (alpha_index, download_uri_to_path,
+from jdaviz.utils import (alpha_index, download_uri_to_path, BlockCachedFile,
                           get_cloud_fits, cached_uri, escape_brackets,
                           has_wildcard, wildcard_match, _clean_data_for_hash,
                           create_data_hash, parallelize_calculation)
@@ -96,6 +96,47 @@ def test_get_cloud_fits_ext():
     assert isinstance(hdul, fits.HDUList)
 
 
+def test_get_cloud_fits_block_cache(tmp_path):
+    fsspec = pytest.importorskip('fsspec')
+    fs = fsspec.filesystem('memory')
+    data = np.arange(200 * 300, dtype=np.float32).reshape(200, 300)
+    hdul = fits.HDUList([fits.PrimaryHDU(), fits.ImageHDU(data, name='SCI'),
+                         fits.ImageHDU(data * 2, name='ERR')])
+    with fs.open('/bucket/image.fits', 'wb') as f:
+        hdul.writeto(f)
+
+    def open_cached(**kwargs):
+        fileobj = BlockCachedFile(fs, '/bucket/image.fits', cache_dir=str(tmp_path),
+                                  block_size=2880 * 4, **kwargs)
+        return fileobj, fits.open(fileobj)
+
+    # reading a cutout only fetches the blocks it spans
+    fileobj, hdul = open_cached()
+    n_blocks = int(np.ceil(fileobj.size / fileobj.block_size))
+    np.testing.assert_array_equal(hdul['SCI'].section[10:12, 5:50], data[10:12, 5:50])
+    assert 0 < fileobj.fetched_blocks < n_blocks / 2
+    np.testing.assert_array_equal(hdul['ERR'].data, data * 2)
+
+    # the second time, all blocks that were read come from the disk cache
+    fileobj, hdul = open_cached()
+    np.testing.assert_array_equal(hdul['ERR'].data, data * 2)
+    assert fileobj.fetched_blocks == 0
+
+    # blocks of a file that changed since they were cached are not used
+    with fs.open('/bucket/image.fits', 'wb') as f:
+        fits.HDUList([fits.PrimaryHDU(), fits.ImageHDU(data + 1, name='SCI')]).writeto(f)
+    fileobj, hdul = open_cached(max_workers=1)
+    np.testing.assert_array_equal(hdul['SCI'].data, data + 1)
+    assert fileobj.fetched_blocks > 0
+
+    hdul = get_cloud_fits('memory://bucket/image.fits', ext='SCI', fs=fs, cache_dir=False)
+    assert len(hdul) == 1
+    np.testing.assert_array_equal(hdul[0].data, data + 1)
+
+    with pytest.raises(ValueError, match='Not an S3 URI'):
+        get_cloud_fits('memory://bucket/image.fits')
+
+
 class FakeObject:
     def __init__(self):
         pass
@@ -1,3 +1,4 @@
+import io
 import operator
 import os
 import time
@@ -610,7 +611,159 @@ class MultiMaskSubsetState(SubsetState):
         return cls(masks=masks)
 
 
-def get_cloud_fits(possible_uri, ext=None):
+# remote files are read and cached in blocks of this size
+CLOUD_BLOCK_SIZE = 4 * 1024**2
+
+
+def _default_cloud_cache_dir():
+    from astropy.config.paths import get_cache_dir
+    return os.path.join(get_cache_dir(), 'jdaviz', 'cloud_blocks')
+
+
+class BlockCachedFile(io.RawIOBase):
+    """
+    Read-only file object over a remote (fsspec) file, which reads the file in blocks
+    that are cached on disk.
+
+    Blocks are cached per URI and version of the remote object (its ETag, or its size
+    and modification time if the filesystem does not provide one), so a cached block
+    is never used for a file that changed since it was cached. Reads spanning several
+    blocks that are not cached yet fetch them concurrently.
+
+    Parameters
+    ----------
+    fs : `fsspec.spec.AbstractFileSystem`
+        Filesystem of the remote file.
+    path : str
+        Path of the file on ``fs``.
+    cache_dir : str or `None`
+        Directory of the block cache, shared between files and sessions. Defaults to a
+        directory in the astropy cache. If `False`, blocks are not cached on disk.
+    block_size : int
+        Size of the blocks, in bytes.
+    max_workers : int
+        Maximum number of blocks fetched at a time.
+    """
+    def __init__(self, fs, path, cache_dir=None, block_size=CLOUD_BLOCK_SIZE, max_workers=8):
+        super().__init__()
+        self.fs = fs
+        self.path = path
+        self.name = fs.unstrip_protocol(path)
+        self.block_size = block_size
+        self.max_workers = max_workers
+        self._pos = 0
+        self.fetched_blocks = 0
+
+        info = fs.info(path)
+        self.size = info['size']
+        version = info.get('ETag', info.get('etag'))
+        if version is None:
+            version = (self.size, info.get('LastModified', info.get('mtime', info.get('created'))))
+        if cache_dir is None:
+            cache_dir = _default_cloud_cache_dir()
+        if cache_dir is False:
+            self._cache_dir = None
+        else:
+            key = hashlib.sha256(f"{self.name}\n{version}\n{block_size}".encode()).hexdigest()
+            self._cache_dir = os.path.join(cache_dir, key)
+            os.makedirs(self._cache_dir, exist_ok=True)
+        # blocks of this instance not cached on disk
+        self._blocks = {}
+
+    @property
+    def mode(self):
+        return 'rb'
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        return self._pos
+
+    def _block_path(self, block):
+        return os.path.join(self._cache_dir, f'{block}.blk')
+
+    def _cached_block(self, block):
+        if self._cache_dir is None:
+            return self._blocks.get(block)
+        try:
+            with open(self._block_path(block), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _fetch_block(self, block):
+        start = block * self.block_size
+        data = self.fs.cat_file(self.path, start=start,
+                                end=min(start + self.block_size, self.size))
+        self.fetched_blocks += 1
+        if self._cache_dir is None:
+            self._blocks[block] = data
+        else:
+            # write atomically, so that concurrent sessions never read a partial block
+            tmp_path = f'{self._block_path(block)}.{os.getpid()}.{threading.get_ident()}'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._block_path(block))
+        return data
+
+    def _blocks_for(self, start, end):
+        return range(start // self.block_size, (max(end, start + 1) - 1) // self.block_size + 1)
+
+    def prefetch(self, ranges):
+        """
+        Fetch (concurrently) the blocks covering the byte ``ranges`` (a list of
+        ``(start, end)`` tuples) that are not cached yet.
+        """
+        blocks = sorted({block for start, end in ranges if start < self.size
+                         for block in self._blocks_for(start, min(end, self.size))})
+        missing = [block for block in blocks if self._cached_block(block) is None]
+        if len(missing) > 1 and self.max_workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as pool:
+                list(pool.map(self._fetch_block, missing))
+        else:
+            for block in missing:
+                self._fetch_block(block)
+
+    def read(self, size=-1):
+        start = self._pos
+        end = self.size if size is None or size < 0 else min(self.size, start + size)
+        if start >= end:
+            return b''
+        self.prefetch([(start, end)])
+        chunks = []
+        for block in self._blocks_for(start, end):
+            data = self._cached_block(block)
+            if data is None:
+                # evicted from the disk cache in the meantime
+                data = self._fetch_block(block)
+            block_start = block * self.block_size
+            chunks.append(data[max(start - block_start, 0):end - block_start])
+        self._pos = end
+        return b''.join(chunks)
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+
+def get_cloud_fits(possible_uri, ext=None, cache_dir=None, fs=None):
     """
     Retrieve and open a FITS file from an S3 URI using fsspec. Return the input
     unchanged if it is not an S3 URI.
@@ -620,6 +773,11 @@ def get_cloud_fits(possible_uri, ext=None):
     Anonymous access is assumed for S3. If the URI is not S3-based, the input
     is returned as-is.
 
+    The file is read in blocks (see `BlockCachedFile`) that are cached on disk, so
+    loading the same file again does not download it again. The data of the extensions
+    are only read when they are accessed, so reading a cutout with ``hdu.section``
+    only downloads the blocks that the cutout spans.
+
     Parameters
     ----------
     possible_uri : str
@@ -630,6 +788,11 @@ def get_cloud_fits(possible_uri, ext=None):
         Extension(s) to load from the FITS file. Can be an integer index (e.g., 0),
         a string name (e.g., "SCI"), or a list of such values. If `None`, all extensions
         are loaded.
+    cache_dir : str, `False`, or `None`
+        Directory of the block cache, defaults to a directory in the astropy cache.
+        If `False`, the file is not cached on disk.
+    fs : `fsspec.spec.AbstractFileSystem`, optional
+        Filesystem to read ``possible_uri`` from, instead of anonymous S3.
 
     Returns
     -------
@@ -640,25 +803,21 @@ def get_cloud_fits(possible_uri, ext=None):
 
     parsed_uri = urlparse(possible_uri)
 
-    # TODO: Add caching logic
-    if not parsed_uri.scheme.lower() == 's3':
-        raise ValueError("Not an S3 URI: {}".format(possible_uri))
-
-    downloaded_hdus = []
-    # this loads the requested extensions into local memory:
-    with fits.open(possible_uri, fsspec_kwargs={"anon": True}) as hdul:
-        if ext is None:
-            ext_list = list(range(len(hdul)))
-        elif not isinstance(ext, list):
-            ext_list = [ext]
-        else:
-            ext_list = ext
-        for extension in ext_list:
-            hdu_obj = hdul[extension]
-            downloaded_hdus.append(hdu_obj.copy())
+    if fs is None:
+        if not parsed_uri.scheme.lower() == 's3':
+            raise ValueError("Not an S3 URI: {}".format(possible_uri))
+        import fsspec
+        fs, path = fsspec.core.url_to_fs(possible_uri, anon=True)
+    else:
+        path = fs._strip_protocol(possible_uri)
+
+    fileobj = BlockCachedFile(fs, path, cache_dir=cache_dir)
+    hdul = fits.open(fileobj, lazy_load_hdus=False)
+    if ext is None:
+        return hdul
 
-        file_obj = fits.HDUList(downloaded_hdus)
-        return file_obj
+    ext_list = ext if isinstance(ext, list) else [ext]
+    return fits.HDUList([hdul[extension] for extension in ext_list])
 
 
 def cached_uri(uri):